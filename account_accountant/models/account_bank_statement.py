@@ -7,6 +7,9 @@ from dateutil.relativedelta import relativedelta
 from itertools import product
 from lxml import etree
 from markupsafe import Markup
+import logging
+
+_logger = logging.getLogger(__name__)
 
 class AccountBankStatement(models.Model):
     _inherit = 'account.bank.statement'
@@ -143,28 +146,58 @@ class AccountBankStatementLine(models.Model):
         # we either already have statement lines to reconcile or compute them
         st_lines, remaining_line_id = (self, None) if self else _compute_st_lines_to_reconcile(configured_company)
 
+        # The statement lines are processed by rounds: all pending lines are matched first, then the ones whose proposition
+        # doesn't conflict with a previous line are validated at once. The lines claiming a journal item already claimed by
+        # another line are postponed to the next round, and matched again once the first line has been reconciled.
         nb_auto_reconciled_lines = 0
-        for index, st_line in enumerate(st_lines):
-            # we want the cron to run only for limit_time seconds
-            if limit_time and fields.Datetime.now().timestamp() - start_time.timestamp() > limit_time:
-                remaining_line_id = st_line.id
-                st_lines = st_lines[:index]
-                break
-            wizard = self.env['bank.rec.widget'].with_context(default_st_line_id=st_line.id).new({})
-            wizard._action_trigger_matching_rules()
-            if wizard.state == 'valid' and wizard.matching_rules_allow_auto_reconcile:
-                try:
-                    wizard._action_validate()
-                    if st_line.is_reconciled:
-                        st_line.move_id.message_post(body=_(
-                            "This bank transaction has been automatically validated using the reconciliation model '%s'.",
-                            ', '.join(st_line.move_id.line_ids.reconcile_model_id.mapped('name')),
-                        ))
-                        nb_auto_reconciled_lines += 1
-                except UserError:
+        processed_st_lines = self.env['account.bank.statement.line']
+        pending_st_lines = st_lines
+        time_limit_reached = False
+        while pending_st_lines and not time_limit_reached:
+            wizards = []
+            for index, st_line in enumerate(pending_st_lines):
+                # we want the cron to run only for limit_time seconds
+                if limit_time and fields.Datetime.now().timestamp() - start_time.timestamp() > limit_time:
+                    remaining_line_id = st_line.id
+                    processed_st_lines -= pending_st_lines[index:]
+                    time_limit_reached = True
+                    break
+                wizard = self.env['bank.rec.widget'].with_context(default_st_line_id=st_line.id).new({})
+                wizard._action_trigger_matching_rules()
+                processed_st_lines |= st_line
+                if wizard.state == 'valid' and wizard.matching_rules_allow_auto_reconcile:
+                    wizards.append(wizard)
+
+            claimed_aml_ids = set()
+            wizards_to_validate = []
+            pending_st_lines = self.env['account.bank.statement.line']
+            for wizard in wizards:
+                aml_ids = set(wizard.line_ids.filtered(lambda x: x.flag == 'new_aml').source_aml_id.ids)
+                if aml_ids & claimed_aml_ids:
+                    pending_st_lines |= wizard.st_line_id
                     continue
+                claimed_aml_ids |= aml_ids
+                wizards_to_validate.append(wizard)
 
-        st_lines.write({'cron_last_check': start_time})
+            for st_line in self._auto_reconcile_validate_wizards(wizards_to_validate):
+                st_line.move_id.message_post(body=_(
+                    "This bank transaction has been automatically validated using the reconciliation model '%s'.",
+                    ', '.join(st_line.move_id.line_ids.reconcile_model_id.mapped('name')),
+                ))
+                nb_auto_reconciled_lines += 1
+
+        if time_limit_reached and pending_st_lines:
+            # The postponed lines have not been matched again: they will be processed by the next run.
+            processed_st_lines -= pending_st_lines
+            remaining_line_id = pending_st_lines[0].id
+
+        processed_st_lines.write({'cron_last_check': start_time})
+
+        duration = fields.Datetime.now().timestamp() - start_time.timestamp()
+        _logger.info(
+            "Auto-reconciliation of statement lines: %s lines processed, %s reconciled in %.2fs (%.2f lines/s)",
+            len(processed_st_lines), nb_auto_reconciled_lines, duration, len(processed_st_lines) / duration if duration else 0.0,
+        )
 
         # If the next statement line has never been auto reconciled yet, force the trigger.
         if remaining_line_id:
@@ -172,6 +205,34 @@ class AccountBankStatementLine(models.Model):
             if nb_auto_reconciled_lines or not remaining_st_line.cron_last_check:
                 self.env.ref('account_accountant.auto_reconcile_bank_statement_line')._trigger()
 
+    def _auto_reconcile_validate_wizards(self, wizards):
+        """ Validates the bank.rec.widget records proposed by the auto-reconciliation CRON.
+
+        :param wizards: A list of bank.rec.widget records, whose propositions don't share any journal item.
+        :return:        The statement lines that have been reconciled.
+        """
+        if not wizards:
+            return self.env['account.bank.statement.line']
+
+        st_lines = self.env['account.bank.statement.line'].union(*[wizard.st_line_id for wizard in wizards])
+        try:
+            with self.env.cr.savepoint():
+                self.env['bank.rec.widget'].union(*wizards)._action_validate()
+        except UserError:
+            # One of the lines can't be validated: validate them one by one, so that it doesn't block the others. The cache,
+            # holding the values of the wizards, has been cleared by the rollback: they need to be matched again.
+            for st_line in st_lines:
+                wizard = self.env['bank.rec.widget'].with_context(default_st_line_id=st_line.id).new({})
+                wizard._action_trigger_matching_rules()
+                if wizard.state != 'valid' or not wizard.matching_rules_allow_auto_reconcile:
+                    continue
+                try:
+                    with self.env.cr.savepoint():
+                        wizard._action_validate()
+                except UserError:
+                    continue
+        return st_lines.filtered('is_reconciled')
+
     def _retrieve_partner(self):
         self.ensure_one()
 
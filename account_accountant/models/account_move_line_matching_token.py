@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+# Extracts the tokens matched by the 'invoice_matching' reconciliation models from the label of the journal items, and from the
+# name and reference of their move. Numerical tokens are the groups of digits of these values, exact tokens the values themselves.
+MATCHING_TOKENS_QUERY = r'''
+    SELECT
+        account_move_line.id AS move_line_id,
+        token.value AS token,
+        token.token_type
+    FROM account_move_line
+    JOIN account_move ON account_move.id = account_move_line.move_id
+    JOIN account_account account ON account.id = account_move_line.account_id
+    CROSS JOIN LATERAL (
+        SELECT
+            UNNEST(
+                REGEXP_SPLIT_TO_ARRAY(
+                    SUBSTRING(
+                        REGEXP_REPLACE(field.value, '[^0-9\s]', '', 'g'),
+                        '\S(?:.*\S)*'
+                    ),
+                    '\s+'
+                )
+            ) AS value,
+            'numerical' AS token_type
+        FROM (VALUES (account_move_line.name), (account_move.name), (account_move.ref)) AS field(value)
+        WHERE field.value IS NOT NULL
+
+        UNION ALL
+
+        SELECT field.value, 'exact'
+        FROM (VALUES (account_move_line.name), (account_move.name), (account_move.ref)) AS field(value)
+        WHERE COALESCE(field.value, '') != ''
+    ) AS token
+    WHERE account_move_line.parent_state = 'posted'
+    AND NOT account_move_line.reconciled
+    AND account.reconcile
+'''
+
+
+class AccountMoveLineMatchingToken(models.Model):
+    """ Tokens of the open journal items, used by the 'invoice_matching' reconciliation models to find the journal items
+    whose label, move name or move reference match the textual information of a statement line.
+
+    Only the posted and not fully reconciled journal items of reconcilable accounts are indexed. Their tokens are added when
+    their move is posted, and removed when they are fully reconciled or their move is reset to draft.
+    """
+    _name = 'account.move.line.matching.token'
+    _description = "Journal Item Matching Token"
+    _log_access = False
+
+    move_line_id = fields.Many2one(comodel_name='account.move.line', required=True, readonly=True, index=True, ondelete='cascade')
+    token = fields.Char(required=True, readonly=True, index=True)
+    token_type = fields.Selection(
+        selection=[('numerical', "Numerical"), ('exact', "Exact")],
+        required=True,
+        readonly=True,
+    )
+
+    def init(self):
+        self.env.cr.execute("SELECT 1 FROM account_move_line_matching_token LIMIT 1")
+        if not self.env.cr.fetchone():
+            self._rebuild()
+
+    @api.model
+    def _flush_matching_fields(self):
+        self.env['account.move'].flush_model(['name', 'ref', 'state'])
+        self.env['account.move.line'].flush_model(['name', 'move_id', 'account_id', 'parent_state', 'reconciled'])
+        self.env['account.account'].flush_model(['reconcile'])
+
+    @api.model
+    def _rebuild(self):
+        """ Recomputes the tokens of all the open journal items. """
+        self._flush_matching_fields()
+        self.env.cr.execute("TRUNCATE account_move_line_matching_token")
+        self.env.cr.execute(f'''
+            INSERT INTO account_move_line_matching_token (move_line_id, token, token_type)
+            {MATCHING_TOKENS_QUERY}
+        ''')
+        _logger.info("Indexed %s matching tokens for the reconciliation models", self.env.cr.rowcount)
+
+    @api.model
+    def _update_move_lines(self, move_lines):
+        """ Recomputes the tokens of the provided journal items, after their values or their reconciliation changed. """
+        if not move_lines:
+            return
+
+        self._flush_matching_fields()
+        self.env.cr.execute(
+            "DELETE FROM account_move_line_matching_token WHERE move_line_id = ANY(%s)",
+            [move_lines.ids],
+        )
+        self.env.cr.execute(
+            f'''
+                INSERT INTO account_move_line_matching_token (move_line_id, token, token_type)
+                {MATCHING_TOKENS_QUERY}
+                AND account_move_line.id = ANY(%s)
+            ''',
+            [move_lines.ids],
+        )
+
+
+class AccountMove(models.Model):
+    _inherit = 'account.move'
+
+    def _post(self, soft=True):
+        posted = super()._post(soft)
+        self.env['account.move.line.matching.token']._update_move_lines(posted.line_ids)
+        return posted
+
+    def button_draft(self):
+        res = super().button_draft()
+        self.env['account.move.line.matching.token']._update_move_lines(self.line_ids)
+        return res
+
+    def write(self, vals):
+        res = super().write(vals)
+        # The payment reference is the label of the payment terms lines.
+        if {'name', 'ref', 'payment_reference'} & vals.keys():
+            self.env['account.move.line.matching.token']._update_move_lines(self.filtered(lambda move: move.state == 'posted').line_ids)
+        return res
+
+
+class AccountMoveLine(models.Model):
+    _inherit = 'account.move.line'
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {'name', 'account_id'} & vals.keys():
+            self.env['account.move.line.matching.token']._update_move_lines(self.filtered(lambda line: line.parent_state == 'posted'))
+        return res
+
+
+class AccountPartialReconcile(models.Model):
+    _inherit = 'account.partial.reconcile'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        partials = super().create(vals_list)
+        self.env['account.move.line.matching.token']._update_move_lines(partials.debit_move_id | partials.credit_move_id)
+        return partials
+
+    def unlink(self):
+        move_lines = self.debit_move_id | self.credit_move_id
+        res = super().unlink()
+        self.env['account.move.line.matching.token']._update_move_lines(move_lines.exists())
+        return res
+
+
+class AccountAccount(models.Model):
+    _inherit = 'account.account'
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'reconcile' in vals:
+            move_lines = self.env['account.move.line'].search([
+                ('account_id', 'in', self.ids),
+                ('parent_state', '=', 'posted'),
+                ('reconciled', '=', False),
+            ])
+            self.env['account.move.line.matching.token']._update_move_lines(move_lines)
+        return res
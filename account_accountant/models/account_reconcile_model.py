@@ -325,12 +325,79 @@ class AccountReconcileModel(models.Model):
             order_by = 'sub.date_maturity ASC, sub.date ASC, sub.id ASC'
 
         aml_domain = self._get_invoice_matching_amls_domain(st_line, partner)
+        numerical_tokens, exact_tokens, _text_tokens = self._get_invoice_matching_st_line_tokens(st_line)
+        if numerical_tokens or exact_tokens:
+            if self.env['ir.config_parameter'].sudo().get_param('account_accountant.disable_matching_token_index'):
+                candidate_ids = self._get_invoice_matching_amls_ids_from_regex(aml_domain, numerical_tokens, exact_tokens, order_by)
+            else:
+                candidate_ids = self._get_invoice_matching_amls_ids_from_token_index(aml_domain, numerical_tokens, exact_tokens, order_by)
+            if candidate_ids:
+                return {
+                    'allow_auto_reconcile': True,
+                    'amls': self.env['account.move.line'].browse(candidate_ids),
+                }
+
+        # Search without any matching based on textual information.
+        if partner:
+
+            if self.matching_order == 'new_first':
+                order = 'date_maturity DESC, date DESC, id DESC'
+            else:
+                order = 'date_maturity ASC, date ASC, id ASC'
+
+            amls = self.env['account.move.line'].search(aml_domain, order=order)
+            if amls:
+                return {
+                    'allow_auto_reconcile': False,
+                    'amls': amls,
+                }
+
+    def _get_invoice_matching_amls_ids_from_token_index(self, aml_domain, numerical_tokens, exact_tokens, order_by):
+        """ Returns the ids of the journal items matching aml_domain whose label, move name or move reference share some
+        tokens with a statement line, the ones sharing the most tokens first. The tokens of the journal items are read from
+        account.move.line.matching.token.
+
+        :param aml_domain:          The domain the candidates must match.
+        :param numerical_tokens:    The numerical tokens of the statement line.
+        :param exact_tokens:        The exact tokens of the statement line.
+        :param order_by:            The order of the candidates sharing the same number of tokens, using the 'sub' alias.
+        :return:                    A list of account.move.line ids.
+        """
+        query = self.env['account.move.line']._where_calc(aml_domain)
+        tables, where_clause, where_params = query.get_sql()
+        token_types = tuple(token_type for token_type, tokens in (('numerical', numerical_tokens), ('exact', exact_tokens)) if tokens)
+
+        self._cr.execute(
+            f'''
+                SELECT sub.id
+                FROM (
+                    SELECT
+                        account_move_line.id,
+                        account_move_line.date,
+                        account_move_line.date_maturity,
+                        COUNT(*) AS nb_match
+                    FROM {tables}
+                    JOIN account_move_line_matching_token matching_token ON matching_token.move_line_id = account_move_line.id
+                    WHERE {where_clause}
+                    AND matching_token.token_type IN %s
+                    AND matching_token.token IN %s
+                    GROUP BY account_move_line.id
+                ) AS sub
+                ORDER BY sub.nb_match DESC, {order_by}
+            ''',
+            where_params + [token_types, tuple(numerical_tokens + exact_tokens)],
+        )
+        return [r[0] for r in self._cr.fetchall()]
+
+    def _get_invoice_matching_amls_ids_from_regex(self, aml_domain, numerical_tokens, exact_tokens, order_by):
+        """ Same as _get_invoice_matching_amls_ids_from_token_index, but extracting the tokens of every journal item matching
+        aml_domain with regular expressions. Used when the account_accountant.disable_matching_token_index system parameter is set.
+        """
         query = self.env['account.move.line']._where_calc(aml_domain)
         tables, where_clause, where_params = query.get_sql()
 
         sub_queries = []
         all_params = []
-        numerical_tokens, exact_tokens, _text_tokens = self._get_invoice_matching_st_line_tokens(st_line)
         if numerical_tokens:
             for table_alias, field in (
                 ('account_move_line', 'name'),
@@ -389,27 +456,8 @@ class AccountReconcileModel(models.Model):
                 ''',
                 all_params + [tuple(numerical_tokens + exact_tokens)],
             )
-            candidate_ids = [r[0] for r in self._cr.fetchall()]
-            if candidate_ids:
-                return {
-                    'allow_auto_reconcile': True,
-                    'amls': self.env['account.move.line'].browse(candidate_ids),
-                }
-
-        # Search without any matching based on textual information.
-        if partner:
-
-            if self.matching_order == 'new_first':
-                order = 'date_maturity DESC, date DESC, id DESC'
-            else:
-                order = 'date_maturity ASC, date ASC, id ASC'
-
-            amls = self.env['account.move.line'].search(aml_domain, order=order)
-            if amls:
-                return {
-                    'allow_auto_reconcile': False,
-                    'amls': amls,
-                }
+            return [r[0] for r in self._cr.fetchall()]
+        return []
 
     def _get_invoice_matching_rules_map(self):
         """ Get a mapping <priority_order, rule> that could be overridden in others modules.
@@ -1206,65 +1206,69 @@ class BankRecWidget(models.Model):
         self._js_action_mount_line_in_edit(self.line_ids.filtered(lambda x: x.flag == 'liquidity').index)
 
     def _action_validate(self):
-        self.ensure_one()
-        partners = (self.line_ids.filtered(lambda x: x.flag != 'liquidity')).partner_id
-        partner_to_set = partners if len(partners) == 1 else self.env['res.partner']
+        """ Validates the wizards in self. When several wizards are provided (see the auto-reconciliation CRON), the
+        exchange difference moves and the reconciliation of all their statement lines are created at once.
+        """
+        AccountMoveLine = self.env['account.move.line']
+        validated = []
+        exchange_diff_vals_list = []
+        lines_with_exch_diff = AccountMoveLine
 
-        # Prepare the lines to be created.
-        to_reconcile = []
-        line_ids_create_command_list = []
-        aml_to_exchange_diff_vals = {}
+        for wizard in self:
+            partners = (wizard.line_ids.filtered(lambda x: x.flag != 'liquidity')).partner_id
+            partner_to_set = partners if len(partners) == 1 else self.env['res.partner']
 
-        for i, line in enumerate(self.line_ids):
-            if line.flag == 'exchange_diff':
-                continue
+            # Prepare the lines to be created.
+            to_reconcile = []
+            line_ids_create_command_list = []
+            aml_to_exchange_diff_vals = {}
 
-            amount_currency = line.amount_currency
-            balance = line.balance
-            if line.flag == 'new_aml':
-                to_reconcile.append((i, line.source_aml_id.id))
-                exchange_diff = self.line_ids \
-                    .filtered(lambda x: x.flag == 'exchange_diff' and x.source_aml_id == line.source_aml_id)
-                if exchange_diff:
-                    aml_to_exchange_diff_vals[i] = {
-                        'amount_residual': exchange_diff.balance,
-                        'amount_residual_currency': exchange_diff.amount_currency
-                    }
-                    # Squash amounts of exchange diff into corresponding new_aml
-                    amount_currency += exchange_diff.amount_currency
-                    balance += exchange_diff.balance
-            line_ids_create_command_list.append(Command.create(line._get_aml_values(
-                sequence=i,
-                partner_id=partner_to_set.id if line.flag in ('liquidity', 'auto_balance') else line.partner_id.id,
-                amount_currency=amount_currency,
-                balance=balance,
-            )))
+            for i, line in enumerate(wizard.line_ids):
+                if line.flag == 'exchange_diff':
+                    continue
 
-        st_line = self.st_line_id
-        move = st_line.move_id
-
-        # Update the move.
-        move_ctx = move.with_context(
-            skip_invoice_sync=True,
-            skip_invoice_line_sync=True,
-            skip_account_move_synchronization=True,
-            force_delete=True,
-        )
-        move_ctx.write({'partner_id': partner_to_set.id, 'line_ids': [Command.clear()] + line_ids_create_command_list})
-        if move_ctx.state == 'draft':
-            move_ctx.action_post()
+                amount_currency = line.amount_currency
+                balance = line.balance
+                if line.flag == 'new_aml':
+                    to_reconcile.append((i, line.source_aml_id.id))
+                    exchange_diff = wizard.line_ids \
+                        .filtered(lambda x: x.flag == 'exchange_diff' and x.source_aml_id == line.source_aml_id)
+                    if exchange_diff:
+                        aml_to_exchange_diff_vals[i] = {
+                            'amount_residual': exchange_diff.balance,
+                            'amount_residual_currency': exchange_diff.amount_currency
+                        }
+                        # Squash amounts of exchange diff into corresponding new_aml
+                        amount_currency += exchange_diff.amount_currency
+                        balance += exchange_diff.balance
+                line_ids_create_command_list.append(Command.create(line._get_aml_values(
+                    sequence=i,
+                    partner_id=partner_to_set.id if line.flag in ('liquidity', 'auto_balance') else line.partner_id.id,
+                    amount_currency=amount_currency,
+                    balance=balance,
+                )))
+
+            st_line = wizard.st_line_id
+            move = st_line.move_id
+
+            # Update the move.
+            move_ctx = move.with_context(
+                skip_invoice_sync=True,
+                skip_invoice_line_sync=True,
+                skip_account_move_synchronization=True,
+                force_delete=True,
+            )
+            move_ctx.write({'partner_id': partner_to_set.id, 'line_ids': [Command.clear()] + line_ids_create_command_list})
+            if move_ctx.state == 'draft':
+                move_ctx.action_post()
 
-        AccountMoveLine = self.env['account.move.line']
-        lines = [
-            (move_ctx.line_ids.filtered(lambda x: x.sequence == index),
-             self.env['account.move.line'].browse(counterpart_aml_id))
-            for index, counterpart_aml_id in to_reconcile
-        ]
-        # Handle exchange diffs
-        exchange_diff_moves = None
-        lines_with_exch_diff = AccountMoveLine
-        if aml_to_exchange_diff_vals:
-            exchange_diff_vals_list = []
+            lines = [
+                (move_ctx.line_ids.filtered(lambda x: x.sequence == index),
+                 AccountMoveLine.browse(counterpart_aml_id))
+                for index, counterpart_aml_id in to_reconcile
+            ]
+
+            # Collect the exchange diffs.
             for line, counterpart in lines:
                 exchange_diff_amounts = aml_to_exchange_diff_vals.get(line.sequence)
                 if exchange_diff_amounts:
@@ -1274,27 +1278,38 @@ class BankRecWidget(models.Model):
                         exchange_date=max(line.date, counterpart.date)
                     ))
                     lines_with_exch_diff += line
+
+            validated.append((st_line, move, partner_to_set, lines))
+
+        # Handle exchange diffs
+        exchange_diff_moves = None
+        if exchange_diff_vals_list:
             exchange_diff_moves = AccountMoveLine._create_exchange_difference_moves(exchange_diff_vals_list)
 
         # Perform the reconciliation.
-        self.env['account.move.line'].with_context(no_exchange_difference=True)._reconcile_plan(
-            [line + counterpart for line, counterpart in lines])
+        AccountMoveLine.with_context(no_exchange_difference=True)._reconcile_plan([
+            line + counterpart
+            for _st_line, _move, _partner, lines in validated
+            for line, counterpart in lines
+        ])
 
         # Assign exchange move to partials.
         for index, line in enumerate(lines_with_exch_diff):
             (line.matched_debit_ids + line.matched_credit_ids).exchange_move_id = exchange_diff_moves[index]
 
-        # Fill missing partner.
-        st_line_ctx = st_line.with_context(skip_account_move_synchronization=True)
-        st_line_ctx.partner_id = partner_to_set
+        for st_line, move, partner_to_set, _lines in validated:
+            # Fill missing partner.
+            st_line_ctx = st_line.with_context(skip_account_move_synchronization=True)
+            st_line_ctx.partner_id = partner_to_set
 
-        # Create missing partner bank if necessary.
-        if st_line.account_number and st_line.partner_id and not st_line.partner_bank_id:
-            st_line_ctx.partner_bank_id = st_line._find_or_create_bank_account()
+            # Create missing partner bank if necessary.
+            if st_line.account_number and st_line.partner_id and not st_line.partner_bank_id:
+                st_line_ctx.partner_bank_id = st_line._find_or_create_bank_account()
 
         # Refresh analytic lines.
-        move.line_ids.analytic_line_ids.unlink()
-        move.line_ids._create_analytic_lines()
+        moves = self.env['account.move'].union(*[move for _st_line, move, _partner, _lines in validated])
+        moves.line_ids.analytic_line_ids.unlink()
+        moves.line_ids._create_analytic_lines()
 
     @contextmanager
     def _action_validate_method(self):
@@ -2317,6 +2317,32 @@ class TestBankRecWidget(TestBankRecWidgetCommon):
         self.assertRecordValues(st_line1, [{'is_reconciled': True, 'cron_last_check': fields.Datetime.from_string('2017-01-01 00:00:00')}])
         self.assertRecordValues(st_line2, [{'is_reconciled': False, 'cron_last_check': False}])
 
+    def test_auto_reconcile_cron_conflicting_statement_lines(self):
+        self.env['account.reconcile.model'].search([('company_id', '=', self.company_data['company'].id)]).unlink()
+
+        invoice_line = self._create_invoice_line(
+            'out_invoice',
+            invoice_date='2017-01-01',
+            invoice_line_ids=[{'price_unit': 1234.0}],
+        )
+        st_line1 = self._create_st_line(1234.0, partner_id=self.partner_a.id, date='2017-01-01', payment_ref=invoice_line.move_id.name)
+        st_line2 = self._create_st_line(1234.0, partner_id=self.partner_a.id, date='2017-01-01', payment_ref=invoice_line.move_id.name)
+        self.env['account.reconcile.model'].create({
+            'name': "test_auto_reconcile_cron_conflicting_statement_lines",
+            'rule_type': 'invoice_matching',
+            'auto_reconcile': True,
+        })
+
+        # Both statement lines claim the same invoice: only the first one is reconciled with it. The second one is matched
+        # again once the invoice is paid and no longer finds any candidate.
+        with freeze_time('2017-01-01'):
+            self.env['account.bank.statement.line']._cron_try_auto_reconcile_statement_lines()
+        self.assertRecordValues(invoice_line, [{'reconciled': True}])
+        self.assertRecordValues(st_line1 + st_line2, [
+            {'is_reconciled': True, 'cron_last_check': fields.Datetime.from_string('2017-01-01 00:00:00')},
+            {'is_reconciled': False, 'cron_last_check': fields.Datetime.from_string('2017-01-01 00:00:00')},
+        ])
+
     @freeze_time('2019-01-01')
     def test_button_apply_reco_model(self):
         st_line = self._create_st_line(-1000.0, partner_id=self.partner_a.id)
@@ -978,6 +978,35 @@ class TestReconciliationMatchingRules(AccountTestInvoicingCommon):
             },
         })
 
+    @freeze_time('2020-01-01')
+    def test_invoice_matching_token_index(self):
+        ''' The candidates read from the token index must be the ones found by extracting the tokens with regular expressions. '''
+        st_line = self._create_st_line(payment_ref="1111 2222", ref="BE-3333")
+
+        inv1 = self._create_invoice_line(100, self.partner_a, 'out_invoice', pay_reference="bernard")
+        inv2 = self._create_invoice_line(200, self.partner_a, 'out_invoice', pay_reference="2222 1111")
+        inv3 = self._create_invoice_line(300, self.partner_a, 'out_invoice', pay_reference="turlututu", ref="BE-3333")
+        inv4 = self._create_invoice_line(400, self.partner_a, 'out_invoice', pay_reference="1111")
+
+        # Tokens are updated when the payment reference changes after posting.
+        inv1.move_id.payment_reference = "bernard 1111"
+
+        # Tokens are removed when the invoice is fully paid.
+        self.env['account.payment.register']\
+            .with_context(active_model='account.move', active_ids=inv4.move_id.ids)\
+            .create({})\
+            ._create_payments()
+        self.assertFalse(self.env['account.move.line.matching.token'].search([('move_line_id', '=', inv4.id)]))
+
+        rule = self._create_reconcile_model(match_text_location_reference=True)
+        aml_domain = rule._get_invoice_matching_amls_domain(st_line, self.partner_a)
+        numerical_tokens, exact_tokens, _text_tokens = rule._get_invoice_matching_st_line_tokens(st_line)
+        order_by = 'sub.date_maturity ASC, sub.date ASC, sub.id ASC'
+
+        candidate_ids = rule._get_invoice_matching_amls_ids_from_token_index(aml_domain, numerical_tokens, exact_tokens, order_by)
+        self.assertEqual(candidate_ids, (inv2 + inv3 + inv1).ids)
+        self.assertEqual(candidate_ids, rule._get_invoice_matching_amls_ids_from_regex(aml_domain, numerical_tokens, exact_tokens, order_by))
+
     def test_payment_similar_communications(self):
         def create_payment_line(amount, memo, partner):
             payment = self.env['account.payment'].create({
@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
+
 from odoo import models, tools, _
 from odoo.addons.base.models.res_bank import sanitize_account_number
 from odoo.exceptions import UserError, RedirectWarning
@@ -214,6 +216,20 @@ class AccountJournal(models.Model):
         return journal
 
     def _complete_bank_statement_vals(self, stmts_vals, journal, account_number, attachment):
+        sanitized_account_number = sanitize_account_number(account_number)
+        # Find the partners and their bank accounts for all the transactions at once.
+        # The account numbers are compared once sanitized, as done when searching on acc_number.
+        identifying_strings = {
+            sanitize_account_number(line_vals['account_number'])
+            for st_vals in stmts_vals
+            for line_vals in st_vals['transactions']
+            if not line_vals.get('partner_bank_id') and line_vals.get('account_number')
+        }
+        partner_banks_per_acc_number = defaultdict(lambda: self.env['res.partner.bank'])
+        if identifying_strings:
+            for partner_bank in self.env['res.partner.bank'].search([('sanitized_acc_number', 'in', list(identifying_strings))]):
+                partner_banks_per_acc_number[partner_bank.sanitized_acc_number] |= partner_bank
+
         for st_vals in stmts_vals:
             if not st_vals.get('reference'):
                 st_vals['reference'] = attachment.name
@@ -221,7 +237,6 @@ class AccountJournal(models.Model):
                 line_vals['journal_id'] = journal.id
                 unique_import_id = line_vals.get('unique_import_id')
                 if unique_import_id:
-                    sanitized_account_number = sanitize_account_number(account_number)
                     line_vals['unique_import_id'] = (sanitized_account_number and sanitized_account_number + '-' or '') + str(journal.id) + '-' + unique_import_id
 
                 if not line_vals.get('partner_bank_id'):
@@ -229,16 +244,11 @@ class AccountJournal(models.Model):
                     # reconciliation process will be linked to the bank when the statement is closed.
                     identifying_string = line_vals.get('account_number')
                     if identifying_string:
+                        partner_bank = partner_banks_per_acc_number[sanitize_account_number(identifying_string)]
                         if line_vals.get('partner_id'):
-                            partner_bank = self.env['res.partner.bank'].search([
-                                ('acc_number', '=', identifying_string),
-                                ('partner_id', '=', line_vals['partner_id'])
-                            ])
+                            partner_bank = partner_bank.filtered(lambda bank: bank.partner_id.id == line_vals['partner_id'])
                         else:
-                            partner_bank = self.env['res.partner.bank'].search([
-                                ('acc_number', '=', identifying_string),
-                                ('company_id', 'in', (False, journal.company_id.id))
-                            ])
+                            partner_bank = partner_bank.filtered(lambda bank: bank.company_id.id in (False, journal.company_id.id))
                         # If multiple partners share the same account number, do not try to guess and just avoid setting it
                         if partner_bank and len(partner_bank) == 1:
                             line_vals['partner_bank_id'] = partner_bank.id
@@ -250,18 +260,34 @@ class AccountJournal(models.Model):
         BankStatement = self.env['account.bank.statement']
         BankStatementLine = self.env['account.bank.statement.line']
 
+        # Fetch the already imported transactions of the whole file at once
+        unique_import_ids = [
+            line_vals['unique_import_id']
+            for st_vals in stmts_vals
+            for line_vals in st_vals['transactions']
+            if line_vals.get('unique_import_id')
+        ]
+        imported_unique_ids = set()
+        if unique_import_ids:
+            imported_unique_ids = set(BankStatementLine.sudo().search_fetch(
+                [('unique_import_id', 'in', unique_import_ids)], ['unique_import_id'],
+            ).mapped('unique_import_id'))
+
         # Filter out already imported transactions and create statements
         statement_ids = []
         statement_line_ids = []
         ignored_statement_lines_import_ids = []
+        new_stmts_vals = []
         for st_vals in stmts_vals:
             filtered_st_lines = []
             for line_vals in st_vals['transactions']:
                 if (line_vals['amount'] != 0
                    and ('unique_import_id' not in line_vals
                    or not line_vals['unique_import_id']
-                   or not bool(BankStatementLine.sudo().search([('unique_import_id', '=', line_vals['unique_import_id'])], limit=1)))):
+                   or line_vals['unique_import_id'] not in imported_unique_ids)):
                     filtered_st_lines.append(line_vals)
+                    if line_vals.get('unique_import_id'):
+                        imported_unique_ids.add(line_vals['unique_import_id'])
                 else:
                     ignored_statement_lines_import_ids.append(line_vals['unique_import_id'])
                     if st_vals.get('balance_start') is not None:
@@ -270,17 +296,20 @@ class AccountJournal(models.Model):
             if len(filtered_st_lines) > 0:
                 # Remove values that won't be used to create records
                 st_vals.pop('transactions', None)
-                # Create the statement
                 st_vals['line_ids'] = [[0, False, line] for line in filtered_st_lines]
-                statement = BankStatement.with_context(default_journal_id=self.id).create(st_vals)
-                if not statement.name:
-                    statement.name = st_vals['reference']
-                statement_ids.append(statement.id)
-                statement_line_ids.extend(statement.line_ids.ids)
-
-                # Create the report.
-                if statement.is_complete:
-                    statement.action_generate_attachment()
+                new_stmts_vals.append(st_vals)
+
+        # Create the statements, and their lines, in a single batch
+        statements = BankStatement.with_context(default_journal_id=self.id).create(new_stmts_vals)
+        for statement, st_vals in zip(statements, new_stmts_vals):
+            if not statement.name:
+                statement.name = st_vals['reference']
+            statement_ids.append(statement.id)
+            statement_line_ids.extend(statement.line_ids.ids)
+
+            # Create the report.
+            if statement.is_complete:
+                statement.action_generate_attachment()
 
         if len(statement_line_ids) == 0 and raise_no_imported_file:
             raise UserError(_('You already have imported that file.'))
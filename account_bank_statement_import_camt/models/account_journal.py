@@ -23,23 +23,33 @@ class AccountJournal(models.Model):
         return rslt
 
     def _check_camt(self, attachment):
+        """ Returns whether the attachment is a CAMT.053 file, only parsing its root element. """
         try:
-            root = etree.parse(io.BytesIO(attachment.raw)).getroot()
+            for dummy, root in etree.iterparse(io.BytesIO(attachment.raw), events=('start',)):
+                return root.tag.find('camt.053') != -1
         except Exception:
-            return None
-        if root.tag.find('camt.053') != -1:
-            return root
-        return None
+            return False
+        return False
 
     def _parse_bank_statement_file(self, attachment):
-        root = self._check_camt(attachment)
-        if root is not None:
-            return self._parse_bank_statement_file_camt(root)
+        if self._check_camt(attachment):
+            try:
+                return self._parse_bank_statement_file_camt(io.BytesIO(attachment.raw))
+            except etree.XMLSyntaxError:
+                # The file is only known to be malformed once it has been read until the error
+                _logger.warning("The CAMT file %s is malformed.", attachment.name, exc_info=True)
         return super()._parse_bank_statement_file(attachment)
 
-    def _parse_bank_statement_file_camt(self, root):
-        ns = {k or 'ns': v for k, v in root.nsmap.items()}
+    def _iter_camt_nodes(self, camt_file):
+        """ Parses the CAMT file incrementally and yields its entries (Ntry), then their statement (Stmt),
+        as soon as they are complete. The nodes are removed from the tree once processed, so that the
+        memory used by the parsing does not depend on the size of the file. """
+        for dummy, node in etree.iterparse(camt_file, events=('end',), tag=('{*}Ntry', '{*}Stmt')):
+            yield node
+            node.clear()
+            node.getparent().remove(node)
 
+    def _parse_bank_statement_file_camt(self, camt_file):
         curr_cache = {c['name']: c['id'] for c in self.env['res.currency'].search_read([], ['id', 'name'])}
         statements_per_iban = {}
         currency_per_iban = {}
@@ -47,103 +57,115 @@ class AccountJournal(models.Model):
         currency = account_no = False
         has_multi_currency = self.env.user.user_has_groups('base.group_multi_currency')
         journal_currency = self.currency_id or self.company_id.currency_id
-        for statement in root[0].findall('ns:Stmt', ns):
-            statement_vals = {}
-            statement_vals['name'] = (statement.xpath('ns:LglSeqNb/text()', namespaces=ns) or statement.xpath('ns:Id/text()', namespaces=ns))[0]
-            statement_date = CAMT._get_statement_date(statement, namespaces=ns)
-
-            # Transaction Entries 0..n
-            transactions = []
-            sequence = 0
-
-            # Account Number    1..1
-            # if not IBAN value then... <Othr><Id> would have.
-            account_no = sanitize_account_number(statement.xpath('ns:Acct/ns:Id/ns:IBAN/text() | ns:Acct/ns:Id/ns:Othr/ns:Id/text()',
-                namespaces=ns)[0])
-
-            # Currency 0..1
-            currency = statement.xpath('ns:Acct/ns:Ccy/text() | ns:Bal/ns:Amt/@Ccy', namespaces=ns)[0]
+        statement = None
+        for node in self._iter_camt_nodes(camt_file):
+            ns = {k or 'ns': v for k, v in node.nsmap.items()}
+            is_statement = etree.QName(node).localname == 'Stmt'
+            if statement is None:
+                # First node of a statement: its header (identification, account and balances) precedes its entries.
+                statement = node if is_statement else node.getparent()
+                statement_vals = {}
+                statement_vals['name'] = (statement.xpath('ns:LglSeqNb/text()', namespaces=ns) or statement.xpath('ns:Id/text()', namespaces=ns))[0]
+                statement_date = CAMT._get_statement_date(statement, namespaces=ns)
+
+                # Transaction Entries 0..n
+                transactions = []
+                sequence = 0
+
+                # Account Number    1..1
+                # if not IBAN value then... <Othr><Id> would have.
+                account_no = sanitize_account_number(statement.xpath('ns:Acct/ns:Id/ns:IBAN/text() | ns:Acct/ns:Id/ns:Othr/ns:Id/text()',
+                    namespaces=ns)[0])
+
+                # Currency 0..1
+                currency = statement.xpath('ns:Acct/ns:Ccy/text() | ns:Bal/ns:Amt/@Ccy', namespaces=ns)[0]
+                skip_statement = currency and journal_currency and currency != journal_currency.name
+
+            if is_statement:
+                statement = None
+                if skip_statement:
+                    continue
+                statement_vals['transactions'] = transactions
+                statement_vals['balance_start'] = CAMT._get_signed_balance(node=node, namespaces=ns, getters=CAMT._start_balance_getters)
+                statement_vals['balance_end_real'] = CAMT._get_signed_balance(node=node, namespaces=ns, getters=CAMT._end_balance_getters)
+
+                # Save statements and currency
+                statements_per_iban.setdefault(account_no, []).append(statement_vals)
+                currency_per_iban[account_no] = currency
+                continue
 
-            if currency and journal_currency and currency != journal_currency.name:
+            if skip_statement:
                 continue
 
-            for entry in statement.findall('ns:Ntry', ns):
-                # Date 0..1
-                date = CAMT._get_transaction_date(entry, namespaces=ns) or statement_date
-
-                transaction_details = entry.xpath('.//ns:TxDtls', namespaces=ns)
-                for entry_details in transaction_details or [entry]:
-                    sequence += 1
-                    counter_party = CAMT._get_counter_party(entry_details, entry, namespaces=ns)
-                    partner_name = CAMT._get_partner_name(entry_details, placeholder=counter_party, namespaces=ns)
-                    entry_vals = {
-                        'sequence': sequence,
-                        'date': date,
-                        'amount': CAMT._get_signed_amount(entry_details, entry, namespaces=ns, journal_currency=journal_currency),
-                        'payment_ref': CAMT._get_transaction_name(entry_details, namespaces=ns),
-                        'partner_name': partner_name,
-                        'account_number': CAMT._get_account_number(entry_details, placeholder=counter_party, namespaces=ns),
-                        'ref': CAMT._get_ref(entry_details, counter_party=counter_party, prefix='', namespaces=ns),
-                    }
-
-                    entry_vals['unique_import_id'] = CAMT._get_unique_import_id(
-                        entry=entry_details,
-                        sequence=sequence,
-                        name=statement_vals['name'],
-                        date=entry_vals['date'],
-                        unique_import_set=unique_import_set,
-                        namespaces=ns)
-
-                    CAMT._set_amount_in_currency(
-                        node=entry_details,
-                        getters=CAMT._currency_amount_getters,
-                        entry_vals=entry_vals,
-                        currency=currency,
-                        curr_cache=curr_cache,
-                        has_multi_currency=has_multi_currency,
-                        namespaces=ns)
-
-                    BkTxCd = entry.xpath('ns:BkTxCd', namespaces=ns)[0]
-                    entry_vals.update(CAMT._get_transaction_type(BkTxCd, namespaces=ns))
-                    notes = []
-                    entry_info = CAMT._get_additional_entry_info(entry, namespaces=ns)
-                    if entry_info:
-                        notes.append(_('Entry Info: %s', entry_info))
-                    text_info = CAMT._get_additional_text_info(entry_details, namespaces=ns)
-                    if text_info:
-                        notes.append(_('Additional Info: %s', text_info))
-                    if partner_name:
-                        notes.append(_('Counter Party: %(partner)s', partner=partner_name))
-                    partner_address = CAMT._get_partner_address(entry_details, ns, counter_party)
-                    if partner_address:
-                        notes.append(_('Address:\n') + partner_address)
-                    transaction_id = CAMT._get_transaction_id(entry_details, namespaces=ns)
-                    if transaction_id:
-                        notes.append(_('Transaction ID: %s', transaction_id))
-                    instruction_id = CAMT._get_instruction_id(entry_details, namespaces=ns)
-                    if instruction_id:
-                        notes.append(_('Instruction ID: %s', instruction_id))
-                    end_to_end_id = CAMT._get_end_to_end_id(entry_details, namespaces=ns)
-                    if end_to_end_id:
-                        notes.append(_('End to end ID: %s', end_to_end_id))
-                    mandate_id = CAMT._get_mandate_id(entry_details, namespaces=ns)
-                    if mandate_id:
-                        notes.append(_('Mandate ID: %s', mandate_id))
-                    check_number = CAMT._get_check_number(entry_details, namespaces=ns)
-                    if check_number:
-                        notes.append(_('Check Number: %s', check_number))
-                    entry_vals['narration'] = "\n".join(notes)
-
-                    unique_import_set.add(entry_vals['unique_import_id'])
-                    transactions.append(entry_vals)
-
-            statement_vals['transactions'] = transactions
-            statement_vals['balance_start'] = CAMT._get_signed_balance(node=statement, namespaces=ns, getters=CAMT._start_balance_getters)
-            statement_vals['balance_end_real'] = CAMT._get_signed_balance(node=statement, namespaces=ns, getters=CAMT._end_balance_getters)
-
-            # Save statements and currency
-            statements_per_iban.setdefault(account_no, []).append(statement_vals)
-            currency_per_iban[account_no] = currency
+            entry = node
+            # Date 0..1
+            date = CAMT._get_transaction_date(entry, namespaces=ns) or statement_date
+
+            transaction_details = entry.xpath('.//ns:TxDtls', namespaces=ns)
+            for entry_details in transaction_details or [entry]:
+                sequence += 1
+                counter_party = CAMT._get_counter_party(entry_details, entry, namespaces=ns)
+                partner_name = CAMT._get_partner_name(entry_details, placeholder=counter_party, namespaces=ns)
+                entry_vals = {
+                    'sequence': sequence,
+                    'date': date,
+                    'amount': CAMT._get_signed_amount(entry_details, entry, namespaces=ns, journal_currency=journal_currency),
+                    'payment_ref': CAMT._get_transaction_name(entry_details, namespaces=ns),
+                    'partner_name': partner_name,
+                    'account_number': CAMT._get_account_number(entry_details, placeholder=counter_party, namespaces=ns),
+                    'ref': CAMT._get_ref(entry_details, counter_party=counter_party, prefix='', namespaces=ns),
+                }
+
+                entry_vals['unique_import_id'] = CAMT._get_unique_import_id(
+                    entry=entry_details,
+                    sequence=sequence,
+                    name=statement_vals['name'],
+                    date=entry_vals['date'],
+                    unique_import_set=unique_import_set,
+                    namespaces=ns)
+
+                CAMT._set_amount_in_currency(
+                    node=entry_details,
+                    getters=CAMT._currency_amount_getters,
+                    entry_vals=entry_vals,
+                    currency=currency,
+                    curr_cache=curr_cache,
+                    has_multi_currency=has_multi_currency,
+                    namespaces=ns)
+
+                BkTxCd = entry.xpath('ns:BkTxCd', namespaces=ns)[0]
+                entry_vals.update(CAMT._get_transaction_type(BkTxCd, namespaces=ns))
+                notes = []
+                entry_info = CAMT._get_additional_entry_info(entry, namespaces=ns)
+                if entry_info:
+                    notes.append(_('Entry Info: %s', entry_info))
+                text_info = CAMT._get_additional_text_info(entry_details, namespaces=ns)
+                if text_info:
+                    notes.append(_('Additional Info: %s', text_info))
+                if partner_name:
+                    notes.append(_('Counter Party: %(partner)s', partner=partner_name))
+                partner_address = CAMT._get_partner_address(entry_details, ns, counter_party)
+                if partner_address:
+                    notes.append(_('Address:\n') + partner_address)
+                transaction_id = CAMT._get_transaction_id(entry_details, namespaces=ns)
+                if transaction_id:
+                    notes.append(_('Transaction ID: %s', transaction_id))
+                instruction_id = CAMT._get_instruction_id(entry_details, namespaces=ns)
+                if instruction_id:
+                    notes.append(_('Instruction ID: %s', instruction_id))
+                end_to_end_id = CAMT._get_end_to_end_id(entry_details, namespaces=ns)
+                if end_to_end_id:
+                    notes.append(_('End to end ID: %s', end_to_end_id))
+                mandate_id = CAMT._get_mandate_id(entry_details, namespaces=ns)
+                if mandate_id:
+                    notes.append(_('Mandate ID: %s', mandate_id))
+                check_number = CAMT._get_check_number(entry_details, namespaces=ns)
+                if check_number:
+                    notes.append(_('Check Number: %s', check_number))
+                entry_vals['narration'] = "\n".join(notes)
+
+                unique_import_set.add(entry_vals['unique_import_id'])
+                transactions.append(entry_vals)
 
         # If statements target multiple journals, returns thoses targeting the current journal
         if len(statements_per_iban) > 1:
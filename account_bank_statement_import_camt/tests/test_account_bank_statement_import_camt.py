@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
+import io
+
+from lxml import etree
+
 from odoo.addons.account.tests.common import AccountTestInvoicingCommon
 from odoo.tests import tagged
 from odoo.tools import file_open
@@ -397,3 +401,109 @@ class TestAccountBankStatementImportCamt(AccountTestInvoicingCommon):
         import_file()
         with self.assertRaises(UserError, msg='You already have imported that file.'):
             import_file()
+
+    def _generate_camt_file(self, nb_entries, account_number='112233', name='GENERATED.2019-02-13'):
+        """ Returns a CAMT.053 file with a single statement of nb_entries credits of 1.00 USD, the
+        i-th one being sent from the bank account 'BE-GEN-{i % 10}'. """
+        entries = ''.join(f'''
+      <Ntry>
+        <Amt Ccy="USD">1.00</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <Sts>BOOK</Sts>
+        <ValDt><Dt>2019-02-13</Dt></ValDt>
+        <BkTxCd><Prtry><Cd>ABCD</Cd></Prtry></BkTxCd>
+        <NtryDtls>
+          <TxDtls>
+            <Amt Ccy="USD">1.00</Amt>
+            <CdtDbtInd>CRDT</CdtDbtInd>
+            <RltdPties>
+              <Dbtr><Nm>Debtor {i % 10}</Nm></Dbtr>
+              <DbtrAcct><Id><IBAN>BE-GEN-{i % 10}</IBAN></Id></DbtrAcct>
+            </RltdPties>
+          </TxDtls>
+        </NtryDtls>
+      </Ntry>''' for i in range(nb_entries))
+        return f'''<?xml version='1.0' encoding='UTF-8'?>
+<Document xmlns="urn:iso:std:iso:20022:tech:xsd:camt.053.001.04">
+  <BkToCstmrStmt>
+    <GrpHdr><MsgId>{name}</MsgId><CreDtTm>2019-02-13T15:27:15.66+02:00</CreDtTm></GrpHdr>
+    <Stmt>
+      <Id>{name}</Id>
+      <CreDtTm>2019-02-13T15:27:15.66+02:00</CreDtTm>
+      <Acct><Id><Othr><Id>{account_number}</Id></Othr></Id></Acct>
+      <Bal>
+        <Tp><CdOrPrtry><Cd>OPBD</Cd></CdOrPrtry></Tp>
+        <Amt Ccy="USD">0.00</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <Dt><Dt>2019-02-12</Dt></Dt>
+      </Bal>
+      <Bal>
+        <Tp><CdOrPrtry><Cd>CLBD</Cd></CdOrPrtry></Tp>
+        <Amt Ccy="USD">{nb_entries}.00</Amt>
+        <CdtDbtInd>CRDT</CdtDbtInd>
+        <Dt><Dt>2019-02-13</Dt></Dt>
+      </Bal>{entries}
+    </Stmt>
+  </BkToCstmrStmt>
+</Document>'''.encode()
+
+    def test_camt_file_import_many_entries(self):
+        """ The already imported transactions and the bank accounts of the counterparts are fetched
+        for the whole file at once. """
+        bank_journal = self.env['account.journal'].create({
+            'name': 'Bank 112233',
+            'code': 'BNK67',
+            'type': 'bank',
+            'bank_acc_number': '112233',
+            'currency_id': self.env.ref('base.USD').id,
+        })
+        partners = self.env['res.partner'].create([{'name': f'Debtor {i}'} for i in range(10)])
+        # Stored with another formatting than in the file
+        self.env['res.partner.bank'].create([
+            {'acc_number': f'be gen {i}', 'partner_id': partner.id}
+            for i, partner in enumerate(partners)
+        ])
+
+        def import_file(nb_entries):
+            bank_journal.create_document_from_attachment(self.env['ir.attachment'].create({
+                'mimetype': 'application/xml',
+                'name': 'generated_camt.xml',
+                'raw': self._generate_camt_file(nb_entries),
+            }).ids)
+
+        import_file(200)
+        statement = self.env['account.bank.statement'].search([('name', '=', 'GENERATED.2019-02-13')])
+        self.assertEqual(len(statement.line_ids), 200)
+        self.assertEqual(statement.balance_end_real, 200)
+        for line in statement.line_ids:
+            self.assertEqual(line.partner_id, partners[int(line.partner_name[-1])])
+
+        with self.assertRaises(UserError, msg='You already have imported that file.'):
+            import_file(200)
+
+    def test_camt_file_parsed_incrementally(self):
+        bank_journal = self.env['account.journal'].create({
+            'name': 'Bank 112233',
+            'code': 'BNK67',
+            'type': 'bank',
+            'bank_acc_number': '112233',
+            'currency_id': self.env.ref('base.USD').id,
+        })
+        camt_file = io.BytesIO(self._generate_camt_file(300))
+        parsed_nodes = []
+        for node in bank_journal._iter_camt_nodes(camt_file):
+            parsed_nodes.append(etree.QName(node).localname)
+            self.assertEqual(len(node.getparent().findall(node.tag)), 1, "The processed nodes are removed from the tree")
+        self.assertEqual(parsed_nodes, ['Ntry'] * 300 + ['Stmt'])
+
+        camt_file.seek(0)
+        currency, account_number, statements = bank_journal._parse_bank_statement_file_camt(camt_file)
+        self.assertEqual((currency, account_number), ('USD', '112233'))
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(statements[0]['balance_end_real'], 300)
+        self.assertEqual([vals['sequence'] for vals in statements[0]['transactions']], list(range(1, 301)))
+
+        # The root element is enough to recognize the file
+        Attachment = self.env['ir.attachment']
+        self.assertTrue(bank_journal._check_camt(Attachment.new({'raw': self._generate_camt_file(3)})))
+        self.assertFalse(bank_journal._check_camt(Attachment.new({'raw': b'<ofx><signonmsgsrsv1/></ofx>'})))
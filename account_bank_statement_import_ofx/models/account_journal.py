@@ -126,15 +126,20 @@ class AccountJournal(models.Model):
         vals_bank_statement = []
         account_lst = set()
         currency_lst = set()
+        # Since ofxparse doesn't provide account numbers, we'll have to find res.partner and res.partner.bank here
+        # (normal behaviour is to provide 'account_number', which the generic module uses to find partner/bank)
+        payees = {transaction.payee for account in ofx.accounts for transaction in account.statement.transactions}
+        partner_bank_per_payee = {}
+        if payees:
+            for partner_bank in self.env['res.partner.bank'].search([('partner_id.name', 'in', list(payees))]):
+                partner_bank_per_payee.setdefault(partner_bank.partner_id.name, partner_bank)
         for account in ofx.accounts:
             account_lst.add(account.number)
             currency_lst.add(account.statement.currency)
             transactions = []
             total_amt = 0.00
             for transaction in account.statement.transactions:
-                # Since ofxparse doesn't provide account numbers, we'll have to find res.partner and res.partner.bank here
-                # (normal behaviour is to provide 'account_number', which the generic module uses to find partner/bank)
-                partner_bank = self.env['res.partner.bank'].search([('partner_id.name', '=', transaction.payee)], limit=1)
+                partner_bank = partner_bank_per_payee.get(transaction.payee, self.env['res.partner.bank'])
                 vals_line = {
                     'date': transaction.date,
                     'payment_ref': transaction.payee + (transaction.memo and ': ' + transaction.memo or ''),
@@ -2,6 +2,7 @@
 
 import datetime
 import json
+from collections import defaultdict
 
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
@@ -609,15 +610,14 @@ class ConsolidationCompanyPeriod(models.Model):
         :rtype: list
         """
         self.ensure_one()
-        journal_lines_values = []
-        historical_account_ids = self.period_id.chart_id.account_ids.filtered(lambda x: x.currency_mode == 'hist')
-        non_hist_account_ids = self.period_id.chart_id.account_ids - historical_account_ids
-        for consolidation_account in historical_account_ids:
-            journal_lines_values += self._get_historical_journal_lines_values(consolidation_account)
-
-        for consolidation_account in non_hist_account_ids:
-            # Maybe there is a better way to group all move line ids and total balance by consolidation account
-            currency_amount, move_lines_ids = self._get_total_balance_and_audit_lines(consolidation_account)
+        consolidation_accounts = self.period_id.chart_id.account_ids
+        historical_accounts = consolidation_accounts.filtered(lambda x: x.currency_mode == 'hist')
+        non_hist_accounts = consolidation_accounts - historical_accounts
+        journal_lines_values = self._get_historical_journal_lines_values(historical_accounts)
+
+        totals = self._get_total_balances_and_audit_lines(non_hist_accounts)
+        for consolidation_account in non_hist_accounts:
+            currency_amount, move_lines_ids = totals[consolidation_account.id]
             amount = self._apply_rates(currency_amount, consolidation_account)
             journal_lines_values.append({
                 "account_id": consolidation_account.id,
@@ -637,9 +637,45 @@ class ConsolidationCompanyPeriod(models.Model):
         :rtype: tuple
         """
         self.ensure_one()
-        domain = self._get_move_lines_domain(consolidation_account)
-        res = self.env['account.move.line']._read_group(domain, [], ['balance:sum', 'id:array_agg'])
-        return res[0]
+        return self._get_total_balances_and_audit_lines(consolidation_account)[consolidation_account.id]
+
+    def _get_total_balances_and_audit_lines(self, consolidation_accounts):
+        """
+        Get the total balance and the ids of all the move lines "linked" to this company and each of the given
+        consolidation accounts, with a single grouped query.
+        :param consolidation_accounts: the consolidation accounts
+        :return: a dict mapping each consolidation account id to a (total balance, move line ids) tuple
+        :rtype: dict
+        """
+        self.ensure_one()
+        groups = self._get_move_lines_groups(consolidation_accounts)
+        return {
+            consolidation_account.id: tuple(groups.get((consolidation_account.id,), (0.0, [])))
+            for consolidation_account in consolidation_accounts
+        }
+
+    def _get_move_lines_groups(self, consolidation_accounts, groupby=()):
+        """
+        Group the move lines "linked" to this company period and the given consolidation accounts in a single query.
+        A move line is accounted in every given consolidation account its account is mapped to.
+        :param consolidation_accounts: the consolidation accounts
+        :param groupby: additional groupby specifications of the move lines (e.g. 'date:day')
+        :return: a dict mapping (consolidation account id, *groupby values) to a [total balance, move line ids] list
+        :rtype: dict
+        """
+        self.ensure_one()
+        groups = {}
+        if not consolidation_accounts:
+            return groups
+        domain = self._get_move_lines_domain(consolidation_accounts)
+        move_lines_groups = self.env['account.move.line']._read_group(
+            domain, ['account_id', *groupby], ['balance:sum', 'id:array_agg'])
+        for account, *groupby_values, balance, move_line_ids in move_lines_groups:
+            for consolidation_account in account.consolidation_account_ids & consolidation_accounts:
+                group = groups.setdefault((consolidation_account.id, *groupby_values), [0.0, []])
+                group[0] += balance
+                group[1] += move_line_ids
+        return groups
 
     def _apply_rates(self, amount, consolidation_account):
         """
@@ -668,41 +704,71 @@ class ConsolidationCompanyPeriod(models.Model):
         :rtype: float
         """
         self.ensure_one()
-        rate = self.env['consolidation.rate'].get_rate_for(move_line.date, self.company_id.id,
-                                                                         self.chart_id.id)
-        if rate:
-            amount = move_line.balance * rate
-        else:
-            amount = move_line.balance
-            currency = move_line.company_currency_id
-            if currency != self.currency_chart_id:
-                amount = currency._convert(amount, self.currency_chart_id, self.company_id, move_line.date)
-        return self._apply_consolidation_rate(amount)
+        rate = self._get_historical_rates([move_line.date])[move_line.date]
+        return self._apply_consolidation_rate(move_line.balance * rate)
 
-    def _get_historical_journal_lines_values(self, consolidation_account):
+    def _get_historical_rates(self, dates):
         """
-        Get all the journal line values for a given consolidation account when using historical currency mode.
-        :param consolidation_account: the consolidation account
+        Get the historical rate to apply to the balances in company currency at each of the given dates. The
+        consolidation rates defined for this company and chart take precedence over the currency rates.
+        :param dates: the dates
+        :type dates: list
+        :return: a dict mapping each date to its rate
+        :rtype: dict
+        """
+        self.ensure_one()
+        if not dates:
+            return {}
+        consolidation_rates = self.env['consolidation.rate'].search_read([
+            ('company_id', '=', self.company_id.id),
+            ('chart_id', '=', self.chart_id.id),
+            ('date_start', '<=', max(dates)),
+            ('date_end', '>=', min(dates)),
+        ], ['rate', 'date_start', 'date_end'], order='date_end desc')
+        rates = {}
+        for date in dates:
+            rate = next((r['rate'] for r in consolidation_rates if r['date_start'] <= date <= r['date_end']), False)
+            if not rate:
+                rate = 1.0
+                if self.currency_company_id != self.currency_chart_id:
+                    rate = self.currency_company_id._get_conversion_rate(
+                        self.currency_company_id, self.currency_chart_id, self.company_id, date)
+            rates[date] = rate
+        return rates
+
+    def _get_historical_journal_lines_values(self, consolidation_accounts):
+        """
+        Get all the journal line values for the given consolidation accounts when using historical currency mode.
+        The move lines are grouped by date in a single query and the balances sharing the same historical rate are
+        gathered in one journal line per consolidation account, linked to all of these move lines.
+        :param consolidation_accounts: the consolidation accounts
         :return: a list of dict containing values for journal lines creation
         :rtype: list
         """
         self.ensure_one()
-        domain = self._get_move_lines_domain(consolidation_account)
-        move_lines = self.env['account.move.line'].search(domain)
+        groups = self._get_move_lines_groups(consolidation_accounts, groupby=['date:day'])
+        rates = self._get_historical_rates(list({date for dummy, date in groups}))
+        buckets = defaultdict(dict)  # consolidation account id -> {rate: [total balance, move line ids]}
+        for (consolidation_account_id, date), (balance, move_line_ids) in sorted(groups.items()):
+            bucket = buckets[consolidation_account_id].setdefault(rates[date], [0.0, []])
+            bucket[0] += balance
+            bucket[1] += move_line_ids
         return [{"account_id": consolidation_account.id,
-                 "currency_amount": move_line.balance,
-                 "amount": self._apply_historical_rates(move_line),
-                 'move_line_ids': [(6, 0, [move_line.id])]} for move_line in move_lines]
+                 "currency_amount": balance,
+                 "amount": self._apply_consolidation_rate(balance * rate),
+                 'move_line_ids': [(6, 0, move_line_ids)]}
+                for consolidation_account in consolidation_accounts
+                for rate, (balance, move_line_ids) in buckets[consolidation_account.id].items()]
 
-    def _get_move_lines_domain(self, consolidation_account):
+    def _get_move_lines_domain(self, consolidation_accounts):
         """
-        Get the domain definition to get all the move lines "linked" to this company period and a given consolidation
-        account. That means all the move lines that :
+        Get the domain definition to get all the move lines "linked" to this company period and the given consolidation
+        accounts. That means all the move lines that :
         - are in the right company,
         - are not in excluded journals,
-        - are linked to a account.account which is mapped in the given consolidation account
+        - are linked to a account.account which is mapped in one of the given consolidation accounts
         - have a date contained in the company period start and company period end.
-        :param consolidation_account: the consolidation account
+        :param consolidation_accounts: the consolidation accounts
         :return: a domain definition to be use in search ORM method.
         """
         self.ensure_one()
@@ -710,7 +776,7 @@ class ConsolidationCompanyPeriod(models.Model):
             ('parent_state', '=', 'posted'),
             ('company_id', '=', self.company_id.id),
             ('journal_id', 'not in', self.mapped('exclude_journal_ids.id')),
-            ('account_id.consolidation_account_ids', '=', consolidation_account.id),
+            ('account_id.consolidation_account_ids', 'in', consolidation_accounts.ids),
             ('date', '<=', self.date_company_end),
             '|',
             ('date', '>=', self.date_company_begin),
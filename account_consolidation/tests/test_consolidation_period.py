@@ -465,12 +465,12 @@ class TestConsolidationCompanyPeriod(AccountConsolidationTestCase):
         self.assertEqual(expected_str, cp.display_name)
 
     @patch(
-        'odoo.addons.account_consolidation.models.consolidation_period.ConsolidationCompanyPeriod._get_total_balance_and_audit_lines',
-        return_value=(42.0, []))
+        'odoo.addons.account_consolidation.models.consolidation_period.ConsolidationCompanyPeriod._get_total_balances_and_audit_lines',
+        side_effect=lambda accounts: {account.id: (42.0, []) for account in accounts})
     @patch(
         'odoo.addons.account_consolidation.models.consolidation_period.ConsolidationCompanyPeriod._apply_rates',
         return_value=191289.0)
-    def test_generate_journal(self, patch_apply_rates, patched_get_total_balance):
+    def test_generate_journal(self, patch_apply_rates, patched_get_total_balances):
         Journal = self.env['consolidation.journal']
         JournalLine = self.env['consolidation.journal.line']
         self._create_consolidation_account('First', 'end')
@@ -489,18 +489,18 @@ class TestConsolidationCompanyPeriod(AccountConsolidationTestCase):
         self.assertNotEqual(journal_lines[0].account_id, journal_lines[1].account_id,
                             'Generated journals lines should be linked to different accounts')
         for journal_line in journal_lines:
-            self.assertAlmostEqual(journal_line.currency_amount, patched_get_total_balance.return_value[0],
+            self.assertAlmostEqual(journal_line.currency_amount, 42.0,
                                    msg='Generated journals should have the right currency amount')
             self.assertAlmostEqual(journal_line.amount, patch_apply_rates.return_value,
                                    msg='Generated journals should have the right amount')
 
     @patch(
-        'odoo.addons.account_consolidation.models.consolidation_period.ConsolidationCompanyPeriod._get_total_balance_and_audit_lines',
-        return_value=(420.0, []))
+        'odoo.addons.account_consolidation.models.consolidation_period.ConsolidationCompanyPeriod._get_total_balances_and_audit_lines',
+        side_effect=lambda accounts: {account.id: (420.0, []) for account in accounts})
     @patch(
         'odoo.addons.account_consolidation.models.consolidation_period.ConsolidationCompanyPeriod._apply_rates',
         return_value=191289.0)
-    def test_get_journal_lines_values(self, patch_apply_rates, patch_get_total_balance):
+    def test_get_journal_lines_values(self, patch_apply_rates, patch_get_total_balances):
         accounts = (
             self._create_consolidation_account('First', 'end'),
             self._create_consolidation_account('Second', 'avg')
@@ -511,13 +511,13 @@ class TestConsolidationCompanyPeriod(AccountConsolidationTestCase):
         expected = [{
             'account_id': accounts[0].id,
             'amount': patch_apply_rates.return_value,
-            'currency_amount': patch_get_total_balance.return_value[0],
-            'move_line_ids': [(6, 0, patch_get_total_balance.return_value[1])]
+            'currency_amount': 420.0,
+            'move_line_ids': [(6, 0, [])]
         }, {
             'account_id': accounts[1].id,
             'amount': patch_apply_rates.return_value,
-            'currency_amount': patch_get_total_balance.return_value[0],
-            'move_line_ids': [(6, 0, patch_get_total_balance.return_value[1])]}
+            'currency_amount': 420.0,
+            'move_line_ids': [(6, 0, [])]}
         ]
         for cp in cps:
             result = cp._get_journal_lines_values()
@@ -604,6 +604,41 @@ class TestConsolidationCompanyPeriod(AccountConsolidationTestCase):
         expected_amount = 0.75 * move_line.balance
         self.assertAlmostEqual(cp._apply_historical_rates(move_line), expected_amount)
 
+    def test__get_historical_journal_lines_values(self):
+        ap = self._create_analysis_period()
+        cp = self._create_company_period(period=ap, rate_consolidation=50, company=self.us_company,
+                                         start_date='2014-01-01', end_date='2014-12-31')
+        self.env['consolidation.rate'].create({
+            'date_start': '2014-01-01',
+            'date_end': '2014-06-30',
+            'rate': 1.5,
+            'company_id': self.us_company.id,
+            'chart_id': cp.chart_id.id
+        })
+        journal = self._create_journal(company=self.us_company)
+        account_credit = self._create_account('111', 'Credit account', company=self.us_company)
+        account_debit = self._create_account('112', 'Debit account', company=self.us_company)
+        consolidation_account = self._create_consolidation_account(currency_mode='hist')
+        consolidation_account.write({'account_ids': [(4, account_credit.id)]})
+        credit_lines = self.env['account.move.line']
+        for amount, move_date in [(1000, '2014-01-31'), (200, '2014-03-31'), (30, '2014-09-30')]:
+            move = self._create_basic_move(amount, journal=journal, company=self.us_company, move_date=move_date,
+                                           account_credit=account_credit, account_debit=account_debit)
+            credit_lines |= move.line_ids.filtered(lambda line: line.account_id == account_credit)
+
+        # The move lines sharing the same historical rate are gathered in a single journal line
+        jl_values = cp._get_historical_journal_lines_values(consolidation_account)
+        self.assertEqual(len(jl_values), 2)
+        fixed_rate_values, currency_rate_values = jl_values
+        self.assertEqual(fixed_rate_values['account_id'], consolidation_account.id)
+        self.assertEqual(sorted(fixed_rate_values['move_line_ids'][0][2]), sorted(credit_lines[:2].ids))
+        self.assertAlmostEqual(fixed_rate_values['currency_amount'], -1200)
+        # = (50/100) * (-1200 * 1.5)
+        self.assertAlmostEqual(fixed_rate_values['amount'], -900)
+        self.assertEqual(currency_rate_values['move_line_ids'][0][2], credit_lines[2].ids)
+        self.assertAlmostEqual(currency_rate_values['currency_amount'], -30)
+        self.assertAlmostEqual(currency_rate_values['amount'], cp._apply_historical_rates(credit_lines[2]))
+
     @patch(
         'odoo.addons.account_consolidation.models.consolidation_period.ConsolidationCompanyPeriod._convert')
     @patch(
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
+import os
+
 import werkzeug
 from werkzeug.exceptions import InternalServerError
+from werkzeug.wsgi import wrap_file
 
 from odoo.addons.account_reports.models.account_report import AccountReportFileDownloadException
 from odoo import http
@@ -33,7 +36,12 @@ class AccountReportController(http.Controller):
             file_type = generated_file_data['file_type']
             response_headers = self._get_response_headers(file_type, generated_file_data['file_name'], file_content)
 
-            if file_type == 'xlsx':
+            if hasattr(file_content, 'read'):
+                # Streamed exports are written in a temporary file, sent by chunks without loading it in memory
+                file_content.seek(0)
+                response = request.make_response(wrap_file(request.httprequest.environ, file_content), headers=response_headers)
+                response.direct_passthrough = True
+            elif file_type == 'xlsx':
                 response = request.make_response(None, headers=response_headers)
                 response.stream.write(file_content)
             else:
@@ -72,7 +80,9 @@ class AccountReportController(http.Controller):
             ('Content-Disposition', content_disposition(file_name)),
         ]
 
-        if file_type in ('xml', 'xaf', 'txt', 'csv', 'kvr', 'csv'):
+        if hasattr(file_content, 'read'):
+            headers.append(('Content-Length', os.fstat(file_content.fileno()).st_size))
+        elif file_type in ('xml', 'xaf', 'txt', 'csv', 'kvr', 'csv'):
             headers.append(('Content-Length', len(file_content)))
 
         return headers
@@ -171,6 +171,20 @@ class AccountReport(models.AbstractModel):
 
         self.env.cr.execute(query)
 
+    def _is_monthly_balance_summary_allowed(self, options):
+        # Analytic lines and distributions aren't part of the monthly balances
+        return super()._is_monthly_balance_summary_allowed(options) \
+            and not options.get('analytic_groupby_option') \
+            and not options.get('analytic_accounts') \
+            and 'analytic_accounts_list' not in options
+
+    def _is_column_groups_concurrency_allowed(self, options):
+        # analytic_temp_account_move_line is created by the cursor evaluating the report
+        return super()._is_column_groups_concurrency_allowed(options) \
+            and not options.get('analytic_groupby_option') \
+            and not options.get('analytic_accounts') \
+            and 'analytic_accounts_list' not in options
+
     def _query_get(self, options, date_scope, domain=None):
         # Override to add the context key which will eventually trigger the shadowing of the table
         context_self = self.with_context(account_report_analytic_groupby=options.get('analytic_groupby_option'))
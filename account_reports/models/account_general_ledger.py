@@ -37,6 +37,9 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
         # Automatically unfold the report when printing it, unless some specific lines have been unfolded
         options['unfold_all'] = (options['export_mode'] == 'print' and not options.get('unfolded_lines')) or options['unfold_all']
 
+        # Fully unfolded ledgers can be too big to be exported at once
+        report._init_options_stream_export_buttons(options)
+
     def _dynamic_lines_generator(self, report, options, all_column_groups_expression_totals, warnings=None):
         lines = []
         date_from = fields.Date.from_string(options['date']['date_from'])
@@ -91,12 +94,14 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
             if model == 'account.account':
                 account_ids_to_expand.append(model_id)
 
+        # The load more limit is applied per account: the first page of every account is fetched by a single query.
+        page_size = report.load_more_limit if report.load_more_limit and options['export_mode'] != 'print' else None
+        aml_values, aml_pages = self._get_aml_values(report, options, account_ids_to_expand, limit=page_size)
+
         return {
             'initial_balances': self._get_initial_balance_values(report, account_ids_to_expand, options),
-
-            # load_more_limit canno( be passed to this call, otherwise it won't be applied per account but on the whole result.
-            # We gain perf from batching, but load every result, even if the limit restricts them later.
-            'aml_values': self._get_aml_values(report, options, account_ids_to_expand)[0],
+            'aml_values': aml_values,
+            'aml_pages': aml_pages,
         }
 
     def _tax_declaration_lines(self, report, options, tax_type):
@@ -327,18 +332,40 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
 
         return new_options
 
-    def _get_aml_values(self, report, options, expanded_account_ids, offset=0, limit=None):
+    def _get_aml_values(self, report, options, expanded_account_ids, cursor=None, limit=None):
+        """ Fetch the journal items of the provided accounts.
+
+        :param expanded_account_ids:  The account.account ids whose journal items are fetched.
+        :param cursor:                The (date, move name, id) of the last journal item already loaded (used by the load more).
+        :param limit:                 The maximum number of journal items to fetch per account (used by the load more).
+        :return:                      (values, pages) where values gives the journal items per account, and pages gives, for each
+                                      account having journal items, a (has_more, cursor) tuple to load the next ones.
+        """
         rslt = {account_id: {} for account_id in expanded_account_ids}
-        aml_query, aml_params = self._get_query_amls(report, options, expanded_account_ids, offset=offset, limit=limit)
+        pages = {}
+        if not expanded_account_ids:
+            return rslt, pages
+
+        aml_query, aml_params = self._get_query_amls(report, options, expanded_account_ids, cursor=cursor, limit=limit)
         self._cr.execute(aml_query, aml_params)
-        aml_results_number = 0
-        has_more = False
+        aml_results_by_account = defaultdict(list)
         for aml_result in self._cr.dictfetchall():
-            aml_results_number += 1
-            if aml_results_number == limit:
-                has_more = True
-                break
-
+            aml_results_by_account[aml_result['account_id']].append(aml_result)
+
+        for account_id, account_aml_results in aml_results_by_account.items():
+            page_aml_results, has_more, next_cursor = report._get_partner_and_general_ledger_aml_page(
+                account_aml_results,
+                limit,
+                lambda aml_result: aml_result['column_group_key'],
+            )
+            pages[account_id] = (has_more, next_cursor)
+            self._add_aml_results_to_account_values(options, rslt[account_id], page_aml_results)
+
+        return rslt, pages
+
+    def _add_aml_results_to_account_values(self, options, account_result, aml_results):
+        """ Merge the rows of the journal items of an account into account_result, per journal item and column group. """
+        for aml_result in aml_results:
             if aml_result['ref']:
                 aml_result['communication'] = f"{aml_result['ref']} - {aml_result['name']}"
             else:
@@ -349,7 +376,6 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
             # reconciliation date. In order to keep distinct lines in this case, we include date in the grouping key.
             aml_key = (aml_result['id'], aml_result['date'])
 
-            account_result = rslt[aml_result['account_id']]
             if not aml_key in account_result:
                 account_result[aml_key] = {col_group_key: {} for col_group_key in options['column_groups']}
 
@@ -365,18 +391,18 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
             else:
                 account_result[aml_key][aml_result['column_group_key']] = aml_result
 
-        return rslt, has_more
-
-    def _get_query_amls(self, report, options, expanded_account_ids, offset=0, limit=None):
+    def _get_query_amls(self, report, options, expanded_account_ids, cursor=None, limit=None):
         """ Construct a query retrieving the account.move.lines when expanding a report line with or without the load
         more.
         :param options:               The report options.
-        :param expanded_account_ids:  The account.account ids corresponding to consider. If None, match every account.
-        :param offset:                The offset of the query (used by the load more).
-        :param limit:                 The limit of the query (used by the load more).
+        :param expanded_account_ids:  The account.account ids corresponding to consider.
+        :param cursor:                The (date, move name, id) of the last journal item already loaded (used by the load more).
+        :param limit:                 The number of journal items to load per account (used by the load more). One more is
+                                      fetched for each account and column group, to know if there are more to load.
         :return:                      (query, params)
         """
-        additional_domain = [('account_id', 'in', expanded_account_ids)] if expanded_account_ids is not None else None
+        additional_domain = [('account_id', 'in', expanded_account_ids)]
+        keyset_condition, keyset_params = report._get_partner_and_general_ledger_keyset_condition(cursor)
         queries = []
         all_params = []
         lang = self.env.user.lang or get_lang(self.env).code
@@ -390,7 +416,7 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
             tables, where_clause, where_params = report._query_get(group_options, domain=additional_domain, date_scope='strict_range')
             ct_query = report._get_query_currency_table(group_options)
             query = f'''
-                (SELECT
+                SELECT
                     account_move_line.id,
                     account_move_line.date,
                     account_move_line.date_maturity,
@@ -424,23 +450,30 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
                 LEFT JOIN account_account account           ON account.id = account_move_line.account_id
                 LEFT JOIN account_journal journal           ON journal.id = account_move_line.journal_id
                 LEFT JOIN account_full_reconcile full_rec   ON full_rec.id = account_move_line.full_reconcile_id
-                WHERE {where_clause}
-                ORDER BY account_move_line.date, account_move_line.id)
+                WHERE {where_clause} AND {keyset_condition}
             '''
-
-            queries.append(query)
-            all_params.append(column_group_key)
-            all_params += where_params
+            params = [column_group_key, *where_params, *keyset_params]
+
+            if limit:
+                # Seek the first journal items of each account separately, so that the limit applies per account and each
+                # page only reads the rows it returns.
+                query = f'''
+                    SELECT aml_page.*
+                    FROM UNNEST(%s) AS expanded(account_id)
+                    CROSS JOIN LATERAL (
+                        {query}
+                        AND account_move_line.account_id = expanded.account_id
+                        ORDER BY {report._get_partner_and_general_ledger_aml_order()}
+                        LIMIT %s
+                    ) aml_page
+                '''
+                params = [expanded_account_ids, *params, limit + 1]
+
+            queries.append(f'({query})')
+            all_params += params
 
         full_query = " UNION ALL ".join(queries)
 
-        if offset:
-            full_query += ' OFFSET %s '
-            all_params.append(offset)
-        if limit:
-            full_query += ' LIMIT %s '
-            all_params.append(limit)
-
         return (full_query, all_params)
 
     def _get_initial_balance_values(self, report, account_ids, options):
@@ -677,13 +710,15 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
                 progress = init_load_more_progress(initial_balance_line)
 
         # Get move lines
-        limit_to_load = report.load_more_limit + 1 if report.load_more_limit and options['export_mode'] != 'print' else None
-        has_more = False
+        page_size = report.load_more_limit if report.load_more_limit and options['export_mode'] != 'print' else None
         if unfold_all_batch_data:
-            aml_results = unfold_all_batch_data['aml_values'][model_id]
+            aml_values, aml_pages = unfold_all_batch_data['aml_values'], unfold_all_batch_data['aml_pages']
         else:
-            aml_results, has_more = self._get_aml_values(report, options, [model_id], offset=offset, limit=limit_to_load)
-            aml_results = aml_results[model_id]
+            # The load more line carries the key of the last journal item it follows in its progress.
+            cursor = progress.get('keyset_cursor') if offset else None
+            aml_values, aml_pages = self._get_aml_values(report, options, [model_id], cursor=cursor, limit=page_size)
+        aml_results = aml_values[model_id]
+        has_more, next_cursor = aml_pages.get(model_id, (False, None))
 
         next_progress = progress
         for aml_result in aml_results.values():
@@ -691,6 +726,9 @@ class GeneralLedgerCustomHandler(models.AbstractModel):
             lines.append(new_line)
             next_progress = init_load_more_progress(new_line)
 
+        if has_more:
+            next_progress = {**next_progress, 'keyset_cursor': next_cursor}
+
         return {
             'lines': lines,
             'offset_increment': report.load_more_limit,
@@ -49,10 +49,14 @@ class AccountMove(models.Model):
             # Post the pdf of the tax report in the chatter, and set the lock date if possible
             move._close_tax_period()
 
-        return super()._post(soft)
+        posted = super()._post(soft)
+        self.env['account.report.totals.cache']._invalidate_for_moves(posted)
+        return posted
 
     def button_draft(self):
         # Overridden in order to delete the carryover values when resetting the tax closing to draft
+        posted_moves = self.filtered(lambda m: m.state == 'posted')
+        self.env['account.report.totals.cache']._invalidate_for_moves(posted_moves)
         super().button_draft()
         for closing_move in self.filtered(lambda m: m.tax_closing_end_date):
             report, options = closing_move._get_report_options_from_tax_closing_entry()
@@ -4,6 +4,7 @@
 from odoo import api, fields, models, _
 
 from odoo.exceptions import UserError
+from odoo.tools.sql import create_index
 
 class AccountMoveLine(models.Model):
     _name = "account.move.line"
@@ -13,6 +14,18 @@ class AccountMoveLine(models.Model):
                                     help="Expected payment date as manually set through the customer statement"
                                          "(e.g: if you had the customer on the phone and want to remember the date he promised he would pay)")
 
+    def init(self):
+        super().init()
+        # Used by the general ledger and partner ledger to seek the journal items of an account or a partner in their display
+        # order, when loading more of them.
+        for field_name in ('account_id', 'partner_id'):
+            create_index(
+                self._cr,
+                f'account_move_line_{field_name}_date_move_name_id_idx',
+                self._table,
+                [field_name, 'date', "COALESCE(move_name, '') COLLATE \"C\"", 'id'],
+            )
+
     @api.constrains('tax_ids', 'tax_tag_ids')
     def _check_taxes_on_closing_entries(self):
         for aml in self:
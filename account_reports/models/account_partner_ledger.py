@@ -115,6 +115,9 @@ class PartnerLedgerCustomHandler(models.AbstractModel):
         if self.user_has_groups('base.group_multi_currency'):
             options['multi_currency'] = True
 
+        # Fully unfolded ledgers can be too big to be exported at once
+        report._init_options_stream_export_buttons(options)
+
     def _custom_unfold_all_batch_data_generator(self, report, options, lines_to_expand_by_function):
         partner_ids_to_expand = []
 
@@ -140,12 +143,14 @@ class PartnerLedgerCustomHandler(models.AbstractModel):
         if partner_prefix_domains:
             partner_ids_to_expand += self.env['res.partner'].search(expression.OR(partner_prefix_domains)).ids
 
+        # The load more limit is applied per partner: the first page of every partner is fetched by a single query.
+        page_size = report.load_more_limit if report.load_more_limit and options['export_mode'] != 'print' else None
+        aml_values, aml_pages = self._get_aml_values(options, partner_ids_to_expand, limit=page_size) if partner_ids_to_expand else ({}, {})
+
         return {
             'initial_balances': self._get_initial_balance_values(partner_ids_to_expand, options) if partner_ids_to_expand else {},
-
-            # load_more_limit cannot be passed to this call, otherwise it won't be applied per partner but on the whole result.
-            # We gain perf from batching, but load every result, even if the limit restricts them later.
-            'aml_values': self._get_aml_values(options, partner_ids_to_expand) if partner_ids_to_expand else {},
+            'aml_values': aml_values,
+            'aml_pages': aml_pages,
         }
 
     @api.model
@@ -384,35 +389,41 @@ class PartnerLedgerCustomHandler(models.AbstractModel):
                 # For the first expansion of the line, the initial balance line gives the progress
                 progress = init_load_more_progress(initial_balance_line)
 
-        limit_to_load = report.load_more_limit + 1 if report.load_more_limit and options['export_mode'] != 'print' else None
-
+        page_size = report.load_more_limit if report.load_more_limit and options['export_mode'] != 'print' else None
         if unfold_all_batch_data:
-            aml_results = unfold_all_batch_data['aml_values'][record_id]
+            aml_values, aml_pages = unfold_all_batch_data['aml_values'], unfold_all_batch_data['aml_pages']
         else:
-            aml_results = self._get_aml_values(options, [record_id], offset=offset, limit=limit_to_load)[record_id]
+            # The load more line carries the key of the last journal item it follows in its progress.
+            cursor = progress.get('keyset_cursor') if offset else None
+            aml_values, aml_pages = self._get_aml_values(options, [record_id], cursor=cursor, limit=page_size)
+        aml_results = aml_values[record_id]
+        has_more, next_cursor = aml_pages.get(record_id, (False, None))
 
-        has_more = False
-        treated_results_count = 0
         next_progress = progress
         for result in aml_results:
-            if options['export_mode'] != 'print' and report.load_more_limit and treated_results_count == report.load_more_limit:
-                # We loaded one more than the limit on purpose: this way we know we need a "load more" line
-                has_more = True
-                break
-
             new_line = self._get_report_line_move_line(options, result, line_dict_id, next_progress, level_shift=level_shift)
             lines.append(new_line)
             next_progress = init_load_more_progress(new_line)
-            treated_results_count += 1
+
+        if has_more:
+            next_progress = {**next_progress, 'keyset_cursor': next_cursor}
 
         return {
             'lines': lines,
-            'offset_increment': treated_results_count,
+            'offset_increment': len(aml_results),
             'has_more': has_more,
             'progress': next_progress
         }
 
-    def _get_aml_values(self, options, partner_ids, offset=0, limit=None):
+    def _get_aml_values(self, options, partner_ids, cursor=None, limit=None):
+        """ Fetch the journal items of the provided partners, including the ones without partner reconciled with them.
+
+        :param partner_ids: The res.partner ids whose journal items are fetched. None stands for the journal items without partner.
+        :param cursor:      The (date, move name, id) of the last journal item already loaded (used by the load more).
+        :param limit:       The maximum number of journal items to fetch per partner (used by the load more).
+        :return:            (values, pages) where values gives the journal items per partner, and pages gives, for each partner
+                            having journal items, a (has_more, cursor) tuple to load the next ones.
+        """
         rslt = {partner_id: [] for partner_id in partner_ids}
 
         partner_ids_wo_none = [x for x in partner_ids if x]
@@ -438,24 +449,16 @@ class PartnerLedgerCustomHandler(models.AbstractModel):
         account_name = f"COALESCE(account.name->>'{lang}', account.name->>'en_US')" if \
             self.pool['account.account'].name.translate else 'account.name'
         report = self.env.ref('account_reports.partner_ledger_report')
+        keyset_condition, keyset_params = report._get_partner_and_general_ledger_keyset_condition(cursor)
+        aml_order = report._get_partner_and_general_ledger_aml_order()
         for column_group_key, group_options in report._split_options_per_column_group(options).items():
             tables, where_clause, where_params = report._query_get(group_options, 'strict_range')
 
-            all_params += [
-                column_group_key,
-                *where_params,
-                *directly_linked_aml_partner_params,
-                column_group_key,
-                *indirectly_linked_aml_partner_params,
-                *where_params,
-                group_options['date']['date_from'],
-                group_options['date']['date_to'],
-            ]
-
             # For the move lines directly linked to this partner
-            queries.append(f'''
+            directly_linked_aml_query = f'''
                 SELECT
                     account_move_line.id,
+                    account_move_line.date,
                     account_move_line.date_maturity,
                     account_move_line.name,
                     account_move_line.ref,
@@ -485,14 +488,43 @@ class PartnerLedgerCustomHandler(models.AbstractModel):
                 LEFT JOIN res_partner partner               ON partner.id = account_move_line.partner_id
                 LEFT JOIN account_account account           ON account.id = account_move_line.account_id
                 LEFT JOIN account_journal journal           ON journal.id = account_move_line.journal_id
-                WHERE {where_clause} AND {directly_linked_aml_partner_clause}
-                ORDER BY account_move_line.date, account_move_line.id
-            ''')
+                WHERE {where_clause} AND {keyset_condition}
+            '''
+            directly_linked_aml_params = [column_group_key, *where_params, *keyset_params]
+
+            if limit:
+                # Seek the first journal items of each partner separately, so that the limit applies per partner and each
+                # page only reads the rows it returns.
+                if partner_ids_wo_none:
+                    queries.append(f'''
+                        SELECT aml_page.*
+                        FROM UNNEST(%s) AS expanded(partner_id)
+                        CROSS JOIN LATERAL (
+                            {directly_linked_aml_query}
+                            AND account_move_line.partner_id = expanded.partner_id
+                            ORDER BY {aml_order}
+                            LIMIT %s
+                        ) aml_page
+                    ''')
+                    all_params += [partner_ids_wo_none, *directly_linked_aml_params, limit + 1]
+                if None in partner_ids:
+                    queries.append(f'''
+                        {directly_linked_aml_query}
+                        AND account_move_line.partner_id IS NULL
+                        ORDER BY {aml_order}
+                        LIMIT %s
+                    ''')
+                    all_params += [*directly_linked_aml_params, limit + 1]
+            else:
+                queries.append(f'{directly_linked_aml_query} AND {directly_linked_aml_partner_clause}')
+                all_params += [*directly_linked_aml_params, *directly_linked_aml_partner_params]
 
-            # For the move lines linked to no partner, but reconciled with this partner. They will appear in grey in the report
+            # For the move lines linked to no partner, but reconciled with this partner. They will appear in grey in the report.
+            # They are never numerous enough to need a limit.
             queries.append(f'''
                 SELECT
                     account_move_line.id,
+                    account_move_line.date,
                     account_move_line.date_maturity,
                     account_move_line.name,
                     account_move_line.ref,
@@ -538,19 +570,19 @@ class PartnerLedgerCustomHandler(models.AbstractModel):
                     AND account.id = account_move_line.account_id
                     AND {where_clause}
                     AND partial.max_date BETWEEN %s AND %s
-                ORDER BY account_move_line.date, account_move_line.id
+                    AND {keyset_condition}
             ''')
+            all_params += [
+                column_group_key,
+                *indirectly_linked_aml_partner_params,
+                *where_params,
+                group_options['date']['date_from'],
+                group_options['date']['date_to'],
+                *keyset_params,
+            ]
 
         query = '(' + ') UNION ALL ('.join(queries) + ')'
 
-        if offset:
-            query += ' OFFSET %s '
-            all_params.append(offset)
-
-        if limit:
-            query += ' LIMIT %s '
-            all_params.append(limit)
-
         self._cr.execute(query, all_params)
         for aml_result in self._cr.dictfetchall():
             if aml_result['key'] == 'indirectly_linked_aml':
@@ -570,7 +602,18 @@ class PartnerLedgerCustomHandler(models.AbstractModel):
             else:
                 rslt[aml_result['partner_id']].append(aml_result)
 
-        return rslt
+        pages = {}
+        for partner_id, partner_aml_results in rslt.items():
+            if partner_aml_results:
+                rslt[partner_id], has_more, next_cursor = report._get_partner_and_general_ledger_aml_page(
+                    partner_aml_results,
+                    limit,
+                    # Only the directly linked journal items are limited.
+                    lambda aml_result: aml_result['column_group_key'] if aml_result['key'] == 'directly_linked_aml' else None,
+                )
+                pages[partner_id] = (has_more, next_cursor)
+
+        return rslt, pages
 
     ####################################################
     # COLUMNS/LINES
@@ -2,6 +2,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
 import ast
+import csv
 import datetime
 import io
 import json
@@ -9,8 +10,11 @@ import logging
 import math
 import re
 import base64
+import tempfile
+import threading
 from ast import literal_eval
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import cmp_to_key
 
 import markupsafe
@@ -26,6 +30,8 @@ from odoo.tools.misc import formatLang, format_date, xlsxwriter
 from odoo.tools.safe_eval import expr_eval, safe_eval
 from odoo.models import check_method_name
 
+from .account_report_cache import EXPRESSION_TOTALS_CACHE_ENGINES
+
 _logger = logging.getLogger(__name__)
 
 ACCOUNT_CODES_ENGINE_SPLIT_REGEX = re.compile(r"(?=[+-])")
@@ -44,6 +50,11 @@ NO_NEXT_GROUPBY_ENGINES = {'tax_tags', 'account_codes'}
 
 LINE_ID_HIERARCHY_DELIMITER = '|'
 
+# Slots of the connection pool the threads evaluating column groups concurrently can use at once. They are shared by all
+# the requests of the process, and thus by all its databases, like the connection pool itself, half of which is kept for
+# the cursors of the requests. See account.report's _compute_expression_totals_for_column_groups_concurrently.
+COLUMN_GROUPS_WORKERS_SEMAPHORE = threading.BoundedSemaphore(max(config['db_maxconn'] // 2, 1))
+
 
 class AccountReportFootnote(models.Model):
     _name = 'account.report.footnote'
@@ -1396,6 +1407,18 @@ class AccountReport(models.Model):
             {'name': _('Save'), 'sequence': 100, 'action': 'open_report_export_wizard'},
         ]
 
+    def _init_options_stream_export_buttons(self, options):
+        """ Replaces the XLSX export by its streamed variant and adds a CSV export. Meant to be called by the custom options
+        initializers of the reports that can produce more lines than a worker can hold in memory (typically ledgers).
+        """
+        for button in options['buttons']:
+            if button.get('action_param') == 'export_to_xlsx':
+                button['action_param'] = 'export_to_xlsx_stream'
+
+        options['buttons'].append(
+            {'name': _('CSV'), 'sequence': 25, 'action': 'export_file', 'action_param': 'export_to_csv', 'file_export_type': _('CSV'), 'branch_allowed': True},
+        )
+
     def open_report_export_wizard(self, options):
         """ Creates a new export wizard for this report and returns an act_window
         opening it. A new account_report_generation_options key is also added to
@@ -1676,6 +1699,13 @@ class AccountReport(models.Model):
             self._init_options_section_buttons: 1060,
         }
 
+    def _is_monthly_balance_summary_allowed(self, options):
+        """ Tells whether the engines can read the whole months of their date range from account.report.monthly.balance
+        with these options. This is only the case when the report only targets posted entries, and doesn't depend on
+        anything else than the dimensions kept in the summary table (reconciliation, for example).
+        """
+        return not options.get('all_entries') and not options.get('unreconciled')
+
     def _get_options_domain(self, options, date_scope):
         self.ensure_one()
 
@@ -2459,8 +2489,34 @@ class AccountReport(models.Model):
                 add_expressions_to_groups(expanded_cross, grouped_formulas, force_date_scope=forced_date_scope)
 
         # Treat each formula batch for each column group
+        options_per_column_group = self._split_options_per_column_group(options)
+        max_workers = self._get_column_groups_max_workers(options, options_per_column_group)
+        if max_workers > 1:
+            return self._compute_expression_totals_for_column_groups_concurrently(
+                options_per_column_group,
+                grouped_formulas,
+                max_workers,
+                forced_all_column_groups_expression_totals=forced_all_column_groups_expression_totals,
+                offset=offset,
+                limit=limit,
+                warnings=warnings,
+            )
+        return self._compute_expression_totals_for_column_groups_sequentially(
+            options_per_column_group,
+            grouped_formulas,
+            forced_all_column_groups_expression_totals=forced_all_column_groups_expression_totals,
+            offset=offset,
+            limit=limit,
+            warnings=warnings,
+        )
+
+    def _compute_expression_totals_for_column_groups_sequentially(self, options_per_column_group, grouped_formulas, forced_all_column_groups_expression_totals=None, offset=0, limit=None, warnings=None):
+        """ Evaluates _compute_expression_totals_for_single_column_group for each column group, one after the other.
+
+        :return: The totals, in the same format as _compute_expression_totals_for_each_column_group.
+        """
         all_column_groups_expression_totals = {}
-        for group_key, group_options in self._split_options_per_column_group(options).items():
+        for group_key, group_options in options_per_column_group.items():
             if forced_all_column_groups_expression_totals:
                 forced_column_group_totals = forced_all_column_groups_expression_totals.get(group_key, None)
             else:
@@ -2478,6 +2534,132 @@ class AccountReport(models.Model):
 
         return all_column_groups_expression_totals
 
+    def _get_column_groups_max_workers(self, options, options_per_column_group):
+        """ Returns the number of column groups that can be evaluated concurrently, each on its own cursor.
+        This is capped by the account_reports.column_groups_max_workers system parameter (no concurrency if unset).
+
+        Concurrent evaluation is only possible when the current transaction didn't write anything yet: the other
+        cursors share its snapshot, but can't see its uncommitted changes. In test mode, all the cursors share the
+        transaction of the test, and thus its changes.
+        """
+        if len(options_per_column_group) < 2 or not self._is_column_groups_concurrency_allowed(options):
+            return 1
+
+        max_workers = int(self.env['ir.config_parameter'].sudo().get_param('account_reports.column_groups_max_workers', 0))
+        max_workers = min(max_workers, len(options_per_column_group))
+        if max_workers < 2:
+            return 1
+
+        self.env.flush_all()
+        if not self.pool.in_test_mode():
+            self._cr.execute("SELECT txid_current_if_assigned()")
+            if self._cr.fetchone()[0]:
+                return 1
+
+        return max_workers
+
+    def _is_column_groups_concurrency_allowed(self, options):
+        """ Tells whether the column groups can be evaluated on concurrent cursors with these options. The worker cursors
+        are read-only and don't see the temporary tables of the current transaction: this is not the case for options
+        shadowing account_move_line with such a table. Reports with a custom handler need it to opt in.
+        """
+        if self.custom_handler_model_name:
+            return self.env[self.custom_handler_model_name]._custom_column_groups_concurrency_allowed(self, options)
+        return True
+
+    def _compute_expression_totals_for_column_groups_concurrently(self, options_per_column_group, grouped_formulas, max_workers, forced_all_column_groups_expression_totals=None, offset=0, limit=None, warnings=None):
+        """ Evaluates _compute_expression_totals_for_single_column_group for each column group in a pool of max_workers threads.
+        Each thread uses its own read-only cursor, sharing the snapshot of the current transaction, so that all the column groups
+        see the same data as if they had been computed sequentially. The threads take their connections from the slots of
+        COLUMN_GROUPS_WORKERS_SEMAPHORE available: if less than two of them are, the column groups are evaluated sequentially.
+
+        :return: The totals, in the same format as _compute_expression_totals_for_each_column_group.
+        """
+        workers = 0
+        while workers < max_workers and COLUMN_GROUPS_WORKERS_SEMAPHORE.acquire(blocking=False):
+            workers += 1
+        try:
+            if workers < 2:
+                return self._compute_expression_totals_for_column_groups_sequentially(
+                    options_per_column_group,
+                    grouped_formulas,
+                    forced_all_column_groups_expression_totals=forced_all_column_groups_expression_totals,
+                    offset=offset,
+                    limit=limit,
+                    warnings=warnings,
+                )
+            return self._compute_expression_totals_for_column_groups_in_threads(
+                options_per_column_group,
+                grouped_formulas,
+                workers,
+                forced_all_column_groups_expression_totals=forced_all_column_groups_expression_totals,
+                offset=offset,
+                limit=limit,
+                warnings=warnings,
+            )
+        finally:
+            for dummy in range(workers):
+                COLUMN_GROUPS_WORKERS_SEMAPHORE.release()
+
+    def _compute_expression_totals_for_column_groups_in_threads(self, options_per_column_group, grouped_formulas, workers, forced_all_column_groups_expression_totals=None, offset=0, limit=None, warnings=None):
+        # In test mode, all the cursors share the connection, and thus the transaction, of the test
+        in_test_mode = self.pool.in_test_mode()
+        if not in_test_mode:
+            self._cr.execute("SELECT pg_export_snapshot()")
+            snapshot_id = self._cr.fetchone()[0]
+        dbname = self._cr.dbname
+
+        def rebind_records(records_dict, env):
+            return {records.with_env(env): value for records, value in records_dict.items()}
+
+        def compute_column_group(group_key, group_options):
+            threading.current_thread().dbname = dbname
+            # Each thread has its own warnings, merged by the calling thread
+            group_warnings = {} if warnings is not None else None
+            with self.pool.cursor() as cr:
+                if not in_test_mode:
+                    cr.execute("SET TRANSACTION SNAPSHOT %s", [snapshot_id])
+                    cr.execute("SET TRANSACTION READ ONLY")
+                env = api.Environment(cr, self.env.uid, {**self.env.context, 'account_report_readonly_cursor': True}, su=self.env.su)
+
+                worker_grouped_formulas = {
+                    engine: {
+                        grouping_key: {formula: expressions.with_env(env) for formula, expressions in formulas_dict.items()}
+                        for grouping_key, formulas_dict in engine_formulas.items()
+                    }
+                    for engine, engine_formulas in grouped_formulas.items()
+                }
+                forced_column_group_totals = (forced_all_column_groups_expression_totals or {}).get(group_key)
+
+                group_totals = self.with_env(env)._compute_expression_totals_for_single_column_group(
+                    group_options,
+                    worker_grouped_formulas,
+                    forced_column_group_expression_totals=forced_column_group_totals and rebind_records(forced_column_group_totals, env),
+                    offset=offset,
+                    limit=limit,
+                    warnings=group_warnings,
+                )
+                cr.rollback()
+
+            return rebind_records(group_totals, self.env), group_warnings
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                group_key: executor.submit(compute_column_group, group_key, group_options)
+                for group_key, group_options in options_per_column_group.items()
+            }
+            all_column_groups_expression_totals = {}
+            for group_key, future in futures.items():
+                all_column_groups_expression_totals[group_key], group_warnings = future.result()
+                for warning_key, warning_params in (group_warnings or {}).items():
+                    merged_params = warnings.setdefault(warning_key, {})
+                    for param, value in warning_params.items():
+                        if isinstance(value, list) and isinstance(merged_params.get(param), list):
+                            merged_params[param] += [item for item in value if item not in merged_params[param]]
+                        else:
+                            merged_params[param] = value
+            return all_column_groups_expression_totals
+
     def _standardize_date_scope_for_date_range(self, date_scope):
         """ Depending on the fact the report accepts date ranges or not, different date scopes might mean the same thing.
         This function is used so that, in those cases, only one of these date_scopes' values is used, to avoid useless creation
@@ -2905,10 +3087,21 @@ class AccountReport(models.Model):
 
         """
         engine_function_name = f'_compute_formula_batch_with_engine_{formula_engine}'
-        return getattr(self, engine_function_name)(
-            column_group_options, date_scope, formulas_dict, current_groupby, next_groupby,
-            offset=offset, limit=limit, warnings=warnings,
-        )
+
+        def compute_batch():
+            return getattr(self, engine_function_name)(
+                column_group_options, date_scope, formulas_dict, current_groupby, next_groupby,
+                offset=offset, limit=limit, warnings=warnings,
+            )
+
+        totals_cache = self.env['account.report.totals.cache']
+        if formula_engine in EXPRESSION_TOTALS_CACHE_ENGINES and totals_cache._is_enabled_for(column_group_options):
+            return totals_cache._get_or_compute(
+                self, column_group_options, formula_engine, date_scope, formulas_dict, current_groupby, next_groupby,
+                offset, limit, compute_batch,
+            )
+
+        return compute_batch()
 
     def _compute_formula_batch_with_engine_tax_tags(self, options, date_scope, formulas_dict, current_groupby, next_groupby, offset=0, limit=None, warnings=None):
         """ Report engine.
@@ -3024,25 +3217,41 @@ class AccountReport(models.Model):
                 line_domain = literal_eval(formula)
             except (ValueError, SyntaxError):
                 raise UserError(_("Invalid domain formula in expression %r of line %r: %s", expressions.label, expressions.report_line_id.name, formula))
-            tables, where_clause, where_params = self._query_get(options, date_scope, domain=line_domain)
+            all_query_res = None
+            if not offset and not limit:
+                # Whole months can be read from the pre-aggregated balances, if enabled
+                monthly_balances = self.env['account.report.monthly.balance']._read_balances(
+                    self, options, date_scope, [current_groupby] if current_groupby else [],
+                    domain=line_domain,
+                    count_distinct_field=next_groupby.split(',')[0] if next_groupby else None,
+                )
+                if monthly_balances is not None:
+                    all_query_res = [
+                        {**balance_res, 'grouping_key': balance_res.get(current_groupby)}
+                        for balance_res in monthly_balances
+                    ]
+
+            if all_query_res is None:
+                tables, where_clause, where_params = self._query_get(options, date_scope, domain=line_domain)
+
+                tail_query, tail_params = self._get_engine_query_tail(offset, limit)
+                query = f"""
+                    SELECT
+                        COALESCE(SUM(ROUND(account_move_line.balance * currency_table.rate, currency_table.precision)), 0.0) AS sum,
+                        COUNT(DISTINCT account_move_line.{next_groupby.split(',')[0] if next_groupby else 'id'}) AS count_rows
+                        {f', {groupby_sql} AS grouping_key' if groupby_sql else ''}
+                    FROM {tables}
+                    JOIN {ct_query} ON currency_table.company_id = account_move_line.company_id
+                    WHERE {where_clause}
+                    {f' GROUP BY {groupby_sql}' if groupby_sql else ''}
+                    {tail_query}
+                """
 
-            tail_query, tail_params = self._get_engine_query_tail(offset, limit)
-            query = f"""
-                SELECT
-                    COALESCE(SUM(ROUND(account_move_line.balance * currency_table.rate, currency_table.precision)), 0.0) AS sum,
-                    COUNT(DISTINCT account_move_line.{next_groupby.split(',')[0] if next_groupby else 'id'}) AS count_rows
-                    {f', {groupby_sql} AS grouping_key' if groupby_sql else ''}
-                FROM {tables}
-                JOIN {ct_query} ON currency_table.company_id = account_move_line.company_id
-                WHERE {where_clause}
-                {f' GROUP BY {groupby_sql}' if groupby_sql else ''}
-                {tail_query}
-            """
+                self._cr.execute(query, where_params + tail_params)
+                all_query_res = self._cr.dictfetchall()
 
             # Fetch the results.
             formula_rslt = []
-            self._cr.execute(query, where_params + tail_params)
-            all_query_res = self._cr.dictfetchall()
 
             total_sum = 0
             for query_res in all_query_res:
@@ -3198,32 +3407,51 @@ class AccountReport(models.Model):
             accounts_prefix_map[account_id].append(tuple(prefix))
 
         # Run main query
-        tables, where_clause, where_params = self._query_get(options, date_scope)
+        all_query_res = None
+        if not offset and not limit:
+            # Whole months can be read from the pre-aggregated balances, if enabled
+            monthly_balances = self.env['account.report.monthly.balance']._read_balances(
+                self, options, date_scope, ['account_id'] + ([current_groupby] if current_groupby else []),
+            )
+            if monthly_balances is not None:
+                all_query_res = [
+                    {
+                        'account_id': balance_res['account_id'],
+                        'sum': balance_res['sum'],
+                        'aml_count': balance_res['count_rows'],
+                        'grouping_key': balance_res.get(current_groupby),
+                    }
+                    for balance_res in monthly_balances
+                ]
 
-        currency_table_query = self._get_query_currency_table(options)
-        extra_groupby_sql = f', account_move_line.{current_groupby}' if current_groupby else ''
-        extra_select_sql = f', account_move_line.{current_groupby} AS grouping_key' if current_groupby else ''
-        tail_query, tail_params = self._get_engine_query_tail(offset, limit)
+        if all_query_res is None:
+            tables, where_clause, where_params = self._query_get(options, date_scope)
 
-        query = f"""
-            SELECT
-                account_move_line.account_id AS account_id,
-                SUM(ROUND(account_move_line.balance * currency_table.rate, currency_table.precision)) AS sum,
-                COUNT(account_move_line.id) AS aml_count
-                {extra_select_sql}
-            FROM {tables}
-            JOIN {currency_table_query} ON currency_table.company_id = account_move_line.company_id
-            WHERE {where_clause}
-            GROUP BY account_move_line.account_id{extra_groupby_sql}
-            {tail_query}
-        """
-        self._cr.execute(query, where_params + tail_params)
+            currency_table_query = self._get_query_currency_table(options)
+            extra_groupby_sql = f', account_move_line.{current_groupby}' if current_groupby else ''
+            extra_select_sql = f', account_move_line.{current_groupby} AS grouping_key' if current_groupby else ''
+            tail_query, tail_params = self._get_engine_query_tail(offset, limit)
+
+            query = f"""
+                SELECT
+                    account_move_line.account_id AS account_id,
+                    SUM(ROUND(account_move_line.balance * currency_table.rate, currency_table.precision)) AS sum,
+                    COUNT(account_move_line.id) AS aml_count
+                    {extra_select_sql}
+                FROM {tables}
+                JOIN {currency_table_query} ON currency_table.company_id = account_move_line.company_id
+                WHERE {where_clause}
+                GROUP BY account_move_line.account_id{extra_groupby_sql}
+                {tail_query}
+            """
+            self._cr.execute(query, where_params + tail_params)
+            all_query_res = self._cr.dictfetchall()
 
         # Parse result
         rslt = {}
 
         res_by_prefix_account_id = {}
-        for query_res in self._cr.dictfetchall():
+        for query_res in all_query_res:
             # Done this way so that we can run similar code for groupby and non-groupby
             grouping_key = query_res['grouping_key'] if current_groupby else None
             account_id = query_res['account_id']
@@ -4783,7 +5011,180 @@ class AccountReport(models.Model):
             'file_type': 'xlsx',
         }
 
+    def export_to_xlsx_stream(self, options):
+        """ Variant of export_to_xlsx meant for very large reports (typically fully unfolded ledgers). The unfolded lines are
+        computed chunk by chunk, using the load more mechanism, and directly written in a temporary file by xlsxwriter's
+        constant_memory mode, so that the memory usage doesn't depend on the number of lines.
+
+        The lines aren't sorted according to options['order_column'], and the account codes are only split from their names
+        if the top-level lines of the report are accounts.
+
+        :return: The usual file generator result, with file_content being the temporary file, to be streamed to the client
+            (see _get_stream_export_output).
+        """
+        self.ensure_one()
+        output = self._get_stream_export_output()
+        workbook = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+        })
+
+        print_options = self.get_options(previous_options={**options, 'export_mode': 'print'})
+        if print_options['sections']:
+            reports_to_print = self.env['account.report'].browse([section['id'] for section in print_options['sections']])
+        else:
+            reports_to_print = self
+
+        for report in reports_to_print:
+            report_options = report.get_options(previous_options={**print_options, 'selected_section_id': report.id})
+            print_mode_report = report.with_context(no_format=True)
+            top_level_lines = print_mode_report._get_lines(print_mode_report._get_stream_export_options(report_options))
+            split_account_names = any(report._get_model_info_from_id(line['id'])[0] == 'account.account' for line in top_level_lines)
+            report._write_lines_into_xlsx_sheet(
+                report_options,
+                workbook,
+                workbook.add_worksheet(report.name[:31]),
+                print_mode_report._iter_lines_for_stream_export(report_options, top_level_lines),
+                split_account_names,
+            )
+
+        workbook.close()
+
+        return {
+            'file_name': self.get_default_report_filename(options, 'xlsx'),
+            'file_content': self._get_stream_export_file_content(output),
+            'file_type': 'xlsx',
+        }
+
+    def export_to_csv(self, options):
+        """ Exports the report as CSV, computing and writing the unfolded lines chunk by chunk, in the same way as export_to_xlsx_stream.
+
+        :return: The usual file generator result, with file_content being the temporary file, to be streamed to the client
+            (see _get_stream_export_output).
+        """
+        self.ensure_one()
+        output = io.TextIOWrapper(self._get_stream_export_output(), encoding='utf-8', newline='')
+        writer = csv.writer(output)
+
+        print_options = self.get_options(previous_options={**options, 'export_mode': 'print'})
+        if print_options['sections']:
+            reports_to_print = self.env['account.report'].browse([section['id'] for section in print_options['sections']])
+        else:
+            reports_to_print = self
+
+        for report in reports_to_print:
+            report_options = report.get_options(previous_options={**print_options, 'selected_section_id': report.id})
+            if len(reports_to_print) > 1:
+                writer.writerow([report.name])
+
+            writer.writerow(['', *(column.get('name', '') for column in report_options['columns'])])
+
+            print_mode_report = report.with_context(no_format=True)
+            top_level_lines = print_mode_report._get_lines(print_mode_report._get_stream_export_options(report_options))
+            for line in print_mode_report._iter_lines_for_stream_export(report_options, top_level_lines):
+                writer.writerow([line.get('name', ''), *(column.get('name', '') for column in line['columns'])])
+
+        output.flush()
+
+        return {
+            'file_name': self.get_default_report_filename(options, 'csv'),
+            'file_content': self._get_stream_export_file_content(output.detach()),
+            'file_type': 'csv',
+        }
+
+    def _get_stream_export_output(self):
+        """ Returns the binary file the streamed exports are written in: a temporary file, streamed to the client without
+        being loaded in memory, or an in-memory file with the 'account_report_export_in_memory' context key, used when the
+        export is saved as an attachment (see account_reports.export.wizard), whose content is held in memory anyway.
+        """
+        if self._context.get('account_report_export_in_memory'):
+            return io.BytesIO()
+        return tempfile.TemporaryFile()
+
+    def _get_stream_export_file_content(self, output):
+        """ Returns the file_content of a streamed export written in output (see _get_stream_export_output). """
+        if isinstance(output, io.BytesIO):
+            return output.getvalue()
+        output.seek(0)
+        return output
+
+    def _get_stream_export_options(self, options):
+        """ Returns the options to use to compute the lines of a streamed export: the lines are computed folded, with no
+        'print' export mode, so that the expand functions apply the load more limit.
+        """
+        return {
+            **options,
+            'export_mode': None,
+            'unfold_all': False,
+            'unfolded_lines': [],
+        }
+
+    def _iter_lines_for_stream_export(self, options, top_level_lines):
+        """ Yields the lines to export with options, expanding the unfolded ones one chunk at a time.
+
+        :param options:         The options of the export, defining the lines to unfold.
+        :param top_level_lines: The lines returned by _get_lines with the options obtained from _get_stream_export_options.
+        """
+        stream_options = self._get_stream_export_options(options)
+        unfolded_line_ids = set(options.get('unfolded_lines', []))
+
+        def is_unfolded(line_dict):
+            return line_dict.get('unfoldable') and (options['unfold_all'] or line_dict['id'] in unfolded_line_ids)
+
+        def iter_line(line_dict):
+            if not is_unfolded(line_dict) or not line_dict.get('expand_function'):
+                yield line_dict
+                return
+
+            yield {**line_dict, 'unfolded': True}
+
+            offset = 0
+            progress = line_dict.get('progress')
+            while True:
+                sublines = self.get_expanded_lines(stream_options, line_dict['id'], line_dict.get('groupby'), line_dict['expand_function'], progress, offset)
+                load_more_line = None
+                for subline in sublines:
+                    if self._get_markup(subline['id']) == 'load_more':
+                        # The lines after the load more line are always added at the end of the expansion (after_load_more_lines):
+                        # they will be yielded with the last chunk.
+                        load_more_line = subline
+                        break
+                    yield from iter_line(subline)
+
+                if not load_more_line:
+                    break
+
+                offset = load_more_line['offset']
+                progress = load_more_line['progress']
+
+        # Same as _filter_out_folded_children, for the static lines
+        folded_line_ids = set()
+        for line in top_level_lines:
+            if line.get('unfoldable') and not is_unfolded(line):
+                folded_line_ids.add(line['id'])
+
+            if line.get('parent_id') not in folded_line_ids:
+                yield from iter_line(line)
+
     def _inject_report_into_xlsx_sheet(self, options, workbook, sheet):
+        print_mode_self = self.with_context(no_format=True)
+        lines = self._filter_out_folded_children(print_mode_self._get_lines(options))
+
+        # For reports with lines generated for accounts, the account name and codes are shown in a single column.
+        # To help user post-process the report if they need, we should in such a case split the account name and code in two columns.
+        split_account_names = any(self._get_model_info_from_id(line['id'])[0] == 'account.account' for line in lines)
+
+        if options.get('order_column'):
+            lines = self.sort_lines(lines, options)
+
+        self._write_lines_into_xlsx_sheet(options, workbook, sheet, lines, split_account_names)
+
+    def _write_lines_into_xlsx_sheet(self, options, workbook, sheet, lines, split_account_names):
+        """ Writes the headers, then the provided lines into an xlsx sheet.
+
+        :param lines:               An iterable of line dicts, in the order they need to be written. It is iterated only once.
+        :param split_account_names: Whether the codes of the account lines should be written in a separate column.
+        """
         def write_with_colspan(sheet, x, y, value, colspan, style):
             if colspan == 1:
                 sheet.write(y, x, value, style)
@@ -4804,27 +5205,15 @@ class AccountReport(models.Model):
         level_3_col1_total_style = workbook.add_format({'font_name': 'Arial', 'bold': True, 'font_size': 12, 'font_color': '#666666', 'indent': 1})
         level_3_style = workbook.add_format({'font_name': 'Arial', 'font_size': 12, 'font_color': '#666666'})
 
-        print_mode_self = self.with_context(no_format=True)
-        lines = self._filter_out_folded_children(print_mode_self._get_lines(options))
-
-        # For reports with lines generated for accounts, the account name and codes are shown in a single column.
-        # To help user post-process the report if they need, we should in such a case split the account name and code in two columns.
-        account_lines_split_names = {}
-        for line in lines:
-            line_model = self._get_model_info_from_id(line['id'])[0]
-            if line_model == 'account.account':
-                # Reuse the _split_code_name to split the name and code in two values.
-                account_lines_split_names[line['id']] = self.env['account.account']._split_code_name(line['name'])
-
         # Set the first column width to 50.
         # If we have account lines and split the name and code in two columns, we will also set the second column.
-        if len(account_lines_split_names) > 0:
+        if split_account_names:
             sheet.set_column(0, 0, 11)
             sheet.set_column(1, 1, 50)
         else:
             sheet.set_column(0, 0, 50)
 
-        original_x_offset = 1 if len(account_lines_split_names) > 0 else 0
+        original_x_offset = 1 if split_account_names else 0
 
         y_offset = 0
         # 1 and not 0 to leave space for the line name. original_x_offset allows making place for the code column if needed.
@@ -4856,13 +5245,11 @@ class AccountReport(models.Model):
             x_offset += colspan
         y_offset += 1
 
-        if options.get('order_column'):
-            lines = self.sort_lines(lines, options)
-
         # Add lines.
-        for y in range(0, len(lines)):
-            level = lines[y].get('level')
-            if lines[y].get('caret_options'):
+        account_codes = {}  # {line id: account code}, for the account lines already written
+        for y, line in enumerate(lines):
+            level = line.get('level')
+            if line.get('caret_options'):
                 style = level_3_style
                 col1_style = level_3_col1_style
             elif level == 0:
@@ -4874,39 +5261,41 @@ class AccountReport(models.Model):
                 col1_style = style
             elif level == 2:
                 style = level_2_style
-                col1_style = 'total' in lines[y].get('class', '').split(' ') and level_2_col1_total_style or level_2_col1_style
+                col1_style = 'total' in line.get('class', '').split(' ') and level_2_col1_total_style or level_2_col1_style
             elif level == 3:
                 style = level_3_style
-                col1_style = 'total' in lines[y].get('class', '').split(' ') and level_3_col1_total_style or level_3_col1_style
+                col1_style = 'total' in line.get('class', '').split(' ') and level_3_col1_total_style or level_3_col1_style
             else:
                 style = default_style
                 col1_style = default_col1_style
 
             # write the first column, with a specific style to manage the indentation
             x_offset = original_x_offset + 1
-            if lines[y]['id'] in account_lines_split_names:
-                code, name = account_lines_split_names[lines[y]['id']]
+            if split_account_names and self._get_model_info_from_id(line['id'])[0] == 'account.account':
+                # Reuse the _split_code_name to split the name and code in two values.
+                code, name = self.env['account.account']._split_code_name(line['name'])
+                account_codes[line['id']] = code
                 sheet.write(y + y_offset, x_offset - 2, code, col1_style)
                 sheet.write(y + y_offset, x_offset - 1, name, col1_style)
             else:
-                if lines[y].get('parent_id') and lines[y]['parent_id'] in account_lines_split_names:
-                    sheet.write(y + y_offset, x_offset - 2, account_lines_split_names[lines[y]['parent_id']][0], col1_style)
-                cell_type, cell_value = self._get_cell_type_value(lines[y])
+                if line.get('parent_id') and line['parent_id'] in account_codes:
+                    sheet.write(y + y_offset, x_offset - 2, account_codes[line['parent_id']], col1_style)
+                cell_type, cell_value = self._get_cell_type_value(line)
                 if cell_type == 'date':
                     sheet.write_datetime(y + y_offset, x_offset - 1, cell_value, date_default_col1_style)
                 else:
                     sheet.write(y + y_offset, x_offset - 1, cell_value, col1_style)
 
             #write all the remaining cells
-            columns = lines[y]['columns']
-            if options['show_growth_comparison'] and 'growth_comparison_data' in lines[y]:
-                columns += [lines[y].get('growth_comparison_data')]
+            columns = line['columns']
+            if options['show_growth_comparison'] and 'growth_comparison_data' in line:
+                columns += [line.get('growth_comparison_data')]
             for x, column in enumerate(columns, start=x_offset):
                 cell_type, cell_value = self._get_cell_type_value(column)
                 if cell_type == 'date':
-                    sheet.write_datetime(y + y_offset, x + lines[y].get('colspan', 1) - 1, cell_value, date_default_style)
+                    sheet.write_datetime(y + y_offset, x + line.get('colspan', 1) - 1, cell_value, date_default_style)
                 else:
-                    sheet.write(y + y_offset, x + lines[y].get('colspan', 1) - 1, cell_value, style)
+                    sheet.write(y + y_offset, x + line.get('colspan', 1) - 1, cell_value, style)
 
     def _get_cell_type_value(self, cell):
         if 'date' not in cell.get('class', '') or not cell.get('name'):
@@ -4986,6 +5375,76 @@ class AccountReport(models.Model):
             'columns': line_columns,
         }
 
+    @api.model
+    def _get_partner_and_general_ledger_aml_order(self):
+        """ Helper giving the SQL order of the journal items displayed by general ledger and partner ledger. It is also the key
+        used to paginate them: each 'load more' seeks the items following the last displayed one, instead of skipping the
+        previous ones with an OFFSET.
+
+        The move names are compared with the "C" collation, ordering them by code point like the pages are cut in Python
+        (see _get_partner_and_general_ledger_aml_page), whatever the collation of the database.
+        """
+        return "account_move_line.date, COALESCE(account_move_line.move_name, '') COLLATE \"C\", account_move_line.id"
+
+    @api.model
+    def _get_partner_and_general_ledger_keyset_condition(self, cursor):
+        """ Helper to restrict the journal items of general ledger and partner ledger to the ones following cursor.
+
+        :param cursor:  The (date, move name, id) of the last journal item of the previous page, or None for the first page.
+        :return:        (condition, params)
+        """
+        if not cursor:
+            return 'TRUE', []
+        return f"({self._get_partner_and_general_ledger_aml_order()}) > (%s::date, %s, %s)", list(cursor)
+
+    @api.model
+    def _get_partner_and_general_ledger_aml_page(self, rows, page_size, get_subquery_key):
+        """ Helper keeping the rows of the first page_size journal items of a general ledger or partner ledger line.
+
+        The rows of a line are fetched by several subqueries (one per column group, for example), each of them returning at most
+        page_size + 1 rows after the cursor. As a journal item can be returned by several subqueries, only the items whose rows are
+        all fetched can be part of the page: items following the last row of a truncated subquery are left to the next page.
+
+        :param rows:                The rows fetched for a single line, each of them having a 'date', 'move_name' and 'id' key.
+        :param page_size:           The maximum number of journal items in the page, or None to keep every row.
+        :param get_subquery_key:    Function returning, for a row, a key identifying the subquery it was fetched by. None means
+                                    this subquery wasn't limited.
+        :return:                    (page_rows, has_more, cursor) where cursor is the key of the last journal item of the page.
+        """
+        def get_aml_key(row):
+            return row['date'], row['move_name'] or '', row['id']
+
+        sorted_rows = sorted(rows, key=get_aml_key)
+        if not page_size:
+            return sorted_rows, False, None
+
+        rows_count_by_subquery = defaultdict(int)
+        last_key_by_subquery = {}
+        for row in sorted_rows:
+            subquery_key = get_subquery_key(row)
+            if subquery_key is not None:
+                rows_count_by_subquery[subquery_key] += 1
+                last_key_by_subquery[subquery_key] = get_aml_key(row)
+        truncated_keys = [last_key_by_subquery[subquery_key] for subquery_key, count in rows_count_by_subquery.items() if count > page_size]
+        first_incomplete_key = min(truncated_keys) if truncated_keys else None
+
+        page_rows = []
+        page_keys_count = 0
+        cursor = None
+        for row in sorted_rows:
+            aml_key = get_aml_key(row)
+            if aml_key != cursor:
+                if page_keys_count == page_size or (page_rows and first_incomplete_key and aml_key >= first_incomplete_key):
+                    return page_rows, True, (fields.Date.to_string(cursor[0]), *cursor[1:])
+                page_keys_count += 1
+                cursor = aml_key
+            page_rows.append(row)
+
+        if not first_incomplete_key:
+            return page_rows, False, None
+        # Only happens if a single journal item has more than page_size rows in a subquery.
+        return page_rows, True, (fields.Date.to_string(cursor[0]), *cursor[1:])
+
     def _compute_growth_comparison_column(self, options, value1, value2, green_on_positive=True):
         ''' Helper to get the additional columns due to the growth comparison feature. When only one comparison is
         requested, an additional column is there to show the percentage of growth based on the compared period.
@@ -5663,6 +6122,12 @@ class AccountReportCustomHandler(models.AbstractModel):
     def _custom_groupby_line_completer(self, report, options, line_dict):
         """ Postprocesses the dict generated by the group_by_line, to customize its content. """
 
+    def _custom_column_groups_concurrency_allowed(self, report, options):
+        """ To be overridden to allow evaluating the column groups of the report on concurrent read-only cursors, when the
+        handler's custom engines and options don't write anything in the database (temporary tables included).
+        """
+        return False
+
     def _custom_unfold_all_batch_data_generator(self, report, options, lines_to_expand_by_function):
         """ When using the 'unfold all' option, some reports might end up recomputing the same query for
         each line to unfold, leading to very inefficient computation. This function allows batching this computation,
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from psycopg2 import errors
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+# Engines whose results only depend on posted journal items and on the report configuration.
+# Their batch results can be shared between users and workers through account.report.totals.cache.
+EXPRESSION_TOTALS_CACHE_ENGINES = {'domain', 'account_codes', 'tax_tags'}
+
+# Options keys only used for rendering; they never influence the result of an engine.
+EXPRESSION_TOTALS_CACHE_IGNORED_OPTIONS = {
+    'buttons', 'column_groups', 'column_headers', 'columns', 'export_mode', 'owner_column_group', 'search_bar',
+    'sections', 'unfold_all', 'unfolded_lines', 'variants_source_id', 'available_variants', 'order_column',
+    'hierarchy', 'display_hierarchy_filter', 'hide_0_lines', 'show_growth_comparison', 'footnotes',
+}
+
+# Fields of the journal items that can be written once posted without changing the result of any engine.
+EXPRESSION_TOTALS_CACHE_IGNORED_AML_FIELDS = {'expected_pay_date', 'blocked'}
+
+# Default number of days an entry is kept, and default maximum number of entries ; see account.report.totals.cache._gc_entries()
+EXPRESSION_TOTALS_CACHE_DEFAULT_TTL_DAYS = 7
+EXPRESSION_TOTALS_CACHE_DEFAULT_MAX_ENTRIES = 10000
+
+# Per-database, per-process hit/miss counters ; see account.report.totals.cache._get_stats()
+EXPRESSION_TOTALS_CACHE_STATS = defaultdict(lambda: {'hit': 0, 'miss': 0, 'invalidated': 0})
+
+
+class AccountReportTotalsCache(models.Model):
+    """ Persisted results of account.report formula batches (domain, account_codes and tax_tags engines).
+
+    Entries are keyed on a hash of the report, the engine, the batched expressions, the normalized column group
+    options and the company set. As they are stored in the database, they are shared by all users and workers.
+    They are invalidated when moves of one of their companies are posted, reset to draft or modified within their date
+    range, and entirely when the configuration they depend on (accounts, tags, rates, expressions) changes.
+
+    Each entry keeps the snapshot of the transaction that computed it. Each invalidation is logged with the id of its
+    transaction in account.report.totals.cache.invalidation, so that an entry computed from a snapshot predating an
+    invalidation committed concurrently is never used, even though it was stored after the invalidation removed the
+    existing entries.
+    """
+    _name = 'account.report.totals.cache'
+    _description = "Accounting Report Expression Totals Cache"
+    _log_access = False
+
+    key = fields.Char(required=True)
+    report_id = fields.Many2one(comodel_name='account.report', required=True, ondelete='cascade')
+    company_ids = fields.Many2many(
+        comodel_name='res.company',
+        relation='account_report_totals_cache_company_rel',
+        column1='cache_id',
+        column2='company_id',
+    )
+    date_from = fields.Date()
+    date_to = fields.Date()
+    value = fields.Text(required=True)
+    snapshot = fields.Char(required=True)  # txid_snapshot of the transaction computing the entry
+    transaction_id = fields.Char()  # txid of the transaction computing the entry, if it made changes itself
+    computed_at = fields.Datetime(required=True, index=True)
+
+    _sql_constraints = [
+        ('key_uniq', 'UNIQUE(key)', "Each cache key must be unique."),
+    ]
+
+    @api.model
+    def _is_enabled_for(self, options):
+        """ Tells whether the formula batches computed with these options can be read from and stored in the cache.
+        Results depending on data that can change without a move being posted or reset to draft (draft entries,
+        reconciliation, analytic distribution, user-defined filters) are never cached.
+        """
+        if not self.env['ir.config_parameter'].sudo().get_param('account_reports.expression_totals_cache'):
+            return False
+
+        return not (
+            options.get('all_entries')
+            or options.get('unreconciled')
+            or options.get('analytic_accounts')
+            or options.get('analytic_groupby_option')
+            or any(filter_item['selected'] for filter_item in options.get('aml_ir_filters', []))
+        )
+
+    @api.model
+    def _get_key(self, report, options, formula_engine, date_scope, formulas_dict, current_groupby, next_groupby, offset, limit):
+        normalized_options = {
+            key: value
+            for key, value in options.items()
+            if key not in EXPRESSION_TOTALS_CACHE_IGNORED_OPTIONS
+        }
+        key_data = {
+            'report': report.id,
+            'engine': formula_engine,
+            'date_scope': date_scope,
+            'formulas': sorted((formula, sorted(expressions.ids)) for formula, expressions in formulas_dict.items()),
+            'current_groupby': current_groupby,
+            'next_groupby': next_groupby,
+            'offset': offset,
+            'limit': limit,
+            'companies': sorted(report.get_report_company_ids(options)),
+            'lang': self.env.user.lang,
+            'options': normalized_options,
+            # The journal items are read with the record rules of the user (see account.report's _query_get)
+            'uid': self.env.uid,
+            'su': self.env.su,
+            'groups': sorted(self.env.user.groups_id.ids),
+            'aml_rules': self._get_aml_rules_fingerprint(),
+        }
+        key_json = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(key_json.encode()).hexdigest()
+
+    @api.model
+    def _get_aml_rules_fingerprint(self):
+        """ Returns the record rules domain restricting the journal items the current user can read, evaluated for the
+        current companies, so that results are never shared between users seeing different journal items.
+        """
+        if self.env.su:
+            return None
+        return str(self.env['ir.rule']._compute_domain('account.move.line', 'read'))
+
+    @api.model
+    def _serialize_formula_results(self, formula_results):
+        """ Converts the result of a formula batch into JSON. Returns None if the result contains values
+        that can't be converted back to their original type (for example, dates used as grouping keys).
+        """
+        to_store = [
+            [formula, expressions.ids, result]
+            for (formula, expressions), result in formula_results.items()
+        ]
+        try:
+            return json.dumps(to_store)
+        except TypeError:
+            return None
+
+    @api.model
+    def _deserialize_formula_results(self, serialized):
+        formula_results = {}
+        for formula, expression_ids, result in json.loads(serialized):
+            if isinstance(result, list):
+                result = [(grouping_key, totals) for grouping_key, totals in result]
+            expressions = self.env['account.report.expression'].browse(expression_ids)
+            formula_results[(formula, expressions)] = result
+        return formula_results
+
+    @api.model
+    def _get_or_compute(self, report, options, formula_engine, date_scope, formulas_dict, current_groupby, next_groupby, offset, limit, compute_function):
+        """ Returns the result of compute_function() for this formula batch, reading it from the cache when possible.
+
+        :param compute_function: A callable without parameter, computing the formula batch (in the format returned by
+                                 account.report's _compute_formula_batch) when it is not found in the cache.
+        """
+        stats = EXPRESSION_TOTALS_CACHE_STATS[self.env.cr.dbname]
+        key = self._get_key(report, options, formula_engine, date_scope, formulas_dict, current_groupby, next_groupby, offset, limit)
+
+        self._cr.execute(
+            f"""
+                SELECT cache.value
+                  FROM account_report_totals_cache cache
+                 WHERE cache.key = %s
+                   AND cache.computed_at >= %s
+                   AND NOT EXISTS ({self._get_invalidations_query()})
+            """,
+            [key, fields.Datetime.now() - timedelta(days=self._get_ttl_days())],
+        )
+        cached = self._cr.fetchone()
+        if cached:
+            stats['hit'] += 1
+            return self._deserialize_formula_results(cached[0])
+
+        stats['miss'] += 1
+        formula_results = compute_function()
+
+        serialized = self._serialize_formula_results(formula_results)
+        # Column groups evaluated concurrently use read-only cursors (see account.report's
+        # _compute_expression_totals_for_column_groups_concurrently): their results can't be stored.
+        if serialized is not None and not self._context.get('account_report_readonly_cursor'):
+            company_ids = report.get_report_company_ids(options)
+            date_from, date_to, allow_include_initial_balance = report._get_date_bounds_info(options, date_scope)
+            if allow_include_initial_balance:
+                # The initial balance of some accounts is included, so that any earlier move can impact the result.
+                date_from = None
+            try:
+                with self._cr.savepoint(flush=False):
+                    # The entry of this key we didn't read is expired or invalidated for our snapshot: it is replaced.
+                    self._cr.execute("DELETE FROM account_report_totals_cache WHERE key = %s", [key])
+                    self._cr.execute(
+                        """
+                            WITH new_entry AS (
+                                INSERT INTO account_report_totals_cache (key, report_id, date_from, date_to, value, snapshot, transaction_id, computed_at)
+                                VALUES (
+                                    %s, %s, %s, %s, %s,
+                                    txid_current_snapshot()::text, txid_current_if_assigned()::text, NOW() AT TIME ZONE 'UTC'
+                                )
+                                RETURNING id
+                            )
+                            INSERT INTO account_report_totals_cache_company_rel (cache_id, company_id)
+                            SELECT new_entry.id, company.id
+                            FROM new_entry
+                            CROSS JOIN UNNEST(%s) AS company(id)
+                        """,
+                        [key, report.id, date_from, date_to, serialized, company_ids],
+                    )
+            except (errors.UniqueViolation, errors.SerializationFailure):
+                # Another worker stored or replaced the same entry concurrently.
+                _logger.debug("Account report totals cache entry %s stored concurrently", key)
+
+        return formula_results
+
+    @api.model
+    def _get_invalidations_query(self):
+        """ Returns the SQL condition (for a subquery) matching the invalidations of account_report_totals_cache_invalidation
+        which impact the entry aliased 'cache', and which its computation couldn't see (committed after its snapshot).
+        The changes of the transaction computing the entry are visible to it, even though they aren't in its snapshot.
+        """
+        return """
+            SELECT 1
+              FROM account_report_totals_cache_invalidation invalidation
+             WHERE NOT txid_visible_in_snapshot(invalidation.transaction_id::bigint, cache.snapshot::txid_snapshot)
+               AND invalidation.transaction_id IS DISTINCT FROM cache.transaction_id
+               AND (
+                   invalidation.company_id IS NULL
+                   OR invalidation.company_id IN (
+                       SELECT rel.company_id
+                         FROM account_report_totals_cache_company_rel rel
+                        WHERE rel.cache_id = cache.id
+                   )
+               )
+               AND (invalidation.date_to IS NULL OR cache.date_from IS NULL OR cache.date_from <= invalidation.date_to)
+               AND (invalidation.date_from IS NULL OR cache.date_to IS NULL OR cache.date_to >= invalidation.date_from)
+        """
+
+    @api.model
+    def _invalidate(self, companies=None, date_from=None, date_to=None):
+        """ Removes the cache entries impacted by a change in the ledger, and logs the change so that the entries computed
+        concurrently, without seeing it, are never used.
+
+        :param companies: The res.company whose entries must be invalidated. If not provided, the whole cache is cleared.
+        :param date_from: The first date impacted by the change. If not provided, no lower bound is applied.
+        :param date_to:   The last date impacted by the change. If not provided, no upper bound is applied.
+        """
+        self._cr.execute(
+            """
+                INSERT INTO account_report_totals_cache_invalidation (company_id, date_from, date_to, transaction_id, invalidated_at)
+                SELECT company.id, %s, %s, txid_current()::text, NOW() AT TIME ZONE 'UTC'
+                FROM UNNEST(%s::int[]) AS company(id)
+            """,
+            [date_from, date_to, companies.ids if companies is not None else [None]],
+        )
+        if companies is None:
+            self._cr.execute("DELETE FROM account_report_totals_cache")
+        else:
+            # An entry is impacted if its [date_from, date_to] range intersects [date_from, date_to] of the change.
+            self._cr.execute(
+                """
+                    DELETE FROM account_report_totals_cache cache
+                    USING account_report_totals_cache_company_rel rel
+                    WHERE rel.cache_id = cache.id
+                    AND rel.company_id = ANY(%(company_ids)s)
+                    AND (%(date_to)s::date IS NULL OR cache.date_from IS NULL OR cache.date_from <= %(date_to)s)
+                    AND (%(date_from)s::date IS NULL OR cache.date_to IS NULL OR cache.date_to >= %(date_from)s)
+                """,
+                {'company_ids': companies.ids, 'date_from': date_from, 'date_to': date_to},
+            )
+        if self._cr.rowcount:
+            EXPRESSION_TOTALS_CACHE_STATS[self.env.cr.dbname]['invalidated'] += self._cr.rowcount
+            _logger.debug("Invalidated %s account report totals cache entries", self._cr.rowcount)
+
+    @api.model
+    def _invalidate_for_moves(self, moves):
+        """ Invalidates the entries whose results depend on the provided moves. """
+        dates_per_company = defaultdict(list)
+        for move in moves:
+            dates_per_company[move.company_id].append(move.date)
+        for company, dates in dates_per_company.items():
+            self._invalidate(companies=company, date_from=min(dates), date_to=max(dates))
+
+    @api.model
+    def _get_ttl_days(self):
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'account_reports.expression_totals_cache_ttl_days', EXPRESSION_TOTALS_CACHE_DEFAULT_TTL_DAYS))
+
+    @api.autovacuum
+    def _gc_entries(self):
+        """ Removes the expired and invalidated entries, then the oldest ones above the maximum number of entries
+        (account_reports.expression_totals_cache_max_entries system parameter). The invalidations are kept one more day
+        than the entries they could impact, as a transaction computing an entry may start before the change it misses.
+        """
+        now = fields.Datetime.now()
+        ttl_days = self._get_ttl_days()
+        max_entries = int(self.env['ir.config_parameter'].sudo().get_param(
+            'account_reports.expression_totals_cache_max_entries', EXPRESSION_TOTALS_CACHE_DEFAULT_MAX_ENTRIES))
+        self._cr.execute(
+            f"""
+                DELETE FROM account_report_totals_cache cache
+                 WHERE cache.computed_at < %s
+                    OR EXISTS ({self._get_invalidations_query()})
+            """,
+            [now - timedelta(days=ttl_days)],
+        )
+        self._cr.execute(
+            """
+                DELETE FROM account_report_totals_cache
+                 WHERE id IN (
+                     SELECT id
+                       FROM account_report_totals_cache
+                   ORDER BY computed_at DESC
+                     OFFSET %s
+                 )
+            """,
+            [max_entries],
+        )
+        self._cr.execute(
+            "DELETE FROM account_report_totals_cache_invalidation WHERE invalidated_at < %s",
+            [now - timedelta(days=ttl_days + 1)],
+        )
+
+    @api.model
+    def _get_stats(self):
+        """ Returns the hit/miss/invalidation counters of the current process for this database,
+        together with the number of entries currently stored.
+        """
+        self._cr.execute("SELECT COUNT(*) FROM account_report_totals_cache")
+        return {
+            **EXPRESSION_TOTALS_CACHE_STATS[self.env.cr.dbname],
+            'entries': self._cr.fetchone()[0],
+        }
+
+
+class AccountReportTotalsCacheInvalidation(models.Model):
+    """ Log of the changes invalidating account.report.totals.cache entries, with the transaction making them. """
+    _name = 'account.report.totals.cache.invalidation'
+    _description = "Accounting Report Expression Totals Cache Invalidation"
+    _log_access = False
+
+    company_id = fields.Many2one(comodel_name='res.company', ondelete='cascade')  # All the companies if not set
+    date_from = fields.Date()
+    date_to = fields.Date()
+    transaction_id = fields.Char(required=True)  # txid_current() of the transaction making the change
+    invalidated_at = fields.Datetime(required=True, index=True)
+
+
+class AccountReportExpression(models.Model):
+    _inherit = 'account.report.expression'
+
+    def write(self, vals):
+        self.env['account.report.totals.cache']._invalidate()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env['account.report.totals.cache']._invalidate()
+        return super().unlink()
+
+
+class AccountMoveLine(models.Model):
+    _inherit = 'account.move.line'
+
+    def write(self, vals):
+        # Bank reconciliation, for example, changes the partner of posted journal items.
+        if vals.keys() - EXPRESSION_TOTALS_CACHE_IGNORED_AML_FIELDS:
+            posted_moves = self.filtered(lambda line: line.parent_state == 'posted').move_id
+            if posted_moves:
+                self.env['account.report.totals.cache']._invalidate_for_moves(posted_moves)
+        return super().write(vals)
+
+
+class AccountAccount(models.Model):
+    _inherit = 'account.account'
+
+    def write(self, vals):
+        if {'code', 'tag_ids', 'account_type'} & vals.keys():
+            self.env['account.report.totals.cache']._invalidate()
+        return super().write(vals)
+
+
+class ResCurrencyRate(models.Model):
+    _inherit = 'res.currency.rate'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.env['account.report.totals.cache']._invalidate()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env['account.report.totals.cache']._invalidate()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env['account.report.totals.cache']._invalidate()
+        return super().unlink()
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import logging
+from collections import defaultdict
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import api, fields, models, osv
+from odoo.tools import date_utils
+
+_logger = logging.getLogger(__name__)
+
+# Fields of account.move.line that are also available on account.report.monthly.balance. Domains only
+# targeting those fields (or their sub-fields, e.g. account_id.code) can be evaluated on the summary table.
+MONTHLY_BALANCE_DIMENSIONS = ('company_id', 'account_id', 'journal_id', 'partner_id', 'currency_id')
+
+# Columns of account_move_line whose change moves a journal item from a monthly balance to another, or in or out of them.
+MONTHLY_BALANCE_AML_FIELDS = {*MONTHLY_BALANCE_DIMENSIONS, 'date', 'balance', 'parent_state'}
+
+# System parameter enabling the monthly balances; the table is only maintained while it is set.
+MONTHLY_BALANCE_PARAM = 'account_reports.use_monthly_balances'
+
+
+class AccountReportMonthlyBalance(models.Model):
+    """ Pre-aggregated balances of the posted journal items, per (company, account, journal, partner, currency, month).
+
+    The table is only maintained while the account_reports.use_monthly_balances system parameter is set: it is filled
+    when the parameter is set, then maintained incrementally each time journal items are inserted, written or deleted
+    in the database. Hooking the low-level _create and _write of account.move.line also catches the recomputations of
+    stored fields (the state of their move, their date, their balance, ...) that never go through write(). The domain
+    and account_codes engines read the whole months of their date range from this table, and only query
+    account_move_line for the partial months at the edges of the range.
+    """
+    _name = 'account.report.monthly.balance'
+    _description = "Accounting Report Monthly Balance"
+    _log_access = False
+
+    company_id = fields.Many2one(comodel_name='res.company', required=True, readonly=True)
+    account_id = fields.Many2one(comodel_name='account.account', required=True, readonly=True)
+    journal_id = fields.Many2one(comodel_name='account.journal', required=True, readonly=True)
+    partner_id = fields.Many2one(comodel_name='res.partner', readonly=True)
+    currency_id = fields.Many2one(comodel_name='res.currency', required=True, readonly=True)
+    date = fields.Date(string="Month", required=True, readonly=True, help="First day of the month.")
+    balance = fields.Monetary(currency_field='company_currency_id', readonly=True)
+    company_currency_id = fields.Many2one(related='company_id.currency_id')
+    aml_count = fields.Integer(readonly=True)
+
+    def init(self):
+        self.env.cr.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS account_report_monthly_balance_unique_idx
+            ON account_report_monthly_balance (company_id, account_id, journal_id, COALESCE(partner_id, 0), currency_id, date)
+        """)
+        if self._is_maintained():
+            self.env.cr.execute("SELECT 1 FROM account_report_monthly_balance LIMIT 1")
+            if not self.env.cr.fetchone():
+                self._rebuild()
+
+    # -------------------------------------------------------------------------
+    # MAINTENANCE
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _rebuild(self):
+        """ Recomputes the whole table from the posted journal items. """
+        self.env['account.move.line'].flush_model(['company_id', 'account_id', 'journal_id', 'partner_id', 'currency_id', 'date', 'balance', 'parent_state'])
+        self.env.cr.execute("TRUNCATE account_report_monthly_balance")
+        self.env.cr.execute("""
+            INSERT INTO account_report_monthly_balance (company_id, account_id, journal_id, partner_id, currency_id, date, balance, aml_count)
+            SELECT
+                aml.company_id,
+                aml.account_id,
+                aml.journal_id,
+                aml.partner_id,
+                aml.currency_id,
+                DATE_TRUNC('month', aml.date)::date,
+                SUM(aml.balance),
+                COUNT(*)
+            FROM account_move_line aml
+            WHERE aml.parent_state = 'posted'
+            AND aml.account_id IS NOT NULL
+            GROUP BY aml.company_id, aml.account_id, aml.journal_id, aml.partner_id, aml.currency_id, DATE_TRUNC('month', aml.date)
+        """)
+        _logger.info("Rebuilt %s monthly balances for accounting reports", self.env.cr.rowcount)
+
+    @api.model
+    def _is_maintained(self):
+        return bool(self.env['ir.config_parameter'].sudo().get_param(MONTHLY_BALANCE_PARAM))
+
+    @api.model
+    def _reset(self):
+        """ Rebuilds the table when the monthly balances are enabled, empties it when they are disabled. """
+        if self._is_maintained():
+            self._rebuild()
+        else:
+            self.env.cr.execute("TRUNCATE account_report_monthly_balance")
+
+    @api.model
+    def _update_from_lines(self, line_ids, sign):
+        """ Adds (sign=1) or removes (sign=-1) the journal items with the provided ids from the monthly balances, as they
+        are currently stored in the database, if they are posted. Nothing is flushed, as this is called while flushing.
+        """
+        if line_ids and self._is_maintained():
+            self._update_from_journal_items("aml.id = ANY(%(record_ids)s) AND aml.parent_state = 'posted'", list(line_ids), sign)
+
+    @api.model
+    def _update_from_journal_items(self, where_clause, record_ids, sign):
+        self.env.cr.execute(f"""
+            INSERT INTO account_report_monthly_balance (company_id, account_id, journal_id, partner_id, currency_id, date, balance, aml_count)
+            SELECT
+                aml.company_id,
+                aml.account_id,
+                aml.journal_id,
+                aml.partner_id,
+                aml.currency_id,
+                DATE_TRUNC('month', aml.date)::date,
+                %(sign)s * SUM(aml.balance),
+                %(sign)s * COUNT(*)
+            FROM account_move_line aml
+            WHERE {where_clause}
+            AND aml.account_id IS NOT NULL
+            GROUP BY aml.company_id, aml.account_id, aml.journal_id, aml.partner_id, aml.currency_id, DATE_TRUNC('month', aml.date)
+            ON CONFLICT (company_id, account_id, journal_id, COALESCE(partner_id, 0), currency_id, date)
+            DO UPDATE SET
+                balance = account_report_monthly_balance.balance + EXCLUDED.balance,
+                aml_count = account_report_monthly_balance.aml_count + EXCLUDED.aml_count
+            RETURNING id, aml_count
+        """, {'sign': sign, 'record_ids': record_ids})
+
+        # Only the balances just updated may have no journal item left.
+        empty_balance_ids = [balance_id for balance_id, aml_count in self.env.cr.fetchall() if aml_count <= 0]
+        if empty_balance_ids:
+            self.env.cr.execute("DELETE FROM account_report_monthly_balance WHERE id = ANY(%s)", [empty_balance_ids])
+
+    # -------------------------------------------------------------------------
+    # ENGINES
+    # -------------------------------------------------------------------------
+
+    @api.model
+    def _is_domain_supported(self, domain):
+        """ Tells whether the provided account.move.line domain can be evaluated on this table. """
+        for leaf in domain:
+            if not osv.expression.is_leaf(leaf) or leaf in (osv.expression.TRUE_LEAF, osv.expression.FALSE_LEAF):
+                continue
+            if leaf[0].split('.')[0] not in MONTHLY_BALANCE_DIMENSIONS:
+                return False
+        return True
+
+    @api.model
+    def _get_full_months_bounds(self, date_from, date_to):
+        """ Returns the first day of the first and last whole months included in [date_from, date_to], or (None, None)
+        if the range doesn't contain any whole month. date_from being None means the range has no lower bound.
+        """
+        if date_from:
+            first_month = date_utils.start_of(date_from, 'month')
+            if first_month != date_from:
+                first_month += relativedelta(months=1)
+        else:
+            first_month = None
+
+        last_month = date_utils.start_of(date_to, 'month')
+        if date_utils.end_of(date_to, 'month') != date_to:
+            last_month -= relativedelta(months=1)
+
+        if first_month and first_month > last_month:
+            return None, None
+        return first_month, last_month
+
+    @api.model
+    def _read_balances(self, report, options, date_scope, groupby_fields, domain=None, count_distinct_field=None):
+        """ Equivalent of grouping the journal items matching the report options and domain by groupby_fields, and
+        summing their balance. Whole months are read from this table, partial months from account_move_line.
+
+        :param groupby_fields:          The account.move.line fields to group by. They must all be in MONTHLY_BALANCE_DIMENSIONS.
+        :param domain:                  An additional domain on account.move.line.
+        :param count_distinct_field:    If set, the number of distinct values of this field is returned as 'count_rows'.
+                                        Else, 'count_rows' is the number of journal items.
+        :return: None if the summary table can't be used for this computation. Else, a list of dict with one key per groupby field,
+                 plus 'sum' and 'count_rows'.
+        """
+        domain = domain or []
+        if (
+            not self._is_maintained()
+            or not report._is_monthly_balance_summary_allowed(options)
+            or any(field not in MONTHLY_BALANCE_DIMENSIONS for field in groupby_fields)
+            or (count_distinct_field and count_distinct_field not in MONTHLY_BALANCE_DIMENSIONS)
+        ):
+            return None
+
+        # The summary stores raw balances: it can only be used if the currency table doesn't convert anything.
+        companies = self.env['res.company'].browse(report.get_report_company_ids(options))
+        if companies.currency_id != self.env.company.currency_id:
+            return None
+
+        # The journal items are read with the record rules of the user (see account.report's _query_get): they must only
+        # target the dimensions kept in the summary table for it to be used.
+        rules_domain = [] if self.env.su else self.env['ir.rule']._compute_domain('account.move.line', 'read')
+        filters_domain = [
+            *rules_domain,
+            ('company_id', 'in', companies.ids),
+            *report._get_options_journals_domain(options),
+            *report._get_options_partner_domain(options),
+            *report._get_options_fiscal_position_domain(options),
+            *report._get_options_account_type_domain(options),
+            *report._get_options_aml_ir_filters(options),
+            *(report.env['account.move.line']._get_tax_exigible_domain() if report.only_tax_exigible else []),
+            *options.get('forced_domain', []),
+            *domain,
+        ]
+        if not self._is_domain_supported(filters_domain):
+            return None
+
+        date_from, date_to, allow_include_initial_balance = report._get_date_bounds_info(options, date_scope)
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to)
+        first_month, last_month = self._get_full_months_bounds(date_from, date_to)
+        if not last_month:
+            return None
+
+        # Whole months, from the summary table.
+        summary_domain = filters_domain + [('date', '<=', last_month)]
+        if first_month:
+            if allow_include_initial_balance:
+                summary_domain += ['|', ('date', '>=', first_month), ('account_id.include_initial_balance', '=', True)]
+            else:
+                summary_domain.append(('date', '>=', first_month))
+        subqueries = [(True, summary_domain)]
+
+        # Partial months, from the journal items.
+        if first_month and date_from < first_month:
+            head_domain = domain + [('date', '<', first_month)]
+            if allow_include_initial_balance:
+                # The whole first month of those accounts is already read from the summary table.
+                head_domain.append(('account_id.include_initial_balance', '=', False))
+            subqueries.append((False, head_domain))
+        if last_month + relativedelta(months=1) <= date_to:
+            subqueries.append((False, domain + [('date', '>=', last_month + relativedelta(months=1))]))
+
+        results = defaultdict(lambda: {'sum': 0.0, 'count_rows': 0, 'count_values': set()})
+        for from_summary, source_domain in subqueries:
+            if from_summary:
+                tables, where_clause, where_params = self._where_calc(source_domain).get_sql()
+                table = self._table
+                count_sql = f'SUM("{table}".aml_count)'
+            else:
+                tables, where_clause, where_params = report._query_get(options, date_scope, domain=source_domain)
+                table = 'account_move_line'
+                count_sql = f'COUNT("{table}".id)'
+
+            if count_distinct_field:
+                count_sql = f'ARRAY_AGG(DISTINCT "{table}".{count_distinct_field})'
+            select_groupby = ''.join(f', "{table}".{field} AS {field}' for field in groupby_fields)
+            groupby_sql = ', '.join(f'"{table}".{field}' for field in groupby_fields)
+            self.env.cr.execute(f"""
+                SELECT
+                    COALESCE(SUM("{table}".balance), 0.0) AS sum,
+                    {count_sql} AS count_rows
+                    {select_groupby}
+                FROM {tables}
+                WHERE {where_clause}
+                {f'GROUP BY {groupby_sql}' if groupby_sql else ''}
+            """, where_params)
+
+            for query_res in self.env.cr.dictfetchall():
+                if query_res['count_rows'] is None:
+                    # Aggregate without GROUP BY on an empty set
+                    continue
+                group_key = tuple(query_res[field] for field in groupby_fields)
+                group_res = results[group_key]
+                group_res['sum'] += query_res['sum']
+                if count_distinct_field:
+                    group_res['count_values'].update(query_res['count_rows'])
+                else:
+                    group_res['count_rows'] += query_res['count_rows']
+
+        company_currency = self.env.company.currency_id
+        return [
+            {
+                **dict(zip(groupby_fields, group_key)),
+                'sum': company_currency.round(group_res['sum']),
+                'count_rows': len(group_res['count_values']) if count_distinct_field else group_res['count_rows'],
+            }
+            for group_key, group_res in results.items()
+        ]
+
+
+class AccountMoveLine(models.Model):
+    _inherit = 'account.move.line'
+
+    def _create(self, data_list):
+        lines = super()._create(data_list)
+        self.env['account.report.monthly.balance']._update_from_lines(lines.ids, 1)
+        return lines
+
+    def _write(self, vals):
+        # Called with the new values of the columns when flushing, write() and recomputations alike: the database still
+        # holds the previous values, including the previous state of their move.
+        if not MONTHLY_BALANCE_AML_FIELDS & vals.keys():
+            return super()._write(vals)
+        MonthlyBalance = self.env['account.report.monthly.balance']
+        MonthlyBalance._update_from_lines(self.ids, -1)
+        res = super()._write(vals)
+        MonthlyBalance._update_from_lines(self.ids, 1)
+        return res
+
+    def unlink(self):
+        self.flush_recordset()
+        self.env['account.report.monthly.balance']._update_from_lines(self.ids, -1)
+        return super().unlink()
+
+
+class IrConfigParameter(models.Model):
+    _inherit = 'ir.config_parameter'
+
+    def _reset_monthly_balances_if_toggled(self, was_maintained):
+        MonthlyBalance = self.env['account.report.monthly.balance']
+        if MonthlyBalance._is_maintained() != was_maintained:
+            MonthlyBalance._reset()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        was_maintained = self.env['account.report.monthly.balance']._is_maintained()
+        params = super().create(vals_list)
+        params._reset_monthly_balances_if_toggled(was_maintained)
+        return params
+
+    def write(self, vals):
+        was_maintained = self.env['account.report.monthly.balance']._is_maintained()
+        res = super().write(vals)
+        self._reset_monthly_balances_if_toggled(was_maintained)
+        return res
+
+    def unlink(self):
+        was_maintained = self.env['account.report.monthly.balance']._is_maintained()
+        res = super().unlink()
+        self.env['ir.config_parameter']._reset_monthly_balances_if_toggled(was_maintained)
+        return res
@@ -7,6 +7,8 @@ from odoo import fields, Command
 from odoo.tests import tagged
 from freezegun import freeze_time
 
+import csv
+import io
 import json
 
 @tagged('post_install', '-at_install')
@@ -369,6 +371,140 @@ class TestGeneralLedgerReport(TestAccountReportsCommon, odoo.tests.HttpCase):
             options,
         )
 
+    def test_general_ledger_load_more_unfold_all(self):
+        ''' Test the load more of the unfolded accounts continues after the last displayed journal item, even if journal items
+        are posted before it in the meantime.
+        '''
+        self.env.companies = self.env.company
+        self.report.load_more_limit = 2
+
+        options = self._generate_options(self.report, fields.Date.from_string('2017-01-01'), fields.Date.from_string('2017-12-31'))
+        options['unfold_all'] = True
+        revenue_line_id = self.report._get_generic_line_id('account.account', self.company_data['default_account_revenue'].id)
+
+        report_lines = self.report._get_lines(options)
+        revenue_sublines = [line for line in report_lines if line.get('parent_id') == revenue_line_id]
+
+        self.assertLinesValues(
+            revenue_sublines,
+            #   Name                                    Debit           Credit          Balance
+            [   0,                                      4,              5,              6],
+            [
+                ('INV/2017/00001',                      2000.0,         0.0,            2000.0),
+                ('INV/2017/00001',                      3000.0,         0.0,            5000.0),
+                ('Load more...',                        '',             '',             ''),
+                ('Total 400000 Product Sales',          20000.0,        0.0,            20000.0),
+            ],
+            options,
+        )
+
+        # Sorted before the journal items already displayed.
+        self.env['account.move'].create({
+            'move_type': 'entry',
+            'date': fields.Date.from_string('2017-01-01'),
+            'journal_id': self.company_data['default_journal_bank'].id,
+            'line_ids': [
+                (0, 0, {'debit': 1000.0,    'credit': 0.0,      'name': '2017_3_1',     'account_id': self.company_data['default_account_revenue'].id}),
+                (0, 0, {'debit': 0.0,       'credit': 1000.0,   'name': '2017_3_2',     'account_id': self.company_data['default_account_expense'].id}),
+            ],
+        }).action_post()
+
+        load_more_line = revenue_sublines[2]
+        load_more_1 = self.report._expand_unfoldable_line('_report_expand_unfoldable_line_general_ledger', revenue_line_id, load_more_line['groupby'], options, load_more_line['progress'], load_more_line['offset'])
+
+        self.assertLinesValues(
+            load_more_1,
+            #   Name                                    Debit           Credit          Balance
+            [   0,                                      4,              5,              6],
+            [
+                ('INV/2017/00001',                      4000.0,         0.0,            9000.0),
+                ('INV/2017/00001',                      5000.0,         0.0,            14000.0),
+                ('Load more...',                        '',             '',             ''),
+            ],
+            options,
+        )
+
+    def test_general_ledger_load_more_move_names(self):
+        ''' Test the load more follows the order of the move names by code point, whatever the collation of the database
+        (which may sort 'a/1' before 'B/1').
+        '''
+        self.env.companies = self.env.company
+        self.report.load_more_limit = 2
+        account = self.env['account.account'].create({
+            'code': '400099',
+            'name': 'Load More Sales',
+            'account_type': 'income',
+        })
+        for move_name in ('a/1', 'B/1', 'C/1'):
+            self.env['account.move'].create({
+                'move_type': 'entry',
+                'name': move_name,
+                'date': fields.Date.from_string('2017-03-01'),
+                'journal_id': self.company_data['default_journal_misc'].id,
+                'line_ids': [
+                    (0, 0, {'debit': 100.0,     'credit': 0.0,      'account_id': account.id}),
+                    (0, 0, {'debit': 0.0,       'credit': 100.0,    'account_id': self.company_data['default_account_expense'].id}),
+                ],
+            }).action_post()
+
+        options = self._generate_options(self.report, fields.Date.from_string('2017-01-01'), fields.Date.from_string('2017-12-31'))
+        options['unfold_all'] = True
+        account_line_id = self.report._get_generic_line_id('account.account', account.id)
+
+        account_sublines = [line for line in self.report._get_lines(options) if line.get('parent_id') == account_line_id]
+        self.assertLinesValues(
+            account_sublines,
+            #   Name                                    Debit           Credit          Balance
+            [   0,                                      4,              5,              6],
+            [
+                ('B/1',                                 100.0,          0.0,            100.0),
+                ('C/1',                                 100.0,          0.0,            200.0),
+                ('Load more...',                        '',             '',             ''),
+                ('Total 400099 Load More Sales',        300.0,          0.0,            300.0),
+            ],
+            options,
+        )
+
+        load_more_line = account_sublines[2]
+        load_more_1 = self.report._expand_unfoldable_line('_report_expand_unfoldable_line_general_ledger', account_line_id, load_more_line['groupby'], options, load_more_line['progress'], load_more_line['offset'])
+        self.assertLinesValues(
+            load_more_1,
+            #   Name                                    Debit           Credit          Balance
+            [   0,                                      4,              5,              6],
+            [
+                ('a/1',                                 100.0,          0.0,            300.0),
+            ],
+            options,
+        )
+
+    def test_general_ledger_stream_export(self):
+        ''' The streamed exports must contain the same lines as the regular ones, whatever the load more limit. '''
+        self.env.companies = self.env.company
+        self.report.load_more_limit = 2
+
+        options = self._generate_options(self.report, fields.Date.from_string('2017-01-01'), fields.Date.from_string('2017-12-31'))
+        print_options = self.report.get_options(previous_options={**options, 'export_mode': 'print'})
+        expected_names = [
+            line['name']
+            for line in self.report._filter_out_folded_children(self.report.with_context(no_format=True)._get_lines(print_options))
+        ]
+
+        top_level_lines = self.report._get_lines(self.report._get_stream_export_options(print_options))
+        streamed_names = [line['name'] for line in self.report._iter_lines_for_stream_export(print_options, top_level_lines)]
+        self.assertEqual(streamed_names, expected_names)
+        self.assertNotIn("Load more...", streamed_names)
+
+        csv_export = self.report.export_to_csv(options)
+        with csv_export['file_content'] as csv_file:
+            csv_rows = list(csv.reader(io.TextIOWrapper(csv_file, encoding='utf-8', newline='')))
+        self.assertEqual(csv_export['file_type'], 'csv')
+        self.assertEqual([row[0] for row in csv_rows[1:]], expected_names)
+
+        # Saved as an attachment, the export is written in memory
+        csv_export = self.report.with_context(account_report_export_in_memory=True).export_to_csv(options)
+        csv_rows = list(csv.reader(io.StringIO(csv_export['file_content'].decode(), newline='')))
+        self.assertEqual([row[0] for row in csv_rows[1:]], expected_names)
+
     def test_general_ledger_foreign_currency_account(self):
         ''' Ensure the total in foreign currency of an account is displayed only if all journal items are sharing the
         same currency.
@@ -4,6 +4,7 @@ from odoo import fields, Command
 from odoo.tests import tagged
 from odoo.tools import frozendict
 
+import threading
 from unittest.mock import patch
 
 
@@ -1394,3 +1395,204 @@ class TestReportEngines(TestAccountReportsCommon):
         report.line_ids[0].expression_ids[0].engine = 'tax_tags'
         tags = self.env['account.account.tag']._get_tax_tags(formula, self.fake_country.id)
         self.assertEqual(tags.mapped('name'), ['-' + formula, '+' + formula])
+
+    def test_expression_totals_cache(self):
+        self.env['ir.config_parameter'].sudo().set_param('account_reports.expression_totals_cache', True)
+        totals_cache = self.env['account.report.totals.cache']
+
+        test_line_1 = self._prepare_test_report_line(self._prepare_test_expression_account_codes('101'))
+        test_line_2 = self._prepare_test_report_line(self._prepare_test_expression_domain([('account_id.code', '=like', '101%')], 'sum'))
+        report = self._create_report([test_line_1, test_line_2])
+
+        self._create_test_account_moves([
+            self._prepare_test_account_move_line(1000.0, account_code='101001'),
+        ])
+        options = self._generate_options(report, '2020-01-01', '2020-01-31')
+
+        expected_lines = [
+            ('test_line_1',        1000.0),
+            ('test_line_2',        1000.0),
+        ]
+
+        stats_before = totals_cache._get_stats()
+        # pylint: disable=bad-whitespace
+        self.assertLinesValues(report._get_lines(options), [0, 1], expected_lines, options)
+        stats_after_first = totals_cache._get_stats()
+        self.assertEqual(stats_after_first['miss'] - stats_before['miss'], 2)
+        self.assertEqual(stats_after_first['entries'] - stats_before['entries'], 2)
+
+        # Same options: both engines are answered from the cache.
+        self.assertLinesValues(report._get_lines(options), [0, 1], expected_lines, options)
+        stats_after_second = totals_cache._get_stats()
+        self.assertEqual(stats_after_second['hit'] - stats_after_first['hit'], 2)
+        self.assertEqual(stats_after_second['miss'], stats_after_first['miss'])
+
+        # A move posted outside of the period keeps the entries.
+        self._create_test_account_moves([
+            self._prepare_test_account_move_line(50.0, account_code='101002', date='2020-02-01'),
+        ])
+        self.assertEqual(totals_cache._get_stats()['entries'], stats_after_second['entries'])
+
+        # A move posted inside the period invalidates them.
+        moves = self._create_test_account_moves([
+            self._prepare_test_account_move_line(200.0, account_code='101003', date='2020-01-15'),
+        ])
+        self.assertLinesValues(
+            # pylint: disable=bad-whitespace
+            report._get_lines(options),
+            [0,                             1],
+            [
+                ('test_line_1',        1200.0),
+                ('test_line_2',        1200.0),
+            ],
+            options,
+        )
+
+        # Resetting it to draft also does.
+        moves.button_draft()
+        # pylint: disable=bad-whitespace
+        self.assertLinesValues(report._get_lines(options), [0, 1], expected_lines, options)
+
+        # Modifying posted journal items also does, as the domains can depend on any of their fields.
+        self.assertLinesValues(report._get_lines(options), [0, 1], expected_lines, options)
+        stats_before_write = totals_cache._get_stats()
+        self.env['account.move.line'].search([('account_id.code', '=', '101001')]).partner_id = self.partner_a
+        self.assertLinesValues(report._get_lines(options), [0, 1], expected_lines, options)
+        self.assertEqual(totals_cache._get_stats()['miss'] - stats_before_write['miss'], 2)
+
+        # Entries computed from a snapshot predating a concurrent change are ignored, even if they were stored after it.
+        self.env['account.report.totals.cache.invalidation'].create({
+            'company_id': self.env.company.id,
+            'date_from': '2020-01-01',
+            'date_to': '2020-01-31',
+            'transaction_id': '999999999999',
+            'invalidated_at': fields.Datetime.now(),
+        })
+        stats_before_concurrent = totals_cache._get_stats()
+        self.assertLinesValues(report._get_lines(options), [0, 1], expected_lines, options)
+        self.assertEqual(totals_cache._get_stats()['miss'] - stats_before_concurrent['miss'], 2)
+
+        # Entries are never shared with computations ignoring the record rules of the user.
+        stats_before_sudo = totals_cache._get_stats()
+        # pylint: disable=bad-whitespace
+        self.assertLinesValues(report.sudo()._get_lines(options), [0, 1], expected_lines, options)
+        self.assertEqual(totals_cache._get_stats()['miss'] - stats_before_sudo['miss'], 2)
+
+        # Expired entries are removed by the garbage collection.
+        self.env['ir.config_parameter'].sudo().set_param('account_reports.expression_totals_cache_ttl_days', 0)
+        totals_cache._gc_entries()
+        self.assertEqual(totals_cache._get_stats()['entries'], 0)
+
+    def test_column_groups_concurrency(self):
+        # The cursors of the worker threads share the transaction of the test
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+
+        test_line_1 = self._prepare_test_report_line(self._prepare_test_expression_account_codes('101'))
+        test_line_2 = self._prepare_test_report_line(self._prepare_test_expression_domain([('account_id.code', '=like', '101%')], 'sum'))
+        report = self._create_report([test_line_1, test_line_2])
+
+        self._create_test_account_moves([
+            self._prepare_test_account_move_line(1000.0, account_code='101001', date='2019-12-15'),
+            self._prepare_test_account_move_line(200.0, account_code='101002', date='2020-01-15'),
+        ])
+        options = self._generate_options(report, '2020-01-01', '2020-01-31')
+        options = self._update_comparison_filter(options, report, 'previous_period', 1)
+        options_per_column_group = report._split_options_per_column_group(options)
+        self.assertEqual(len(options_per_column_group), 2)
+
+        grouped_formulas = {}
+        for expression in report.line_ids.expression_ids:
+            grouping_key = (report._standardize_date_scope_for_date_range(expression.date_scope), None, None)
+            grouped_formulas.setdefault(expression.engine, {}).setdefault(grouping_key, {})[expression.formula] = expression
+
+        self.env.flush_all()
+        self.assertEqual(
+            report._compute_expression_totals_for_column_groups_concurrently(options_per_column_group, grouped_formulas, 2),
+            report._compute_expression_totals_for_each_column_group(report.line_ids.expression_ids, options),
+        )
+
+        # Through _get_lines, the column groups are computed by worker threads, with the same results
+        expected_lines = report._get_lines(options)
+        self.env['ir.config_parameter'].sudo().set_param('account_reports.column_groups_max_workers', 2)
+        self.assertEqual(report._get_column_groups_max_workers(options, options_per_column_group), 2)
+        compute_single_column_group = type(report)._compute_expression_totals_for_single_column_group
+        computing_threads = set()
+
+        def compute_single_column_group_in_thread(report, *args, **kwargs):
+            computing_threads.add(threading.current_thread())
+            return compute_single_column_group(report, *args, **kwargs)
+
+        with patch.object(type(report), '_compute_expression_totals_for_single_column_group', compute_single_column_group_in_thread):
+            self.assertEqual(report._get_lines(options), expected_lines)
+        self.assertTrue(computing_threads)
+        self.assertNotIn(threading.current_thread(), computing_threads)
+
+        # The temporary table shadowing account_move_line is only visible by the cursor creating it
+        self.assertTrue(report._is_column_groups_concurrency_allowed(options))
+        self.assertFalse(report._is_column_groups_concurrency_allowed({**options, 'analytic_groupby_option': True}))
+
+    def test_monthly_balances(self):
+        self.env['ir.config_parameter'].sudo().set_param('account_reports.use_monthly_balances', True)
+
+        test_line_1 = self._prepare_test_report_line(self._prepare_test_expression_account_codes('101'), groupby='account_id')
+        test_line_2 = self._prepare_test_report_line(
+            self._prepare_test_expression_domain([('account_id.code', '=like', '101%')], 'count_rows'),
+            groupby='account_id',
+        )
+        report = self._create_report([test_line_1, test_line_2])
+
+        moves = self._create_test_account_moves([
+            # Partial first month: read from the journal items
+            self._prepare_test_account_move_line(1.0, account_code='101001', date='2020-01-05'),
+            self._prepare_test_account_move_line(10.0, account_code='101001', date='2020-01-15'),
+            # Whole months: read from the monthly balances
+            self._prepare_test_account_move_line(100.0, account_code='101002', date='2020-02-10'),
+            self._prepare_test_account_move_line(1000.0, account_code='101002', date='2020-02-29'),
+            # Partial last month: read from the journal items
+            self._prepare_test_account_move_line(10000.0, account_code='101003', date='2020-03-15'),
+            self._prepare_test_account_move_line(100000.0, account_code='101003', date='2020-03-20'),
+        ])
+        options = self._generate_options(report, '2020-01-10', '2020-03-15', default_options={'unfold_all': True})
+
+        self.assertLinesValues(
+            # pylint: disable=bad-whitespace
+            report._get_lines(options),
+            [   0,                          1],
+            [
+                ('test_line_1',       11110.0),
+                ('101001 101001',        10.0),
+                ('101002 101002',      1100.0),
+                ('101003 101003',     10000.0),
+                ('test_line_2',             3),
+                ('101001 101001',           1),
+                ('101002 101002',           2),
+                ('101003 101003',           1),
+            ],
+            options,
+        )
+
+        # Changing the partner of a posted journal item (e.g. during the bank reconciliation) moves it to another balance.
+        line = moves.line_ids.filtered(lambda line: line.balance == 1000.0)
+        line.partner_id = self.partner_a
+        self.assertRecordValues(
+            self.env['account.report.monthly.balance'].search([('account_id', '=', line.account_id.id)], order='balance'),
+            [
+                {'partner_id': False,               'date': fields.Date.from_string('2020-02-01'),  'balance': 100.0,   'aml_count': 1},
+                {'partner_id': self.partner_a.id,   'date': fields.Date.from_string('2020-02-01'),  'balance': 1000.0,  'aml_count': 1},
+            ],
+        )
+
+        # Resetting the entries to draft removes them from the monthly balances.
+        moves.button_draft()
+        self.assertFalse(self.env['account.report.monthly.balance'].search([('account_id.code', '=like', '101%')]))
+
+        # The monthly balances are only maintained while they are enabled, and rebuilt when they are enabled again.
+        moves.action_post()
+        self.env['ir.config_parameter'].sudo().set_param('account_reports.use_monthly_balances', False)
+        self.assertFalse(self.env['account.report.monthly.balance'].search([]))
+        self.env['ir.config_parameter'].sudo().set_param('account_reports.use_monthly_balances', True)
+        self.assertEqual(
+            sum(self.env['account.report.monthly.balance'].search([('account_id.code', '=like', '101%')]).mapped('balance')),
+            111111.0,
+        )
@@ -91,16 +91,18 @@ class ReportExportWizardOption(models.TransientModel):
             # file_generator functions are always public for ir_actions_account_report_download
             file_generator = report_action['data']['file_generator']
             check_method_name(file_generator)
-            report = self.export_wizard_id.report_id
-            if report.custom_handler_model_id and hasattr(self.env[report.custom_handler_model_name], file_generator):
-                generation_function = getattr(self.env[report.custom_handler_model_name], file_generator)
+            # Streamed exports are written in memory, as the attachment holds the whole file anyway
+            report = self.export_wizard_id.report_id.with_context(account_report_export_in_memory=True)
+            if report.custom_handler_model_id and hasattr(report.env[report.custom_handler_model_name], file_generator):
+                generation_function = getattr(report.env[report.custom_handler_model_name], file_generator)
             else:
                 generation_function = getattr(report, file_generator)
             export_result = generation_function(report_options)
 
             # We use the options from the action, as the action may have added or modified
             # stuff into them (see l10n_es_reports, with BOE wizard)
-            file_content = base64.encodebytes(export_result['file_content']) if isinstance(export_result['file_content'], bytes) else export_result['file_content']
+            file_content = export_result['file_content']
+            file_content = base64.encodebytes(file_content) if isinstance(file_content, bytes) else file_content
             file_name = f"{self.export_wizard_id.doc_name or self.export_wizard_id.report_id.name}.{export_result['file_type']}"
             mimetype = self.export_wizard_id.report_id.get_export_mime_type(export_result['file_type'])
 
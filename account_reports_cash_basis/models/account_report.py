@@ -114,6 +114,14 @@ class AccountReport(models.Model):
         }
         self.env.cr.execute(sql, params)
 
+    def _is_monthly_balance_summary_allowed(self, options):
+        # The monthly balances are computed on accrual basis
+        return super()._is_monthly_balance_summary_allowed(options) and not options.get('report_cash_basis')
+
+    def _is_column_groups_concurrency_allowed(self, options):
+        # cash_basis_temp_account_move_line is created by the cursor evaluating the report
+        return super()._is_column_groups_concurrency_allowed(options) and not options.get('report_cash_basis')
+
     @api.model
     def _query_get(self, options, date_scope, domain=None):
         # Override to add the context key which will eventually trigger the shadowing of the table
@@ -6,6 +6,8 @@ import math
 from odoo import fields, models, api
 from odoo.osv import expression
 
+from .utils import WorkTimelines
+
 class HelpdeskSLAStatus(models.Model):
     _name = 'helpdesk.sla.status'
     _description = "Ticket SLA Status"
@@ -24,6 +26,8 @@ class HelpdeskSLAStatus(models.Model):
 
     @api.depends('ticket_id.create_date', 'sla_id', 'ticket_id.stage_id')
     def _compute_deadline(self):
+        # The work intervals of each calendar are expanded once for all statuses
+        timelines = WorkTimelines()
         for status in self:
             if (status.deadline and status.reached_datetime) or (status.deadline and not status.sla_id.exclude_stage_ids) or (status.status == 'failed'):
                 continue
@@ -40,28 +44,30 @@ class HelpdeskSLAStatus(models.Model):
                     status.deadline = False
                     continue
 
+            work_timeline = timelines[working_calendar, True]
+            attendance_timeline = timelines[working_calendar, False]
             avg_hour = working_calendar.hours_per_day or 8  # default to 8 working hours/day
             time_days = math.floor(status.sla_id.time / avg_hour)
             if time_days > 0:
-                deadline = working_calendar.plan_days(time_days + 1, deadline, compute_leaves=True)
+                deadline = work_timeline.plan_days(time_days + 1, deadline)
                 # We should also depend on ticket creation time, otherwise for 1 day SLA, all tickets
                 # created on monday will have their deadline filled with tuesday 8:00
-                create_dt = working_calendar.plan_hours(0, status.ticket_id.create_date)
+                create_dt = attendance_timeline.plan_hours(0, status.ticket_id.create_date)
                 deadline = deadline and deadline.replace(hour=create_dt.hour, minute=create_dt.minute, second=create_dt.second, microsecond=create_dt.microsecond)
 
             sla_hours = status.sla_id.time % avg_hour
 
             if status.sla_id.exclude_stage_ids:
-                sla_hours += status._get_freezed_hours(working_calendar)
+                sla_hours += status._get_freezed_hours(working_calendar, work_timeline)
 
             # Except if ticket creation time is later than the end time of the working day
-            deadline_for_working_cal = working_calendar.plan_hours(0, deadline)
+            deadline_for_working_cal = deadline and attendance_timeline.plan_hours(0, deadline)
             if deadline_for_working_cal and deadline.day < deadline_for_working_cal.day and time_days > 0:
                 deadline = deadline.replace(hour=0, minute=0, second=0, microsecond=0)
             # We should execute the function plan_hours in any case because, in a 1 day SLA environment,
             # if I create a ticket knowing that I'm not working the day after at the same time, ticket
             # deadline will be set at time I don't work (ticket creation time might not be in working calendar).
-            status.deadline = deadline and working_calendar.plan_hours(sla_hours, deadline, compute_leaves=True)
+            status.deadline = deadline and work_timeline.plan_hours(sla_hours, deadline)
 
     @api.depends('deadline', 'reached_datetime')
     def _compute_status(self):
@@ -104,6 +110,7 @@ class HelpdeskSLAStatus(models.Model):
 
     @api.depends('deadline', 'reached_datetime')
     def _compute_exceeded_hours(self):
+        timelines = WorkTimelines()
         for status in self:
             if status.deadline and status.ticket_id.team_id.resource_calendar_id:
                 reached_datetime = status.reached_datetime or fields.Datetime.now()
@@ -115,13 +122,15 @@ class HelpdeskSLAStatus(models.Model):
                     start_dt = status.deadline
                     end_dt = reached_datetime
                     factor = 1
-                duration_data = status.ticket_id.team_id.resource_calendar_id.get_work_duration_data(start_dt, end_dt, compute_leaves=True)
-                status.exceeded_hours = duration_data['hours'] * factor
+                work_timeline = timelines[status.ticket_id.team_id.resource_calendar_id, True]
+                status.exceeded_hours = work_timeline.work_hours(start_dt, end_dt) * factor
             else:
                 status.exceeded_hours = False
 
-    def _get_freezed_hours(self, working_calendar):
+    def _get_freezed_hours(self, working_calendar, work_timeline=None):
         self.ensure_one()
+        if work_timeline is None:
+            work_timeline = WorkTimelines()[working_calendar, True]
         hours_freezed = 0
 
         field_stage = self.env['ir.model.fields']._get(self.ticket_id._name, "stage_id")
@@ -134,10 +143,10 @@ class HelpdeskSLAStatus(models.Model):
         old_time = self.ticket_id.create_date
         for tracking_line in tracking_lines:
             if tracking_line.old_value_integer in freeze_stages:
-                # We must use get_work_hours_count to compute real waiting hours (as the deadline computation is also based on calendar)
-                hours_freezed += working_calendar.get_work_hours_count(old_time, tracking_line.create_date)
+                # We must count the working hours to compute real waiting hours (as the deadline computation is also based on calendar)
+                hours_freezed += work_timeline.work_hours(old_time, tracking_line.create_date)
             old_time = tracking_line.create_date
         if tracking_lines[-1].new_value_integer in freeze_stages:
             # the last tracking line is not yet created
-            hours_freezed += working_calendar.get_work_hours_count(old_time, fields.Datetime.now())
+            hours_freezed += work_timeline.work_hours(old_time, fields.Datetime.now())
         return hours_freezed
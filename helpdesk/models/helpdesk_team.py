@@ -9,7 +9,7 @@ from pytz import timezone
 from odoo import api, Command, fields, models, _
 from odoo.exceptions import ValidationError
 from odoo.osv import expression
-from odoo.tools import float_round
+from odoo.tools import float_round, split_every, SQL
 from odoo.addons.rating.models.rating_data import RATING_LIMIT_MIN
 from odoo.addons.web.controllers.utils import clean_action
 
@@ -104,16 +104,16 @@ class HelpdeskTeam(models.Model):
         help="If enabled, portal users will have access to your customer satisfaction statistics from the last 30 days in their portal.\n"
              "They will only have access to the ratings themselves, and not to the written feedback if any was left. You can also manually hide ratings of your choosing.")
     use_sla = fields.Boolean('SLA Policies', default=True)
-    unassigned_tickets = fields.Integer(string='Unassigned Tickets', compute='_compute_unassigned_tickets')
+    unassigned_tickets = fields.Integer(string='Unassigned Tickets', compute='_compute_ticket_counts')
     resource_calendar_id = fields.Many2one('resource.calendar', 'Working Hours',
         default=lambda self: self.env.company.resource_calendar_id, domain="['|', ('company_id', '=', False), ('company_id', '=', company_id)]",
         help="Working hours used to determine the deadline of SLA Policies.")
-    open_ticket_count = fields.Integer("# Open Tickets", compute='_compute_open_ticket_count')
+    open_ticket_count = fields.Integer("# Open Tickets", compute='_compute_ticket_counts')
     sla_policy_count = fields.Integer("# SLA Policy", compute='_compute_sla_policy_count')
-    ticket_closed = fields.Integer(string='Ticket Closed', compute='_compute_ticket_closed')
-    success_rate = fields.Float(string='Success Rate', compute='_compute_success_rate', groups="helpdesk.group_use_sla")
-    urgent_ticket = fields.Integer(string='# Urgent Ticket', compute='_compute_urgent_ticket')
-    sla_failed = fields.Integer(string='Failed SLA Ticket', compute='_compute_sla_failed')
+    ticket_closed = fields.Integer(string='Ticket Closed', compute='_compute_ticket_counts')
+    success_rate = fields.Float(string='Success Rate', compute='_compute_ticket_counts', groups="helpdesk.group_use_sla")
+    urgent_ticket = fields.Integer(string='# Urgent Ticket', compute='_compute_ticket_counts')
+    sla_failed = fields.Integer(string='Failed SLA Ticket', compute='_compute_ticket_counts')
     # auto close ticket
     auto_close_ticket = fields.Boolean('Automatic Closing')
     auto_close_day = fields.Integer('Inactive Period(days)',
@@ -153,84 +153,53 @@ class HelpdeskTeam(models.Model):
     def _compute_has_external_mail_server(self):
         self.has_external_mail_server = self.env['ir.config_parameter'].sudo().get_param('base_setup.default_external_email_server')
 
-    def _compute_unassigned_tickets(self):
-        ticket_data = self.env['helpdesk.ticket']._read_group([
-            ('user_id', '=', False),
-            ('team_id', 'in', self.ids),
-            ('stage_id.fold', '=', False),
-        ], ['team_id'], ['__count'])
-        mapped_data = {team.id: count for team, count in ticket_data}
-        for team in self:
-            team.unassigned_tickets = mapped_data.get(team.id, 0)
+    def _get_ticket_counts_query(self, domain, fields_sql, groupby_sql):
+        """ Returns the query aggregating the tickets matching the domain (record rules included)
+        in a single pass: each counter is computed with its own FILTER clause instead of a
+        separate read_group. The stage of the tickets is available under the ``stage`` alias. """
+        query = self.env['helpdesk.ticket']._search(domain)
+        return SQL(
+            """SELECT %s, %s
+                 FROM %s
+            LEFT JOIN helpdesk_stage stage ON stage.id = helpdesk_ticket.stage_id
+                WHERE %s
+             GROUP BY %s""",
+            groupby_sql, fields_sql, query.from_clause, query.where_clause, groupby_sql,
+        )
 
-    def _compute_ticket_closed(self):
+    def _compute_ticket_counts(self):
         dt = datetime.datetime.combine(datetime.date.today() - relativedelta.relativedelta(days=6), datetime.time.min)
-        ticket_data = self.env['helpdesk.ticket']._read_group([
-            ('team_id', 'in', self.ids),
-            ('stage_id.fold', '=', True),
-            ('close_date', '>=', dt)],
-            ['team_id'], ['__count'])
-        mapped_data = {team.id: count for team, count in ticket_data}
+        now = fields.Datetime.now()
+        self.env['helpdesk.ticket'].flush_model(['team_id', 'stage_id', 'user_id', 'priority', 'close_date', 'sla_deadline', 'sla_reached', 'sla_reached_late'])
+        self.env['helpdesk.stage'].flush_model(['fold'])
+        open_sql = SQL("stage.fold IS NOT TRUE AND stage.id IS NOT NULL")
+        recent_sql = SQL("(stage.fold OR helpdesk_ticket.close_date >= %s)", dt)
+        self.env.cr.execute(self._get_ticket_counts_query(
+            [('team_id', 'in', self.ids)],
+            SQL(", ").join([
+                SQL("COUNT(*) FILTER (WHERE %s)", open_sql),
+                SQL("COUNT(*) FILTER (WHERE %s AND helpdesk_ticket.user_id IS NULL)", open_sql),
+                SQL("COUNT(*) FILTER (WHERE %s AND helpdesk_ticket.priority = '3')", open_sql),
+                SQL("COUNT(*) FILTER (WHERE %s AND (helpdesk_ticket.sla_reached_late OR helpdesk_ticket.sla_deadline < %s))", open_sql, now),
+                SQL("COUNT(*) FILTER (WHERE stage.fold AND helpdesk_ticket.close_date >= %s)", dt),
+                SQL("COUNT(*) FILTER (WHERE %s AND (helpdesk_ticket.sla_reached OR helpdesk_ticket.sla_reached_late))", recent_sql),
+                SQL("COUNT(*) FILTER (WHERE %s AND (helpdesk_ticket.sla_reached_late OR helpdesk_ticket.sla_deadline < %s))", recent_sql, now),
+            ]),
+            SQL('helpdesk_ticket.team_id'),
+        ))
+        counts_per_team = {team_id: counts for team_id, *counts in self.env.cr.fetchall()}
         for team in self:
-            team.ticket_closed = mapped_data.get(team.id, 0)
-
-    def _compute_success_rate(self):
-        dt = datetime.datetime.combine(datetime.date.today() - relativedelta.relativedelta(days=6), datetime.time.min)
-        sla_teams = self.filtered('use_sla')
-        domain = [
-            ('team_id', 'in', sla_teams.ids),
-            '|', ('stage_id.fold', '=', True), ('close_date', '>=', dt)
-        ]
-        sla_tickets_and_failed_tickets_per_team = defaultdict(lambda: [0, 0])
-        today = fields.Datetime.now()
-        tickets_sla_count = self.env['helpdesk.ticket']._read_group(domain + [
-            '|', ('sla_reached', '=', True), ('sla_reached_late', '=', True)],
-            ['team_id'], ['__count']
-        )
-        tickets_success_count = self.env['helpdesk.ticket']._read_group(domain + [
-            '|', ('sla_deadline', '<', today), ('sla_reached_late', '=', True)],
-            ['team_id'], ['__count']
-        )
-        for team, team_count in tickets_sla_count:
-            sla_tickets_and_failed_tickets_per_team[team.id][0] = team_count
-        for team, team_count in tickets_success_count:
-            sla_tickets_and_failed_tickets_per_team[team.id][1] = team_count
-        for team in sla_teams:
-            if not sla_tickets_and_failed_tickets_per_team.get(team.id):
+            open_count, unassigned, urgent, sla_failed, closed, sla_count, sla_failed_count = counts_per_team.get(team.id, [0] * 7)
+            team.open_ticket_count = open_count
+            team.unassigned_tickets = unassigned
+            team.urgent_ticket = urgent
+            team.sla_failed = sla_failed
+            team.ticket_closed = closed
+            if not team.use_sla or not (sla_count or sla_failed_count):
                 team.success_rate = -1
-                continue
-            total_count = sla_tickets_and_failed_tickets_per_team[team.id][0]
-            success_count = total_count - sla_tickets_and_failed_tickets_per_team[team.id][1]
-            team.success_rate = float_round(success_count * 100 / total_count, 2) if total_count else 0.0
-        (self - sla_teams).success_rate = -1
-
-    def _compute_urgent_ticket(self):
-        ticket_data = self.env['helpdesk.ticket']._read_group([
-            ('team_id', 'in', self.ids),
-            ('stage_id.fold', "=", False),
-            ('priority', '=', 3)],
-            ['team_id'], ['__count'])
-        mapped_data = {team.id: count for team, count in ticket_data}
-        for team in self:
-            team.urgent_ticket = mapped_data.get(team.id, 0)
-
-    def _compute_sla_failed(self):
-        ticket_data = self.env['helpdesk.ticket']._read_group([
-            ('team_id', 'in', self.ids),
-            ('stage_id.fold', '=', False),
-            ('sla_fail', '=', True)],
-            ['team_id'], ['__count'])
-        mapped_data = {team.id: count for team, count in ticket_data}
-        for team in self:
-            team.sla_failed = mapped_data.get(team.id, 0)
-
-    def _compute_open_ticket_count(self):
-        ticket_data = self.env['helpdesk.ticket']._read_group([
-            ('team_id', 'in', self.ids), ('stage_id.fold', '=', False)
-        ], ['team_id'], ['__count'])
-        mapped_data = {team.id: count for team, count in ticket_data}
-        for team in self:
-            team.open_ticket_count = mapped_data.get(team.id, 0)
+            else:
+                success_count = sla_count - sla_failed_count
+                team.success_rate = float_round(success_count * 100 / sla_count, 2) if sla_count else 0.0
 
     def _compute_sla_policy_count(self):
         sla_data = self.env['helpdesk.sla']._read_group([('team_id', 'in', self.ids)], ['team_id'], ['__count'])
@@ -593,61 +562,49 @@ class HelpdeskTeam(models.Model):
             })
             return result
 
-        def _is_sla_failed(data):
-            deadline = data.get('sla_deadline')
-            sla_deadline = fields.Datetime.now() > deadline if deadline else False
-            return sla_deadline or data.get('sla_reached_late')
-
-        def add_to(ticket, key="my_all"):
-            result[key]['count'] += 1
-            result[key]['hours'] += ticket['open_hours']
-            if _is_sla_failed(ticket):
-                result[key]['failed'] += 1
-
-        domain = [('user_id', '=', self.env.uid)]
-        tickets = HelpdeskTicket.search_read(
-            expression.AND([
-                domain,
-                [('stage_id.fold', '=', False)]
+        # The open tickets of the user and the ones they closed today and during the last 7 days
+        # are aggregated per priority in a single query.
+        today = fields.Date.context_today(self)
+        seven_days = datetime.date.today() - relativedelta.relativedelta(days=6)
+        HelpdeskTicket.flush_model(['user_id', 'stage_id', 'priority', 'create_date', 'close_date', 'sla_deadline', 'sla_reached', 'sla_reached_late'])
+        self.env['helpdesk.stage'].flush_model(['fold'])
+        now = fields.Datetime.now()
+        open_sql = SQL("stage.fold IS NOT TRUE AND stage.id IS NOT NULL")
+        failed_sql = SQL("(helpdesk_ticket.sla_reached_late OR helpdesk_ticket.sla_deadline < %s)", now)
+        sla_sql = SQL("(helpdesk_ticket.sla_reached OR helpdesk_ticket.sla_reached_late)")
+        success_sql = SQL("(helpdesk_ticket.sla_reached_late IS NOT TRUE AND %s)", sla_sql)
+        closed_sqls = [
+            SQL("stage.fold AND helpdesk_ticket.close_date >= %s", date)
+            for date in (today, seven_days)
+        ]
+        self.env.cr.execute(self._get_ticket_counts_query(
+            [('user_id', '=', self.env.uid)],
+            SQL(", ").join([
+                SQL("COUNT(*) FILTER (WHERE %s)", open_sql),
+                SQL(
+                    "SUM(FLOOR(EXTRACT(EPOCH FROM COALESCE(helpdesk_ticket.close_date, %s) - helpdesk_ticket.create_date) / 3600)::integer) FILTER (WHERE %s)",
+                    now, open_sql,
+                ),
+                SQL("COUNT(*) FILTER (WHERE %s AND %s)", open_sql, failed_sql),
+                *(
+                    SQL("COUNT(*) FILTER (WHERE %s)", SQL(" AND ").join([closed_sql, *conditions]))
+                    for closed_sql in closed_sqls
+                    for conditions in ([], [sla_sql], [success_sql])
+                ),
             ]),
-            ['sla_deadline', 'open_hours', 'sla_reached_late', 'priority']
-        )
-        for ticket in tickets:
-            add_to(ticket, 'my_all')
-            if ticket['priority'] == '2':
-                add_to(ticket, 'my_high')
-            if ticket['priority'] == '3':
-                add_to(ticket, 'my_urgent')
-
-        group_fields = []
-        if user_uses_sla:
-            group_fields = ['sla_reached_late', 'sla_reached']
-
-        dt = fields.Date.context_today(self)
-        tickets = HelpdeskTicket._read_group(domain + [('stage_id.fold', '=', True), ('close_date', '>=', dt)], group_fields, ['__count'])
-        for row in tickets:
-            if not user_uses_sla:
-                [count] = row
-            else:
-                sla_reached_late, sla_reached, count = row
-                if sla_reached or sla_reached_late:
-                    result['today']['sla_ticket_count'] += count
-                    if not sla_reached_late:
-                        result['today']['success'] += count
-            result['today']['count'] += count
-
-        dt = fields.Datetime.to_string((datetime.date.today() - relativedelta.relativedelta(days=6)))
-        tickets = HelpdeskTicket._read_group(domain + [('stage_id.fold', '=', True), ('close_date', '>=', dt)], group_fields, ['__count'])
-        for row in tickets:
-            if not user_uses_sla:
-                [count] = row
-            else:
-                sla_reached_late, sla_reached, count = row
-                if sla_reached or sla_reached_late:
-                    result['7days']['sla_ticket_count'] += count
-                    if not sla_reached_late:
-                        result['7days']['success'] += count
-            result['7days']['count'] += count
+            SQL('helpdesk_ticket.priority'),
+        ))
+        for priority, open_count, open_hours, open_failed, *closed_counts in self.env.cr.fetchall():
+            keys = ['my_all'] + (['my_high'] if priority == '2' else ['my_urgent'] if priority == '3' else [])
+            for key in keys:
+                result[key]['count'] += open_count
+                result[key]['hours'] += open_hours or 0
+                result[key]['failed'] += open_failed
+            for period, (count, sla_ticket_count, success) in zip(['today', '7days'], split_every(3, closed_counts)):
+                result[period]['count'] += count
+                if user_uses_sla:
+                    result[period]['sla_ticket_count'] += sla_ticket_count
+                    result[period]['success'] += success
 
         result['today']['success'] = fields.Float.round(result['today']['success'] * 100 / (result['today']['sla_ticket_count'] or 1), 2)
         result['7days']['success'] = fields.Float.round(result['7days']['success'] * 100 / (result['7days']['sla_ticket_count'] or 1), 2)
@@ -9,6 +9,8 @@ from odoo.exceptions import AccessError
 from odoo.osv import expression
 from odoo.addons.web.controllers.utils import clean_action
 
+from .utils import WorkTimelines
+
 TICKET_PRIORITY = [
     ('0', 'Low priority'),
     ('1', 'Medium priority'),
@@ -195,6 +197,7 @@ class HelpdeskTicket(models.Model):
             Note: a ticket in a closed stage will probably have no deadline
         """
         now = fields.Datetime.now()
+        timelines = WorkTimelines()
         for ticket in self:
             min_deadline = False
             for status in ticket.sla_status_ids:
@@ -205,8 +208,8 @@ class HelpdeskTicket(models.Model):
 
             ticket.update({
                 'sla_deadline': min_deadline,
-                'sla_deadline_hours': ticket.team_id.resource_calendar_id.get_work_duration_data\
-                    (now, min_deadline, compute_leaves=True)['hours'] if min_deadline else 0.0,
+                'sla_deadline_hours': timelines[ticket.team_id.resource_calendar_id, True].work_hours(now, min_deadline)
+                    if min_deadline and ticket.team_id.resource_calendar_id else 0.0,
             })
 
     @api.depends('sla_deadline', 'sla_reached_late')
@@ -297,21 +300,23 @@ class HelpdeskTicket(models.Model):
 
     @api.depends('assign_date')
     def _compute_assign_hours(self):
+        timelines = WorkTimelines()
         for ticket in self:
             create_date = fields.Datetime.from_string(ticket.create_date)
             if create_date and ticket.assign_date and ticket.team_id.resource_calendar_id:
-                duration_data = ticket.team_id.resource_calendar_id.get_work_duration_data(create_date, fields.Datetime.from_string(ticket.assign_date), compute_leaves=True)
-                ticket.assign_hours = duration_data['hours']
+                work_timeline = timelines[ticket.team_id.resource_calendar_id, True]
+                ticket.assign_hours = work_timeline.work_hours(create_date, fields.Datetime.from_string(ticket.assign_date))
             else:
                 ticket.assign_hours = False
 
     @api.depends('create_date', 'close_date')
     def _compute_close_hours(self):
+        timelines = WorkTimelines()
         for ticket in self:
             create_date = fields.Datetime.from_string(ticket.create_date)
-            if create_date and ticket.close_date and ticket.team_id:
-                duration_data = ticket.team_id.resource_calendar_id.get_work_duration_data(create_date, fields.Datetime.from_string(ticket.close_date), compute_leaves=True)
-                ticket.close_hours = duration_data['hours']
+            if create_date and ticket.close_date and ticket.team_id.resource_calendar_id:
+                work_timeline = timelines[ticket.team_id.resource_calendar_id, True]
+                ticket.close_hours = work_timeline.work_hours(create_date, fields.Datetime.from_string(ticket.close_date))
             else:
                 ticket.close_hours = False
 
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+
+from pytz import utc
+
+# Size of the chunks of work intervals loaded at once, and how far they are looked for
+# (the same horizon as resource.calendar's plan_hours and plan_days).
+TIMELINE_CHUNK = timedelta(weeks=8)
+TIMELINE_HORIZON = timedelta(days=1400)
+
+
+def make_aware(dt):
+    return dt if dt.tzinfo else utc.localize(dt)
+
+
+def make_naive(dt):
+    return dt.astimezone(utc).replace(tzinfo=None)
+
+
+class WorkTimeline:
+    """ Work intervals of a calendar (for the whole company, leaves included or not) with the
+    working time cumulated since the beginning of the timeline at the start of each interval.
+
+    It allows computing the working hours between two datetimes and planning hours or days
+    from a datetime with bisections, instead of expanding the calendar for every record.
+    Intervals are loaded by chunks when needed. The methods return the same results as the
+    ``get_work_duration_data``, ``get_work_hours_count``, ``plan_hours`` and ``plan_days``
+    methods of resource.calendar, and take and return naive UTC datetimes like them.
+    """
+
+    def __init__(self, calendar, compute_leaves=True):
+        self.calendar = calendar
+        self.compute_leaves = compute_leaves
+        self.start = self.end = None
+        self.starts = []  # start of the intervals, in the timezone of the calendar
+        self.stops = []  # stop of the intervals, in the timezone of the calendar
+        self.cumulated_starts = []  # working time before each interval (timedelta)
+        self.cumulated_stops = []  # working time at the end of each interval (timedelta)
+        self.day_positions = {}  # local date -> position in self.days
+        self.days = []  # distinct local dates of the interval starts
+        self.day_first_indexes = []  # index of the first interval of each day in self.days
+
+    def _get_intervals(self, start, end):
+        if self.compute_leaves:
+            return self.calendar._work_intervals_batch(start, end)[False]
+        return self.calendar._attendance_intervals_batch(start, end)[False]
+
+    def _load(self, start, end):
+        """ Makes sure the intervals between the aware datetimes start and end are loaded. """
+        if self.start is None:
+            start = start - timedelta(days=1)
+            intervals = list(self._get_intervals(start, end))
+            self.start, self.end = start, end
+            self._index(intervals)
+        elif start < self.start:
+            # Loading earlier intervals shifts the cumulated times: rebuild the whole index.
+            intervals = list(self._get_intervals(start, self.start))
+            intervals += list(zip(self.starts, self.stops, [None] * len(self.starts)))
+            self.start = start
+            self._reset_index()
+            self._index(intervals)
+        if end > self.end:
+            end = max(end, self.end + TIMELINE_CHUNK)
+            intervals = list(self._get_intervals(self.end, end))
+            self.end = end
+            self._index(intervals)
+
+    def _reset_index(self):
+        for values in (self.starts, self.stops, self.cumulated_starts, self.cumulated_stops, self.days, self.day_first_indexes):
+            values.clear()
+        self.day_positions.clear()
+
+    def _index(self, intervals):
+        cumulated = self.cumulated_stops[-1] if self.cumulated_stops else timedelta()
+        for start, stop, dummy in intervals:
+            if self.stops and start == self.stops[-1]:
+                # The interval was cut by the end of the previously loaded chunk: merge it back.
+                cumulated += stop - start
+                self.stops[-1] = stop
+                self.cumulated_stops[-1] = cumulated
+                continue
+            day = start.date()
+            if day not in self.day_positions:
+                self.day_positions[day] = len(self.days)
+                self.days.append(day)
+                self.day_first_indexes.append(len(self.starts))
+            self.starts.append(start)
+            self.stops.append(stop)
+            self.cumulated_starts.append(cumulated)
+            cumulated += stop - start
+            self.cumulated_stops.append(cumulated)
+
+    def _cumulated_at(self, dt):
+        """ Returns the working time between the beginning of the timeline and the aware datetime dt. """
+        self._load(dt, dt)
+        index = bisect_right(self.starts, dt) - 1
+        if index < 0:
+            return timedelta()
+        return self.cumulated_starts[index] + min(max(dt - self.starts[index], timedelta()), self.stops[index] - self.starts[index])
+
+    def _next_interval_index(self, dt):
+        """ Returns the index of the first interval ending after the aware datetime dt, or None if
+        there are none within the horizon. """
+        self._load(dt, dt)
+        while True:
+            index = bisect_right(self.stops, dt)
+            if index < len(self.stops):
+                return index
+            if self.end > dt + TIMELINE_HORIZON:
+                return None
+            self._load(dt, self.end + TIMELINE_CHUNK)
+
+    def work_hours(self, start_dt, end_dt):
+        """ Returns the working hours between start_dt and end_dt. """
+        start_dt, end_dt = make_aware(start_dt), make_aware(end_dt)
+        if end_dt <= start_dt:
+            return 0.0
+        self._load(start_dt, end_dt)
+        return (self._cumulated_at(end_dt) - self._cumulated_at(start_dt)).total_seconds() / 3600
+
+    def plan_hours(self, hours, day_dt):
+        """ Returns the datetime at which the given (positive) working hours are reached from day_dt. """
+        day_dt = make_aware(day_dt)
+        index = self._next_interval_index(day_dt)
+        if index is None:
+            return False
+        target = self._cumulated_at(day_dt) + timedelta(hours=hours)
+        while True:
+            index = bisect_left(self.cumulated_stops, target, lo=index)
+            if index < len(self.stops):
+                if self.cumulated_starts[index] >= target:
+                    # No working time left to add: the target is reached at the start of the interval.
+                    return make_naive(max(self.starts[index], day_dt))
+                return make_naive(self.starts[index] + (target - self.cumulated_starts[index]))
+            if self.end > day_dt + TIMELINE_HORIZON:
+                return False
+            self._load(day_dt, self.end + TIMELINE_CHUNK)
+
+    def plan_days(self, days, day_dt):
+        """ Returns the end of the first interval of the days-th working day from day_dt. """
+        day_dt = make_aware(day_dt)
+        index = self._next_interval_index(day_dt)
+        if index is None:
+            return False
+        if days == 1:
+            return make_naive(self.stops[index])
+        first_day = max(self.starts[index], day_dt.astimezone(self.starts[index].tzinfo)).date()
+        position = self.day_positions[self.starts[index].date()] + 1
+        if position < len(self.days) and self.days[position] == first_day:
+            position += 1
+        position += days - 2
+        while position >= len(self.days):
+            if self.end > day_dt + TIMELINE_HORIZON:
+                return False
+            self._load(day_dt, self.end + TIMELINE_CHUNK)
+        return make_naive(self.stops[self.day_first_indexes[position]])
+
+
+class WorkTimelines(dict):
+    """ Work timelines per (calendar, compute_leaves), created when first needed. """
+
+    def __missing__(self, key):
+        calendar, compute_leaves = key
+        timeline = self[key] = WorkTimeline(calendar, compute_leaves=compute_leaves)
+        return timeline
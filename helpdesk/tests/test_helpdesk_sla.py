@@ -8,6 +8,7 @@ from freezegun import freeze_time
 
 from odoo import Command, fields
 from odoo.tests.common import TransactionCase
+from odoo.addons.helpdesk.models.utils import WorkTimeline
 
 NOW = datetime(2018, 10, 10, 9, 18)
 NOW2 = datetime(2019, 1, 8, 9, 0)
@@ -229,6 +230,33 @@ class HelpdeskSLA(TransactionCase):
             self.assertEqual(data['my_all']['count'], 2, "There should be 2 tickets")
             self.assertEqual(data['my_all']['failed'], 1, "There should be 1 failed ticket")
 
+    def test_dashboard_ticket_counts(self):
+        with self._ticket_patch_now(NOW):
+            self.create_ticket(team=self.test_team_reached, user_id=self.env.user.id, create_date=NOW - relativedelta(hours=5, minutes=30))
+            self.create_ticket(team=self.test_team_reached, user_id=self.env.user.id, priority='3', create_date=NOW - relativedelta(hours=2))
+            self.create_ticket(team=self.test_team_reached, user_id=False, priority='3')
+            closed_ticket = self.create_ticket(team=self.test_team_reached, user_id=self.env.user.id, priority='2')
+            closed_ticket.stage_id = self.stage_done
+            self.env.flush_all()
+
+            data = self.env['helpdesk.team'].retrieve_dashboard()
+            self.assertEqual(data['my_all'], {'count': 2, 'hours': 3.5, 'failed': 0}, "Open tickets of the user: 5 and 2 open hours")
+            self.assertEqual(data['my_high'], {'count': 0, 'hours': 0, 'failed': 0})
+            self.assertEqual(data['my_urgent'], {'count': 1, 'hours': 2, 'failed': 0})
+            self.assertEqual(data['today']['count'], 1, "The ticket closed today should be counted")
+            self.assertEqual(data['7days']['count'], 1, "The ticket closed today should be counted in the last 7 days")
+
+            team = self.test_team_reached
+            team.invalidate_recordset()
+            team.fetch(['use_sla'])
+            with self.assertQueryCount(1):
+                self.assertEqual(
+                    [team.open_ticket_count, team.unassigned_tickets, team.urgent_ticket, team.sla_failed, team.ticket_closed],
+                    [3, 1, 2, 0, 1],
+                )
+            self.assertEqual(self.test_team_no_tickets.open_ticket_count, 0)
+            self.assertEqual(self.test_team_no_tickets.success_rate, -1)
+
     def test_deadlines_after_work(self):
         with self._ticket_patch_now(NOW + relativedelta(hour=20, minute=0)):
             self.sla.time = 3
@@ -285,3 +313,26 @@ class HelpdeskSLA(TransactionCase):
             # Success rate checks
             self.assertEqual(self.test_team_reached.success_rate, 100.0, "Team without late tickets should have 100.0 success rate")
             self.assertEqual(self.test_team_late.success_rate, 0.0, "Team with only late tickets should have 0.0 success rate")
+
+    def test_work_timeline(self):
+        """ The work timeline used to compute the SLA deadlines in batch gives the same results as the calendar """
+        calendar = self.env.company.resource_calendar_id
+        self.env['resource.calendar.leaves'].create({
+            'name': 'Public holiday',
+            'calendar_id': calendar.id,
+            'date_from': datetime(2018, 10, 17, 0, 0),
+            'date_to': datetime(2018, 10, 17, 23, 59),
+        })
+        work_timeline = WorkTimeline(calendar)
+        attendance_timeline = WorkTimeline(calendar, compute_leaves=False)
+        # Every 7 hours for 5 weeks, not in chronological order
+        datetimes = [NOW + relativedelta(hours=7 * i) for i in range(120)]
+        datetimes = datetimes[60:] + datetimes[:60]
+        for dt in datetimes:
+            self.assertEqual(work_timeline.plan_hours(11, dt), calendar.plan_hours(11, dt, compute_leaves=True))
+            self.assertEqual(work_timeline.plan_days(3, dt), calendar.plan_days(3, dt, compute_leaves=True))
+            self.assertEqual(attendance_timeline.plan_hours(0, dt), calendar.plan_hours(0, dt))
+            self.assertAlmostEqual(
+                work_timeline.work_hours(dt, dt + relativedelta(days=9, hours=5)),
+                calendar.get_work_duration_data(dt, dt + relativedelta(days=9, hours=5), compute_leaves=True)['hours'],
+            )
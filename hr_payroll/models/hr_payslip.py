@@ -384,6 +384,9 @@ class HrPayslip(models.Model):
     def write(self, vals):
         res = super().write(vals)
 
+        if {'state', 'employee_id', 'date_from', 'date_to'} & vals.keys():
+            self._invalidate_payroll_history(self.employee_id)
+
         if 'state' in vals and vals['state'] == 'paid':
             # Register payment in Salary Attachments
             # NOTE: Since we combine multiple attachments on one input line, it's not possible to compute
@@ -685,66 +688,115 @@ class HrPayslip(models.Model):
         self.ensure_one()
         return self.env['hr.rule.parameter']._get_parameter_from_code(code, self.date_to)
 
-    def _sum(self, code, from_date, to_date=None):
-        if to_date is None:
-            to_date = fields.Date.today()
-        self.env.cr.execute("""
-            SELECT sum(pl.total)
-            FROM hr_payslip as hp, hr_payslip_line as pl
-            WHERE hp.employee_id = %s
-            AND hp.state in ('done', 'paid')
-            AND hp.date_from >= %s
-            AND hp.date_to <= %s
-            AND hp.id = pl.slip_id
-            AND pl.code = %s""", (self.employee_id.id, from_date, to_date, code))
-        res = self.env.cr.fetchone()
-        return res and res[0] or 0.0
-
-    def _sum_category(self, code, from_date, to_date=None):
-        self.ensure_one()
-        if to_date is None:
-            to_date = fields.Date.today()
+    def _get_payroll_history_sums(self, kind, code, from_date, to_date, employee_ids):
+        """ Returns the totals of the done and paid payslips of the given employees, between from_date and to_date.
 
+        :param kind:    'line' to sum the payslip lines with this code, 'category' to sum the payslip lines of the
+                        salary rule category with this code, 'worked_days' to sum the worked days of the work entry
+                        type with this code.
+        :return:        A dictionary mapping the id of each employee having such history to its total.
+        """
         self.env['hr.payslip'].flush_model(['employee_id', 'state', 'date_from', 'date_to'])
-        self.env['hr.payslip.line'].flush_model(['total', 'slip_id', 'category_id'])
-        self.env['hr.salary.rule.category'].flush_model(['code'])
+        if kind == 'worked_days':
+            self.env['hr.payslip.worked_days'].flush_model(['amount', 'payslip_id', 'work_entry_type_id'])
+            self.env['hr.work.entry.type'].flush_model(['code'])
+            query = """
+                SELECT hp.employee_id, sum(hwd.amount)
+                FROM hr_payslip hp, hr_payslip_worked_days hwd, hr_work_entry_type hwet
+                WHERE hp.state in ('done', 'paid')
+                AND hp.id = hwd.payslip_id
+                AND hwet.id = hwd.work_entry_type_id
+                AND hp.employee_id = ANY(%(employee_ids)s)
+                AND hp.date_to <= %(stop)s
+                AND hwet.code = %(code)s
+                AND hp.date_from >= %(start)s
+                GROUP BY hp.employee_id"""
+        elif kind == 'category':
+            self.env['hr.payslip.line'].flush_model(['total', 'slip_id', 'category_id'])
+            self.env['hr.salary.rule.category'].flush_model(['code'])
+            query = """
+                SELECT hp.employee_id, sum(pl.total)
+                FROM hr_payslip as hp, hr_payslip_line as pl, hr_salary_rule_category as rc
+                WHERE hp.employee_id = ANY(%(employee_ids)s)
+                AND hp.state in ('done', 'paid')
+                AND hp.date_from >= %(start)s
+                AND hp.date_to <= %(stop)s
+                AND hp.id = pl.slip_id
+                AND rc.id = pl.category_id
+                AND rc.code = %(code)s
+                GROUP BY hp.employee_id"""
+        else:
+            self.env['hr.payslip.line'].flush_model(['total', 'slip_id', 'code'])
+            query = """
+                SELECT hp.employee_id, sum(pl.total)
+                FROM hr_payslip as hp, hr_payslip_line as pl
+                WHERE hp.employee_id = ANY(%(employee_ids)s)
+                AND hp.state in ('done', 'paid')
+                AND hp.date_from >= %(start)s
+                AND hp.date_to <= %(stop)s
+                AND hp.id = pl.slip_id
+                AND pl.code = %(code)s
+                GROUP BY hp.employee_id"""
 
-        self.env.cr.execute("""
-            SELECT sum(pl.total)
-            FROM hr_payslip as hp, hr_payslip_line as pl, hr_salary_rule_category as rc
-            WHERE hp.employee_id = %s
-            AND hp.state in ('done', 'paid')
-            AND hp.date_from >= %s
-            AND hp.date_to <= %s
-            AND hp.id = pl.slip_id
-            AND rc.id = pl.category_id
-            AND rc.code = %s""", (self.employee_id.id, from_date, to_date, code))
-        res = self.env.cr.fetchone()
-        return res and res[0] or 0.0
+        self.env.cr.execute(query, {
+            'employee_ids': list(employee_ids),
+            'code': code,
+            'start': from_date,
+            'stop': to_date,
+        })
+        return dict(self.env.cr.fetchall())
 
-    def _sum_worked_days(self, code, from_date, to_date=None):
+    def _get_payroll_history_sum(self, kind, code, from_date, to_date):
+        """ Returns the total of the done and paid payslips of the employee of this payslip, see _get_payroll_history_sums.
+
+        During the computation of the payslips (see _get_payslip_lines), the totals are computed at once for the
+        employees of all the payslips of the batch, then answered from memory for the following payslips. Returns None
+        if the employee doesn't have any such history.
+        """
         self.ensure_one()
         if to_date is None:
             to_date = fields.Date.today()
+        employee_id = self.employee_id.id
+
+        history = self.env.cr.cache.get('hr_payroll_history')
+        if history is None:
+            return self._get_payroll_history_sums(kind, code, from_date, to_date, [employee_id]).get(employee_id)
+
+        totals = history.setdefault((kind, code, fields.Date.to_date(from_date), fields.Date.to_date(to_date)), {})
+        if employee_id not in totals:
+            batch_employee_ids = {employee_id} | {
+                batch_employee_id
+                for batch_employee_id in self.browse(self._prefetch_ids).employee_id.ids
+                if isinstance(batch_employee_id, int) and batch_employee_id not in totals
+            }
+            sums = self._get_payroll_history_sums(kind, code, from_date, to_date, batch_employee_ids)
+            for batch_employee_id in batch_employee_ids:
+                totals[batch_employee_id] = sums.get(batch_employee_id)
+        return totals[employee_id]
 
-        query = """
-            SELECT sum(hwd.amount)
-            FROM hr_payslip hp, hr_payslip_worked_days hwd, hr_work_entry_type hwet
-            WHERE hp.state in ('done', 'paid')
-            AND hp.id = hwd.payslip_id
-            AND hwet.id = hwd.work_entry_type_id
-            AND hp.employee_id = %(employee)s
-            AND hp.date_to <= %(stop)s
-            AND hwet.code = %(code)s
-            AND hp.date_from >= %(start)s"""
+    @api.model
+    def _invalidate_payroll_history(self, employees=None):
+        """ Discards the totals computed by _get_payroll_history_sum for the given employees (all if not provided). """
+        history = self.env.cr.cache.get('hr_payroll_history')
+        if not history:
+            return
+        for totals in history.values():
+            if employees is None:
+                totals.clear()
+            else:
+                for employee_id in employees.ids:
+                    totals.pop(employee_id, None)
 
-        self.env.cr.execute(query, {
-            'employee': self.employee_id.id,
-            'code': code,
-            'start': from_date,
-            'stop': to_date})
-        res = self.env.cr.fetchone()
-        return res[0] if res else 0.0
+    def _sum(self, code, from_date, to_date=None):
+        return self._get_payroll_history_sum('line', code, from_date, to_date) or 0.0
+
+    def _sum_category(self, code, from_date, to_date=None):
+        self.ensure_one()
+        return self._get_payroll_history_sum('category', code, from_date, to_date) or 0.0
+
+    def _sum_worked_days(self, code, from_date, to_date=None):
+        self.ensure_one()
+        return self._get_payroll_history_sum('worked_days', code, from_date, to_date)
 
     def _get_base_local_dict(self):
         return {
@@ -808,7 +860,24 @@ class HrPayslip(models.Model):
         return rule_name
 
     def _get_payslip_lines(self):
+        # The history of the employees (see _sum, _sum_category and _sum_worked_days) is loaded for the whole batch.
+        history_owner = 'hr_payroll_history' not in self.env.cr.cache
+        if history_owner:
+            self.env.cr.cache['hr_payroll_history'] = {}
+        try:
+            return self._get_payslip_lines_values()
+        finally:
+            if history_owner:
+                self.env.cr.cache.pop('hr_payroll_history', None)
+
+    def _get_payslip_lines_values(self):
         line_vals = []
+        # The rules of each structure are sorted once for the whole batch. Their code is compiled once per process
+        # (see hr.salary.rule's _compute_rule and _satisfy_condition), then reused for every employee.
+        sorted_rules_per_struct = {
+            struct: sorted(struct.rule_ids, key=lambda x: x.sequence)
+            for struct in self.struct_id
+        }
         for payslip in self:
             if not payslip.contract_id:
                 raise UserError(_("There's no contract set on payslip %s for %s. Check that there is at least a contract set on the employee form.", payslip.name, payslip.employee_id.name))
@@ -823,7 +892,7 @@ class HrPayslip(models.Model):
             blacklisted_rule_ids = self.env.context.get('prevent_payslip_computation_line_ids', [])
 
             result = {}
-            for rule in sorted(payslip.struct_id.rule_ids, key=lambda x: x.sequence):
+            for rule in sorted_rules_per_struct.get(payslip.struct_id, []):
                 if rule.id in blacklisted_rule_ids:
                     continue
                 localdict.update({
@@ -1,9 +1,35 @@
 # -*- coding:utf-8 -*-
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+from functools import lru_cache
+
+from psycopg2 import OperationalError
+from werkzeug.exceptions import HTTPException
+
 from odoo import api, fields, models, _
-from odoo.exceptions import UserError
-from odoo.tools.safe_eval import safe_eval
+from odoo.exceptions import RedirectWarning, UserError
+from odoo.tools.safe_eval import _BUILTINS, _SAFE_OPCODES, check_values, test_expr
+
+
+@lru_cache(maxsize=4096)
+def _compile_rule_code(expr, mode):
+    """ Compiles and checks the code of a salary rule. The code objects are shared by all the payslips computed by
+    the process, so that the same code is only parsed and checked once, whatever the number of employees.
+    """
+    return test_expr(expr, _SAFE_OPCODES, mode=mode)
+
+
+def _eval_rule_code(expr, localdict, mode='eval'):
+    """ Equivalent of safe_eval(expr, localdict, mode=mode, nocopy=True), using the compiled code of the rule. """
+    code = _compile_rule_code(expr, mode)
+    check_values(localdict)
+    localdict['__builtins__'] = _BUILTINS
+    try:
+        return eval(code, localdict)  # pylint: disable=eval-used
+    except (UserError, RedirectWarning, HTTPException, OperationalError, ZeroDivisionError):
+        raise
+    except Exception as e:
+        raise ValueError('%s: "%s" while evaluating\n%r' % (type(e), e, expr))
 
 
 class HrSalaryRule(models.Model):
@@ -112,19 +138,19 @@ result = contract.wage * 0.10''')
         localdict['localdict'] = localdict
         if self.amount_select == 'fix':
             try:
-                return self.amount_fix or 0.0, float(safe_eval(self.quantity, localdict)), 100.0
+                return self.amount_fix or 0.0, float(_eval_rule_code(self.quantity, dict(localdict))), 100.0
             except Exception as e:
                 self._raise_error(localdict, _("Wrong quantity defined for:"), e)
         if self.amount_select == 'percentage':
             try:
-                return (float(safe_eval(self.amount_percentage_base, localdict)),
-                        float(safe_eval(self.quantity, localdict)),
+                return (float(_eval_rule_code(self.amount_percentage_base, dict(localdict))),
+                        float(_eval_rule_code(self.quantity, dict(localdict))),
                         self.amount_percentage or 0.0)
             except Exception as e:
                 self._raise_error(localdict, _("Wrong percentage base or quantity defined for:"), e)
         else:  # python code
             try:
-                safe_eval(self.amount_python_compute or 0.0, localdict, mode='exec', nocopy=True)
+                _eval_rule_code(self.amount_python_compute or 0.0, localdict, mode='exec')
                 return float(localdict['result']), localdict.get('result_qty', 1.0), localdict.get('result_rate', 100.0)
             except Exception as e:
                 self._raise_error(localdict, _("Wrong python code defined for:"), e)
@@ -136,13 +162,13 @@ result = contract.wage * 0.10''')
             return True
         if self.condition_select == 'range':
             try:
-                result = safe_eval(self.condition_range, localdict)
+                result = _eval_rule_code(self.condition_range, dict(localdict))
                 return self.condition_range_min <= result <= self.condition_range_max
             except Exception as e:
                 self._raise_error(localdict, _("Wrong range condition defined for:"), e)
         else:  # python code
             try:
-                safe_eval(self.condition_python, localdict, mode='exec', nocopy=True)
+                _eval_rule_code(self.condition_python, localdict, mode='exec')
                 return localdict.get('result', False)
             except Exception as e:
                 self._raise_error(localdict, _("Wrong python condition defined for:"), e)
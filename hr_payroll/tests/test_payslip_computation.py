@@ -4,6 +4,7 @@
 from dateutil.rrule import rrule, DAILY
 from datetime import datetime, date, timedelta
 from dateutil.relativedelta import relativedelta
+from unittest.mock import patch
 from odoo.fields import Date
 from odoo.tests import tagged
 from odoo.addons.hr_payroll.tests.common import TestPayslipContractBase
@@ -216,6 +217,36 @@ class TestPayslipComputation(TestPayslipContractBase):
         self.richard_payslip2.compute_sheet()
         self.assertEqual(3010.13, self.richard_payslip2.line_ids.filtered(lambda x: x.code == 'SUMALW').total)
 
+    def test_sum_category_batch(self):
+        self.richard_payslip.compute_sheet()
+        self.richard_payslip.action_payslip_done()
+
+        payslips = self.env['hr.payslip'].create([{
+            'name': 'Payslip of %s' % contract.employee_id.name,
+            'employee_id': contract.employee_id.id,
+            'contract_id': contract.id,
+            'struct_id': self.developer_pay_structure.id,
+            'date_from': date(2016, 1, 1),
+            'date_to': date(2016, 1, 31)
+        } for contract in self.contract_cdi + self.contract_jules])
+
+        # The history of both employees is loaded at once.
+        HrPayslip = self.registry['hr.payslip']
+        get_payroll_history_sums = HrPayslip._get_payroll_history_sums
+        history_calls = []
+
+        def _get_payroll_history_sums(payslip, *args):
+            history_calls.append(args)
+            return get_payroll_history_sums(payslip, *args)
+
+        with patch.object(HrPayslip, '_get_payroll_history_sums', _get_payroll_history_sums):
+            payslips.compute_sheet()
+        self.assertEqual(len(history_calls), 1)
+        self.assertRecordValues(payslips.line_ids.filtered(lambda x: x.code == 'SUMALW').sorted(lambda x: x.slip_id.id), [
+            {'employee_id': self.richard_emp.id, 'total': 3010.13},
+            {'employee_id': self.jules_emp.id, 'total': 0.0},
+        ])
+
     def test_payslip_generation_with_extra_work(self):
         # /!\ this is in the weekend (Sunday) => no calendar attendance at this time
         start = datetime(2015, 11, 1, 10, 0, 0)
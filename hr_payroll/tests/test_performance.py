@@ -2,6 +2,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 from datetime import date, datetime
 
+from odoo.addons.hr_payroll.models.hr_salary_rule import _compile_rule_code
 from odoo.addons.hr_payroll.tests.common import TestPayslipBase
 from odoo.tests.common import users, warmup, tagged
 
@@ -85,3 +86,18 @@ class TestPayrollPerformance(TestPayslipBase):
         with self.assertQueryCount(__system__=0, admin=0):  # already cached from warmup
             self.env['hr.rule.parameter']._get_parameter_from_code('test_parameter_cache')
         parameter.unlink()
+
+    def test_performance_salary_rules_compilation(self):
+        """ The code of the salary rules is compiled once, then reused for all the payslips """
+        payslips = self.env['hr.payslip'].create([{
+            'name': 'Payslip of %s' % employee.name,
+            'employee_id': employee.id,
+            'date_from': date(2018, 1, 1),
+            'date_to': date(2018, 1, 31),
+        } for employee in self.employees])
+        payslips.compute_sheet()
+        self.assertTrue(payslips.line_ids)
+
+        nb_compilations = _compile_rule_code.cache_info().misses
+        payslips.compute_sheet()
+        self.assertEqual(_compile_rule_code.cache_info().misses, nb_compilations)
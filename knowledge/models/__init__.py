@@ -6,7 +6,9 @@ from . import knowledge_article_favorite
 from . import knowledge_article_member
 from . import knowledge_article_template_category
 from . import knowledge_article
+from . import knowledge_article_ancestor
 from . import knowledge_article_stage
 from . import knowledge_cover
+from . import ir_config_parameter
 from . import res_partner
 from . import res_users
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from odoo import api, models
+
+
+class IrConfigParameter(models.Model):
+    _inherit = 'ir.config_parameter'
+
+    def _reindex_knowledge_articles_if_changed(self, previous_config):
+        Article = self.env['knowledge.article']
+        if Article._get_full_text_search_config() != previous_config:
+            Article._reindex_search_vector()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        previous_config = self.env['knowledge.article']._get_full_text_search_config()
+        params = super().create(vals_list)
+        params._reindex_knowledge_articles_if_changed(previous_config)
+        return params
+
+    def write(self, vals):
+        previous_config = self.env['knowledge.article']._get_full_text_search_config()
+        res = super().write(vals)
+        self._reindex_knowledge_articles_if_changed(previous_config)
+        return res
+
+    def unlink(self):
+        previous_config = self.env['knowledge.article']._get_full_text_search_config()
+        res = super().unlink()
+        self.env['ir.config_parameter']._reindex_knowledge_articles_if_changed(previous_config)
+        return res
@@ -22,6 +22,23 @@ from odoo.tools.sql import SQL
 
 ARTICLE_PERMISSION_LEVEL = {'none': 0, 'read': 1, 'write': 2}
 
+# PostgreSQL text search configurations used to index the articles, based on the
+# language of the main company. Other languages are indexed without stemming.
+FULL_TEXT_SEARCH_CONFIGS = {
+    'ar': 'arabic', 'ca': 'catalan', 'da': 'danish', 'de': 'german', 'el': 'greek',
+    'en': 'english', 'es': 'spanish', 'eu': 'basque', 'fi': 'finnish', 'fr': 'french',
+    'hi': 'hindi', 'hu': 'hungarian', 'hy': 'armenian', 'id': 'indonesian', 'it': 'italian',
+    'lt': 'lithuanian', 'nb': 'norwegian', 'ne': 'nepali', 'nl': 'dutch', 'pt': 'portuguese',
+    'ro': 'romanian', 'ru': 'russian', 'sr': 'serbian', 'sv': 'swedish', 'ta': 'tamil',
+    'tr': 'turkish',
+}
+
+# Search vector of the articles: the title weighs more than the content (without its tags).
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector(%(config)s::regconfig, COALESCE(name, '')), 'A')
+    || setweight(to_tsvector(%(config)s::regconfig, regexp_replace(COALESCE(body, ''), '<[^>]*>', ' ', 'g')), 'B')
+"""
+
 
 class Article(models.Model):
     _name = "knowledge.article"
@@ -37,7 +54,7 @@ class Article(models.Model):
     DEFAULT_ARTICLE_TRASH_LIMIT_DAYS = 30
 
     active = fields.Boolean(default=True)
-    name = fields.Char(string="Title", tracking=20, default_export_compatible=True)
+    name = fields.Char(string="Title", tracking=20, default_export_compatible=True, index='trigram')
     body = fields.Html(string="Body")
     icon = fields.Char(string='Emoji')
     cover_image_id = fields.Many2one("knowledge.cover", string='Article cover')
@@ -156,6 +173,8 @@ class Article(models.Model):
                 parameter can be used to modify the number of days. 
                 (default is 30)""")
     deletion_date = fields.Date(string="Deletion Date", compute="_compute_deletion_date")
+    # Full text search on the title and the content, see get_user_ranked_articles
+    full_text = fields.Char(string="Full Text", compute="_compute_full_text", search="_search_full_text")
     # Property fields
     article_properties_definition = fields.PropertiesDefinition('Article Item Properties')
     article_properties = fields.Properties('Properties', definition="parent_id.article_properties_definition", copy=True)
@@ -447,7 +466,7 @@ class Article(models.Model):
 
         articles_with_access = {}
         if not self.env.user.share:
-            articles_with_access = Article._get_internal_permission(filter_domain=['!', ('internal_permission', '=?', 'none')])
+            articles_with_access = Article._get_internal_permission(filter_domain=['!', ('inherited_permission', '=?', 'none')])
         member_permissions = Article._get_partner_member_permissions(self.env.user.partner_id)
         articles_with_no_member_access = [article_id for article_id, perm in member_permissions.items() if perm == 'none']
         articles_with_member_access = list(set(member_permissions.keys() - set(articles_with_no_member_access)))
@@ -500,7 +519,7 @@ class Article(models.Model):
                 return expression.FALSE_DOMAIN
             return expression.TRUE_DOMAIN
 
-        articles_with_access = KnowledgeArticle._get_internal_permission(filter_domain=[('internal_permission', '=', 'write')])
+        articles_with_access = KnowledgeArticle._get_internal_permission(filter_domain=[('inherited_permission', '=', 'write')])
         member_permissions = KnowledgeArticle._get_partner_member_permissions(self.env.user.partner_id)
         articles_with_member_access = [article_id for article_id, perm in member_permissions.items() if perm == 'write']
         articles_with_no_member_access = list(set(member_permissions.keys() - set(articles_with_member_access)))
@@ -888,6 +907,8 @@ class Article(models.Model):
             else:
                 articles += next(notsudo_articles)
 
+        self.env['knowledge.article.ancestor']._update_articles(articles)
+        articles._update_search_vector()
         return articles
 
     def write(self, vals):
@@ -937,8 +958,19 @@ class Article(models.Model):
             else:
                 _resequence = True
 
+        # articles whose inherited members change, as well as their descendants
+        moved_articles = self.env['knowledge.article']
+        if 'parent_id' in vals:
+            moved_articles |= self.filtered(lambda article: article.parent_id.id != vals['parent_id'])
+        if 'is_desynchronized' in vals:
+            moved_articles |= self.filtered(lambda article: article.is_desynchronized != bool(vals['is_desynchronized']))
+
         result = super(Article, self).write(vals)
 
+        self.env['knowledge.article.ancestor']._update_articles(moved_articles)
+        if 'name' in vals or 'body' in vals:
+            self._update_search_vector()
+
         # resequence only if a sequence was not already computed based on current
         # parent maximum to avoid unnecessary recomputation of sequences
         if _resequence:
@@ -1473,6 +1505,8 @@ class Article(models.Model):
 
         This means that we need to add in the search_domain the leaf ('is_article_visible', '!=', hidden_mode)
         since the value of is_article_visible is the opposite of hidden_mode.
+
+        When a search_query is given, the articles are searched with ``get_user_ranked_articles``.
         """
         search_domain = [
             ("is_template", "=", False),
@@ -1480,11 +1514,7 @@ class Article(models.Model):
             ("user_has_access", "=", True),  # Admins won't see other's private articles.
         ]
         if search_query:
-            search_domain = expression.AND([search_domain, [
-                "|",
-                    ("name", "ilike", search_query),
-                    ("root_article_id.name", "ilike", search_query),
-            ]])
+            return self.get_user_ranked_articles(search_query, limit=limit, hidden_mode=hidden_mode)
 
         articles_query = self._search(search_domain)
         self.env.cr.execute(SQL('''
@@ -1527,7 +1557,97 @@ class Article(models.Model):
             hidden_mode,
             SQL("LIMIT %s", limit) if limit else SQL()
         ))
-        sorted_articles = self.env.cr.dictfetchall()
+        return self._format_sorted_articles(self.env.cr.dictfetchall())
+
+    def get_user_ranked_articles(self, search_query, limit=40, offset=0, hidden_mode=False):
+        """ Search of the articles the user has access to, used by the Command
+        palette. Articles match when their title or the title of their root
+        article contains the searched text, or when their title or content
+        matches the searched words in the full text index. Words are matched on
+        their stem (e.g. 'running' matches 'runs') and the query supports the
+        web search syntax (quoted phrases, 'or', '-' to exclude a word).
+
+        Articles are sorted by:
+            - name = query
+            - parent_id = False, in hidden mode
+            - relevance, blending the text rank (the title weighs more than the
+              content), the favorites of the user and how recently they were
+              updated, for the articles matching the full text index
+            - is_user_favorite - by Favorite sequence
+            - Favorite count
+        and the returned result has the same structure than the one of
+        ``get_user_sorted_articles``.
+
+        :param str search_query: searched text;
+        :param int limit: maximum number of articles to return;
+        :param int offset: number of matching articles to skip (pagination);
+        :param bool hidden_mode: whether to search the hidden articles instead
+          of the visible ones (see ``get_user_sorted_articles``);
+        """
+        if not search_query:
+            return []
+
+        articles_query = self._search([
+            ("is_template", "=", False),
+            ("is_article_visible", "!=", hidden_mode),
+            ("user_has_access", "=", True),  # Admins won't see other's private articles.
+            "|", "|",
+                ("name", "ilike", search_query),
+                ("root_article_id.name", "ilike", search_query),
+                ("full_text", "ilike", search_query),
+        ])
+        self.env.cr.execute(SQL('''
+       SELECT knowledge_article.id,
+              knowledge_article.name,
+              COALESCE(CAST(fav.id AS BOOLEAN), FALSE) AS is_user_favorite,
+              knowledge_article.favorite_count,
+              knowledge_article.root_article_id,
+              root_article.icon AS root_article_icon,
+              root_article.name AS root_article_name,
+              knowledge_article.icon
+         FROM knowledge_article
+   CROSS JOIN websearch_to_tsquery(%s::regconfig, %s) AS search_query
+    LEFT JOIN knowledge_article_favorite AS fav
+           ON knowledge_article.id = fav.article_id AND fav.user_id = %s
+    LEFT JOIN knowledge_article AS root_article
+           ON knowledge_article.root_article_id = root_article.id
+        WHERE %s
+     ORDER BY COALESCE(POSITION(LOWER(%s) IN LOWER(knowledge_article.name)) > 0, FALSE) DESC,
+              CASE
+                  WHEN %s THEN
+                      NOT COALESCE(CAST(knowledge_article.parent_id AS BOOLEAN), FALSE)
+                  ELSE
+                      FALSE
+              END DESC,
+              CASE
+                  WHEN knowledge_article.search_vector @@ search_query THEN
+                      ts_rank_cd(knowledge_article.search_vector, search_query)
+                      + CASE WHEN fav.id IS NULL THEN 0 ELSE 0.2 END
+                      + 0.1 / (1 + EXTRACT(EPOCH FROM (NOW() AT TIME ZONE 'UTC' - knowledge_article.write_date)) / 2592000)
+                  ELSE
+                      0
+              END DESC,
+              is_user_favorite DESC,
+              COALESCE(fav.sequence, -1),
+              knowledge_article.favorite_count DESC,
+              knowledge_article.write_date DESC,
+              knowledge_article.id DESC
+        LIMIT %s
+       OFFSET %s
+            ''',
+            self._get_full_text_search_config(),
+            search_query,
+            self.env.user.id,
+            articles_query.where_clause,
+            search_query,
+            hidden_mode,
+            limit,
+            offset,
+        ))
+        return self._format_sorted_articles(self.env.cr.dictfetchall())
+
+    @api.model
+    def _format_sorted_articles(self, sorted_articles):
         # Create a tuple with the id and name_get for root_article_id to
         # mimic the result of a read.
         for sorted_article in sorted_articles:
@@ -1544,6 +1664,76 @@ class Article(models.Model):
             del sorted_article['root_article_name']
         return sorted_articles
 
+    # ------------------------------------------------------------
+    # FULL TEXT SEARCH
+    # ------------------------------------------------------------
+
+    def init(self):
+        super().init()
+        self.env.cr.execute("ALTER TABLE knowledge_article ADD COLUMN IF NOT EXISTS search_vector tsvector")
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS knowledge_article_search_vector_idx
+                ON knowledge_article USING GIN (search_vector)
+        """)
+        self._init_full_text_search_config()
+        self.env.cr.execute(
+            f"UPDATE knowledge_article SET search_vector = {SEARCH_VECTOR_SQL} WHERE search_vector IS NULL",
+            {'config': self._get_full_text_search_config()},
+        )
+
+    def _compute_full_text(self):
+        self.full_text = False
+
+    def _search_full_text(self, operator, value):
+        if operator != 'ilike' or not isinstance(value, str):
+            raise NotImplementedError(_("Unsupported search operation"))
+        self.env.cr.execute("""
+            SELECT id
+              FROM knowledge_article
+             WHERE search_vector @@ websearch_to_tsquery(%s::regconfig, %s)
+        """, [self._get_full_text_search_config(), value])
+        return [('id', 'in', [article_id for [article_id] in self.env.cr.fetchall()])]
+
+    @api.model
+    def _init_full_text_search_config(self):
+        """ Chooses the PostgreSQL text search configuration used to index and
+        search the articles, once, from the language of the main company, as all
+        articles must be indexed with the same configuration. """
+        ICP = self.env['ir.config_parameter'].sudo()
+        if ICP.get_param('knowledge.full_text_search_config'):
+            return
+        main_company = self.env.ref('base.main_company', raise_if_not_found=False)
+        lang = (main_company and main_company.partner_id.lang) or 'en_US'
+        config = FULL_TEXT_SEARCH_CONFIGS.get(lang.split('_')[0], 'simple')
+        self.env.cr.execute("SELECT 1 FROM pg_ts_config WHERE cfgname = %s", [config])
+        if not self.env.cr.fetchone():
+            config = 'simple'
+        ICP.set_param('knowledge.full_text_search_config', config)
+
+    @api.model
+    def _get_full_text_search_config(self):
+        """ Returns the text search configuration of the articles (see _init_full_text_search_config). """
+        return self.env['ir.config_parameter'].sudo().get_param('knowledge.full_text_search_config') or 'simple'
+
+    @api.model
+    def _reindex_search_vector(self):
+        """ Indexes all the articles again, when their text search configuration changes. """
+        self.flush_model(['name', 'body'])
+        self.env.cr.execute(
+            f"UPDATE knowledge_article SET search_vector = {SEARCH_VECTOR_SQL}",
+            {'config': self._get_full_text_search_config()},
+        )
+
+    def _update_search_vector(self):
+        """ Indexes the title and the content of the articles for the full text search. """
+        if not self:
+            return
+        self.flush_recordset(['name', 'body'])
+        self.env.cr.execute(
+            f"UPDATE knowledge_article SET search_vector = {SEARCH_VECTOR_SQL} WHERE id = ANY(%(article_ids)s)",
+            {'config': self._get_full_text_search_config(), 'article_ids': self.ids},
+        )
+
     # ------------------------------------------------------------
     # PERMISSIONS / MEMBERS MANAGEMENT
     # ------------------------------------------------------------
@@ -2049,47 +2239,19 @@ class Article(models.Model):
 
     @api.model
     def _get_internal_permission(self, filter_domain=None):
-        """ Compute article based permissions.
+        """ Compute article based permissions, i.e. the internal permission of the
+        articles or the one they inherit from their ancestors.
 
-        Note: we don't use domain because we cannot include properly the where clause
-        in the custom sql query. The query's output table and fields names does not match
-        the model we are working on.
+        :param filter_domain: domain on the articles, e.g. on their inherited permission,
+          to only retrieve the articles matching it;
         """
         self.flush_model()
 
-        args = []
-        base_where_domain = ''
+        query = self.with_context(active_test=False)._where_calc(filter_domain or [])
         if self.ids:
-            base_where_domain = "WHERE id in %s"
-            args.append(tuple(self.ids))
-
-        where_clause = ''
-        if filter_domain:
-            query = self.with_context(active_test=False)._where_calc(filter_domain)
-            table_name, where_clause, where_params = query.get_sql()
-            where_clause = f'WHERE {where_clause.replace(table_name, "article_perms")}'
-            args += where_params
-
-        sql = f'''
-    WITH RECURSIVE article_perms as (
-        SELECT id, id as article_id, parent_id, internal_permission, is_desynchronized
-          FROM knowledge_article
-          {base_where_domain}
-         UNION
-        SELECT parents.id, perms.article_id, parents.parent_id,
-               COALESCE(perms.internal_permission, parents.internal_permission),
-               perms.is_desynchronized
-          FROM knowledge_article parents
-    INNER JOIN article_perms perms
-            ON perms.parent_id=parents.id
-               AND perms.is_desynchronized IS NOT TRUE
-               AND perms.internal_permission IS NULL
-    )
-    SELECT article_id, max(internal_permission)
-      FROM article_perms
-           {where_clause}
-  GROUP BY article_id'''
-        self._cr.execute(sql, args)
+            query.add_where('"knowledge_article".id IN %s', [tuple(self.ids)])
+        query_str, query_params = query.select('"knowledge_article".id', '"knowledge_article".inherited_permission')
+        self._cr.execute(query_str, query_params)
         return dict(self._cr.fetchall())
 
     @api.model
@@ -2104,34 +2266,17 @@ class Article(models.Model):
         args = [partner.id]
         base_where_domain = ''
         if self.ids:
-            base_where_domain = "WHERE perms1.id in %s"
+            base_where_domain = "WHERE ancestor.article_id in %s"
             args.append(tuple(self.ids))
 
+        # closest membership of the partner on the article or on the ancestors it inherits from
         sql = f'''
-    WITH RECURSIVE article_perms as (
-        SELECT a.id, a.parent_id, m.permission, a.is_desynchronized
-          FROM knowledge_article a
-     LEFT JOIN knowledge_article_member m
-            ON a.id=m.article_id and partner_id = %s
-    ), article_rec as (
-        SELECT perms1.id, perms1.id as article_id, perms1.parent_id,
-               perms1.permission, perms1.is_desynchronized
-          FROM article_perms as perms1
-          {base_where_domain}
-         UNION
-        SELECT perms2.id, perms_rec.article_id, perms2.parent_id,
-               COALESCE(perms_rec.permission, perms2.permission),
-               perms2.is_desynchronized
-          FROM article_perms as perms2
-    INNER JOIN article_rec perms_rec
-            ON perms_rec.parent_id=perms2.id
-               AND perms_rec.is_desynchronized IS NOT TRUE
-               AND perms_rec.permission IS NULL
-    )
-    SELECT article_id, max(permission)
-      FROM article_rec
-     WHERE permission IS NOT NULL
-  GROUP BY article_id'''
+    SELECT DISTINCT ON (ancestor.article_id) ancestor.article_id, m.permission
+      FROM knowledge_article_ancestor ancestor
+      JOIN knowledge_article_member m
+        ON m.article_id = ancestor.ancestor_id AND m.partner_id = %s
+           {base_where_domain}
+  ORDER BY ancestor.article_id, ancestor.level'''
         self._cr.execute(sql, args)
         return dict(self._cr.fetchall())
 
@@ -2168,7 +2313,7 @@ class Article(models.Model):
         args = []
         if self.ids:
             args = [tuple(self.ids)]
-            add_where_clause += " AND article_id in %s"
+            add_where_clause += " WHERE ancestor.article_id in %s"
 
         additional_select_fields = ''
         join_clause = ''
@@ -2214,34 +2359,12 @@ class Article(models.Model):
 
         sql = f'''
     WITH article_permission as (
-        WITH RECURSIVE article_perms as (
-            SELECT a.id, a.parent_id, a.is_desynchronized, m.id as member_id,
-                   m.partner_id, m.permission
-              FROM knowledge_article a
-         LEFT JOIN knowledge_article_member m
-                ON a.id = m.article_id
-        ), article_rec as (
-            SELECT perms1.id, perms1.id as article_id, perms1.parent_id,
-                   perms1.member_id, perms1.partner_id, perms1.permission,
-                   perms1.id as origin_id, 0 as level,
-                   perms1.is_desynchronized
-              FROM article_perms as perms1
-             UNION
-            SELECT perms2.id, perms_rec.article_id, perms2.parent_id,
-                   perms2.member_id, perms2.partner_id, perms2.permission,
-                   perms2.id as origin_id, perms_rec.level + 1,
-                   perms2.is_desynchronized
-              FROM article_perms as perms2
-        INNER JOIN article_rec perms_rec
-                ON perms_rec.parent_id=perms2.id
-                   AND perms_rec.is_desynchronized is not true
-        )
-        SELECT article_id, origin_id, member_id, partner_id,
-               permission, min(level) as min_level
-          FROM article_rec
-         WHERE partner_id is not null
+        SELECT ancestor.article_id, ancestor.ancestor_id as origin_id, m.id as member_id,
+               m.partner_id, m.permission, ancestor.level as min_level
+          FROM knowledge_article_ancestor ancestor
+          JOIN knowledge_article_member m
+            ON m.article_id = ancestor.ancestor_id
                {add_where_clause}
-      GROUP BY article_id, origin_id, member_id, partner_id, permission
     )
     SELECT article_id, origin_id, member_id, partner_id, permission, min_level
            {additional_select_fields}
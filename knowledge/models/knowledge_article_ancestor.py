@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import logging
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class ArticleAncestor(models.Model):
+    """ Closure of the permission inheritance tree of the articles: links each article to itself
+    and to the ancestors it inherits its members from. Going up the hierarchy stops at the first
+    desynchronized article (included), which doesn't inherit anything from its own parents.
+
+    The rows of an article are recomputed when the article or one of its ancestors is moved or
+    (de)synchronized. It allows retrieving the members that apply to articles with a single join,
+    instead of walking up the whole article tree (see ``knowledge.article`` permission methods). """
+    _name = 'knowledge.article.ancestor'
+    _description = 'Article Permission Ancestor'
+    _log_access = False
+
+    article_id = fields.Many2one(
+        'knowledge.article', 'Article', required=True, readonly=True, index=True, ondelete='cascade')
+    ancestor_id = fields.Many2one(
+        'knowledge.article', 'Ancestor', required=True, readonly=True, index=True, ondelete='cascade')
+    level = fields.Integer('Level', required=True, readonly=True,
+                           help="Distance between the article and its ancestor (0 for the article itself).")
+
+    def init(self):
+        self.env.cr.execute("SELECT 1 FROM knowledge_article_ancestor LIMIT 1")
+        if not self.env.cr.fetchone():
+            self._rebuild()
+
+    @api.model
+    def _rebuild(self):
+        """ Recomputes the ancestors of all articles. """
+        self.env['knowledge.article'].flush_model(['parent_id', 'is_desynchronized'])
+        self.env.cr.execute("TRUNCATE knowledge_article_ancestor")
+        self.env.cr.execute('''
+    WITH RECURSIVE article_ancestor as (
+        SELECT id as article_id, id as ancestor_id, parent_id, is_desynchronized, 0 as level
+          FROM knowledge_article
+         UNION ALL
+        SELECT rec.article_id, parents.id, parents.parent_id, parents.is_desynchronized, rec.level + 1
+          FROM knowledge_article parents
+    INNER JOIN article_ancestor rec
+            ON rec.parent_id = parents.id
+               AND rec.is_desynchronized IS NOT TRUE
+    )
+    INSERT INTO knowledge_article_ancestor (article_id, ancestor_id, level)
+    SELECT article_id, ancestor_id, level
+      FROM article_ancestor''')
+        _logger.info("Computed %s permission ancestors for knowledge articles", self.env.cr.rowcount)
+
+    @api.model
+    def _update_articles(self, articles):
+        """ Recomputes the ancestors of the given articles and of all their descendants,
+        after they have been created, moved or (de)synchronized. """
+        if not articles:
+            return
+        self.env['knowledge.article'].flush_model(['parent_id', 'parent_path', 'is_desynchronized'])
+        self.env.cr.execute('''
+    WITH RECURSIVE impacted_article as (
+        SELECT descendants.id
+          FROM knowledge_article descendants
+          JOIN knowledge_article articles
+            ON descendants.parent_path LIKE articles.parent_path || '%%'
+         WHERE articles.id = ANY(%(article_ids)s)
+    ), removed_ancestor as (
+        DELETE FROM knowledge_article_ancestor
+         WHERE article_id IN (SELECT id FROM impacted_article)
+    ), article_ancestor as (
+        SELECT id as article_id, id as ancestor_id, parent_id, is_desynchronized, 0 as level
+          FROM knowledge_article
+         WHERE id IN (SELECT id FROM impacted_article)
+         UNION ALL
+        SELECT rec.article_id, parents.id, parents.parent_id, parents.is_desynchronized, rec.level + 1
+          FROM knowledge_article parents
+    INNER JOIN article_ancestor rec
+            ON rec.parent_id = parents.id
+               AND rec.is_desynchronized IS NOT TRUE
+    )
+    INSERT INTO knowledge_article_ancestor (article_id, ancestor_id, level)
+    SELECT article_id, ancestor_id, level
+      FROM article_ancestor''', {'article_ids': articles.ids})
@@ -878,6 +878,59 @@ class TestKnowledgeArticleBusiness(KnowledgeCommonBusinessCase):
                    self.wkspace_grandgrandchildren[0] + self.wkspace_grandchildren[1]
         self.assertEqual([a['id'] for a in result], expected.ids)
 
+    @users('employee')
+    def test_article_ranked_search(self):
+        """ Testing the full text search returned by get_user_ranked_articles """
+        self.env['ir.config_parameter'].sudo().set_param('knowledge.full_text_search_config', 'simple')
+        title_match, body_match, other = self.env['knowledge.article'].create([{
+            'body': '<p>Nothing to see here</p>',
+            'internal_permission': 'write',
+            'name': 'Checks running',
+        }, {
+            'body': '<p>Please <b>run</b> the checks before leaving</p>',
+            'internal_permission': 'write',
+            'name': 'Office Closing',
+        }, {
+            'body': '<p>Only the checks</p>',
+            'internal_permission': 'write',
+            'name': 'Unrelated',
+        }])
+        result = self.env['knowledge.article'].get_user_ranked_articles('running check')
+        self.assertFalse(result, "Words are not stemmed with the 'simple' configuration")
+
+        # changing the configuration indexes the articles again
+        self.env['ir.config_parameter'].sudo().set_param('knowledge.full_text_search_config', 'english')
+
+        # words are matched on their stem, in the title (weighing more) and in the content
+        result = self.env['knowledge.article'].get_user_ranked_articles('running check')
+        self.assertEqual([a['id'] for a in result], (title_match + body_match).ids)
+        self.assertEqual(result[0]['root_article_id'], (title_match.id, f'📄 {title_match.name}'))
+
+        # the Command palette and the search view use the full text search
+        result = self.env['knowledge.article'].get_user_sorted_articles('running check')
+        self.assertEqual([a['id'] for a in result], (title_match + body_match).ids)
+        self.assertEqual(
+            self.env['knowledge.article'].search([('full_text', 'ilike', 'running check')]),
+            title_match + body_match,
+        )
+
+        # updating the content updates the index
+        other.write({'body': '<p>Runs checks</p>'})
+        result = self.env['knowledge.article'].get_user_ranked_articles('running check')
+        self.assertIn(other.id, [a['id'] for a in result])
+
+        # pagination
+        result = self.env['knowledge.article'].get_user_ranked_articles('running check', limit=1, offset=1)
+        self.assertEqual(len(result), 1)
+        self.assertNotEqual(result[0]['id'], title_match.id)
+
+        # hidden articles are only found in hidden mode
+        other.sudo().write({'is_article_visible_by_everyone': False})
+        result = self.env['knowledge.article'].get_user_ranked_articles('running check')
+        self.assertNotIn(other.id, [a['id'] for a in result])
+        result = self.env['knowledge.article'].get_user_ranked_articles('running check', hidden_mode=True)
+        self.assertEqual([a['id'] for a in result], other.ids)
+
 @tagged('knowledge_internals', 'knowledge_management')
 class TestKnowledgeArticleCopy(KnowledgeCommonBusinessCase):
     """ Test copy and duplication of articles """
@@ -244,6 +244,39 @@ class TestKnowledgeArticleUtilities(KnowledgeCommonWData):
         self.assertSetEqual((article_8 | article_4)._get_ancestor_ids(), {article_2.id, article_4.id})
         self.assertSetEqual((article_8 | article_11)._get_ancestor_ids(), {article_2.id, article_4.id, article_6.id})
 
+    @users('admin')
+    def test_article_permission_ancestors(self):
+        """ Ensure the ancestors used to compute members permissions are kept up
+        to date when articles are created, moved and (de)synchronized. """
+        Ancestor = self.env['knowledge.article.ancestor']
+        root = self.env['knowledge.article'].create({'name': 'Root', 'internal_permission': 'write'})
+        child = self.env['knowledge.article'].create({'name': 'Child', 'parent_id': root.id})
+        grand_child = self.env['knowledge.article'].create({'name': 'Grand-Child', 'parent_id': child.id})
+
+        def get_ancestors(article):
+            return Ancestor.search([('article_id', '=', article.id)], order='level').ancestor_id
+
+        def get_all_rows():
+            self.env.cr.execute("SELECT article_id, ancestor_id, level FROM knowledge_article_ancestor")
+            return set(self.env.cr.fetchall())
+
+        self.assertEqual(get_ancestors(grand_child), grand_child + child + root)
+
+        # desynchronized articles do not inherit from their parents anymore
+        child.write({'is_desynchronized': True, 'internal_permission': 'read'})
+        self.assertEqual(get_ancestors(child), child)
+        self.assertEqual(get_ancestors(grand_child), grand_child + child)
+
+        grand_child.move_to(parent_id=root.id)
+        self.assertEqual(get_ancestors(grand_child), grand_child + root)
+
+        child.write({'is_desynchronized': False})
+        self.assertEqual(get_ancestors(child), child + root)
+
+        rows = get_all_rows()
+        Ancestor._rebuild()
+        self.assertEqual(get_all_rows(), rows, 'Incremental updates should match a full computation')
+
 
 @tagged('knowledge_internals', 'knowledge_management')
 class TestKnowledgeCommonWDataInitialValue(KnowledgeCommonWData):
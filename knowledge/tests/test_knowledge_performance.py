@@ -21,7 +21,7 @@ class KnowledgePerformanceCase(KnowledgeCommonWData):
         a descendants checks which might be costly.
 
         Done as admin as only admin has access to Duplicate button currently."""
-        with self.assertQueryCount(admin=57):
+        with self.assertQueryCount(admin=61):
             workspace_children = self.workspace_children.with_env(self.env)
             shared = self.article_shared.with_env(self.env)
             _duplicates = (workspace_children + shared).copy_batch()
@@ -31,7 +31,7 @@ class KnowledgePerformanceCase(KnowledgeCommonWData):
     @warmup
     def test_article_creation_single_shared_grandchild(self):
         """ Test with 2 levels of hierarchy in a private/shared environment """
-        with self.assertQueryCount(employee=25):
+        with self.assertQueryCount(employee=27):
             _article = self.env['knowledge.article'].create({
                 'body': '<p>Hello</p>',
                 'name': 'Article in shared',
@@ -43,7 +43,7 @@ class KnowledgePerformanceCase(KnowledgeCommonWData):
     @users('employee')
     @warmup
     def test_article_creation_single_workspace(self):
-        with self.assertQueryCount(employee=22):
+        with self.assertQueryCount(employee=24):
             _article = self.env['knowledge.article'].create({
                 'body': '<p>Hello</p>',
                 'name': 'Article in workspace',
@@ -55,7 +55,7 @@ class KnowledgePerformanceCase(KnowledgeCommonWData):
     @users('employee')
     @warmup
     def test_article_creation_multi_roots(self):
-        with self.assertQueryCount(employee=24):
+        with self.assertQueryCount(employee=26):
             _article = self.env['knowledge.article'].create([
                 {'body': '<p>Hello</p>',
                  'internal_permission': 'write',
@@ -67,7 +67,7 @@ class KnowledgePerformanceCase(KnowledgeCommonWData):
     @users('employee')
     @warmup
     def test_article_creation_multi_shared_grandchild(self):
-        with self.assertQueryCount(employee=52):
+        with self.assertQueryCount(employee=54):
             _article = self.env['knowledge.article'].create([
                 {'body': '<p>Hello</p>',
                  'name': f'Article {index} in workspace',
@@ -114,6 +114,25 @@ class KnowledgePerformanceCase(KnowledgeCommonWData):
             writable_article = self.workspace_children[1].with_env(self.env)
             writable_article.move_to(parent_id=writable_article.parent_id.id, before_article_id=before_id)
 
+    @users('employee')
+    @warmup
+    def test_article_permissions_deep_tree(self):
+        """ Permissions are computed with one query each, whatever the depth of the tree """
+        article = self.article_workspace
+        for depth in range(20):
+            article = self.env['knowledge.article'].sudo().create({
+                'name': f'Article at depth {depth}',
+                'parent_id': article.id,
+            })
+        articles = article.with_env(self.env)
+        self.env.flush_all()
+
+        with self.assertQueryCount(employee=2):
+            internal_permissions = articles._get_internal_permission()
+            member_permissions = articles._get_partner_member_permissions(self.env.user.partner_id)
+        self.assertEqual(internal_permissions, {article.id: 'write'})
+        self.assertEqual(member_permissions, {})
+
     @users('employee')
     @warmup
     def test_get_user_sorted_articles(self):
@@ -116,7 +116,7 @@ class ResPartner(models.Model):
         aml_values = self.env[report.custom_handler_model_name]._get_aml_values(
             options=options,
             partner_ids=self.ids,
-        )
+        )[0]
         return {partner.id: aml_values.get(partner.id, []) for partner in self}
 
     def _get_move_type(self, line_value):
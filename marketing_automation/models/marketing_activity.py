@@ -4,6 +4,7 @@
 import json
 import logging
 import threading
+import time
 
 from ast import literal_eval
 from datetime import timedelta, date, datetime
@@ -328,10 +329,16 @@ class MarketingActivity(models.Model):
         # execute activity on their traces
         BATCH_SIZE = 500  # same batch size as the MailComposer
         for activity, traces in trace_to_activities.items():
+            start = time.monotonic()
             for traces_batch in (traces[i:i + BATCH_SIZE] for i in range(0, len(traces), BATCH_SIZE)):
                 activity.execute_on_traces(traces_batch)
                 if auto_commit:
                     self.env.cr.commit()
+            duration = time.monotonic() - start
+            _logger.info(
+                'Marketing Automation: activity <%s> of campaign <%s> executed on %s traces in %.2fs (%.1f traces/s)',
+                activity.id, activity.campaign_id.id, len(traces), duration, len(traces) / duration if duration else 0,
+            )
 
     def execute_on_traces(self, traces):
         """ Execute current activity on given traces.
@@ -356,7 +363,10 @@ class MarketingActivity(models.Model):
             rec_domain = literal_eval(self.campaign_id.domain or '[]')
         if rec_domain:
             user_id = self.campaign_id.user_id or self.env.user
-            rec_valid = self.env[self.model_name].with_context(lang=user_id.lang).search(rec_domain)
+            # only check the records of the traces, not the whole model
+            rec_valid = self.env[self.model_name].with_context(lang=user_id.lang).search(
+                expression.AND([rec_domain, [('id', 'in', list(set(traces.mapped('res_id'))))]])
+            )
             rec_ids_domain = set(rec_valid.ids)
 
             traces_allowed = traces.filtered(lambda trace: trace.res_id in rec_ids_domain)
@@ -384,6 +394,26 @@ class MarketingActivity(models.Model):
         if not self.server_action_id:
             return False
 
+        # Actions working on the whole recordset of their records are run once for all traces. If that
+        # fails, or for other actions (e.g. code using `record`), they are run record per record.
+        if self.server_action_id.state in self._get_batch_server_action_states():
+            action = self.server_action_id.with_context(
+                active_model=self.model_name,
+                active_ids=traces.mapped('res_id'),
+            )
+            try:
+                with self.env.cr.savepoint():
+                    action.run()
+            except Exception as e:
+                _logger.info('Marketing Automation: activity <%s> encountered server action issue on a batch of traces, '
+                             'running it trace per trace: %s', self.id, str(e))
+            else:
+                traces.write({
+                    'state': 'processed',
+                    'schedule_date': Datetime.now(),
+                })
+                return True
+
         # Do a loop here because we have to try / catch each execution separately to ensure other traces are executed
         # and proper state message stored
         traces_ok = self.env['marketing.trace']
@@ -412,6 +442,12 @@ class MarketingActivity(models.Model):
         })
         return True
 
+    @api.model
+    def _get_batch_server_action_states(self):
+        """ Server action types running on all their active records at once, the same way as
+        they run on each of them. """
+        return ['mail_post', 'followers', 'remove_followers', 'next_activity']
+
     def _execute_email(self, traces):
         # we only allow to continue if the user has sufficient rights, as a sudo() follows
         if not self.env.is_superuser() and not self.user_has_groups('marketing_automation.group_marketing_automation_user'):
@@ -10,7 +10,7 @@ from dateutil.relativedelta import relativedelta
 from odoo import api, fields, models, tools, _
 from odoo.fields import Datetime
 from odoo.exceptions import ValidationError
-from odoo.tools import convert
+from odoo.tools import convert, SQL
 
 
 class MarketingCampaign(models.Model):
@@ -327,16 +327,35 @@ class MarketingCampaign(models.Model):
             user_id = campaign.user_id or self.env.user
             RecordModel = self.env[campaign.model_name].with_context(lang=user_id.lang)
 
-            # Fetch existing participants
-            participants_data = participants.search_read([('campaign_id', '=', campaign.id)], ['res_id'])
-            existing_rec_ids = _uniquify_list([live_participant['res_id'] for live_participant in participants_data])
-
             record_domain = literal_eval(campaign.domain or "[]")
-            db_rec_ids = _uniquify_list(RecordModel.search(record_domain).ids)
-            to_create = [rid for rid in db_rec_ids if rid not in existing_rec_ids]  # keep ordered IDs
-            to_remove = set(existing_rec_ids) - set(db_rec_ids)
+            self.env.flush_all()
+
+            # Records matching the campaign domain without participant, in the order of the model
+            query = RecordModel._search(record_domain, order=RecordModel._order)
+            query.add_where(SQL(
+                "NOT EXISTS (SELECT 1 FROM marketing_participant participant WHERE participant.campaign_id = %s AND participant.res_id = %s)",
+                campaign.id, SQL.identifier(query.table, 'id'),
+            ))
+            self.env.cr.execute(query.select())
+            to_create = _uniquify_list([rec_id for rec_id, in self.env.cr.fetchall()])  # keep ordered IDs
+
+            # Participants whose record does not match the campaign domain anymore (or was deleted)
+            query = RecordModel._search(record_domain)
+            self.env.cr.execute(SQL(
+                """SELECT participant.id
+                     FROM marketing_participant participant
+                    WHERE participant.campaign_id = %s
+                      AND participant.state != 'unlinked'
+                      AND NOT EXISTS (SELECT 1 FROM %s WHERE %s AND %s = participant.res_id)""",
+                campaign.id, query.from_clause, query.where_clause, SQL.identifier(query.table, 'id'),
+            ))
+            participants_to_unlink = participants.browse([participant_id for participant_id, in self.env.cr.fetchall()])
+
             unique_field = campaign.unique_field_id.sudo()
             if unique_field.name != 'id':
+                # Fetch existing participants
+                participants_data = participants.search_read([('campaign_id', '=', campaign.id)], ['res_id'])
+                existing_rec_ids = _uniquify_list([live_participant['res_id'] for live_participant in participants_data])
                 without_duplicates = []
                 existing_records = RecordModel.with_context(prefetch_fields=False).browse(existing_rec_ids).exists()
                 # Split the read in batch of 1000 to avoid the prefetch
@@ -363,12 +382,7 @@ class MarketingCampaign(models.Model):
                 if auto_commit:
                     self.env.cr.commit()
 
-            if to_remove:
-                participants_to_unlink = participants.search([
-                    ('res_id', 'in', list(to_remove)),
-                    ('campaign_id', '=', campaign.id),
-                    ('state', '!=', 'unlinked'),
-                ])
+            if participants_to_unlink:
                 for index in range(0, len(participants_to_unlink), 1000):
                     participants_to_unlink[index:index+1000].action_set_unlink()
                     # Commit only every 100 operation to avoid committing to often
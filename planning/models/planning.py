@@ -7,8 +7,7 @@ import logging
 import pytz
 import uuid
 from math import modf
-from random import randint, shuffle
-import itertools
+from random import randint, Random
 
 from odoo import api, fields, models, _
 from odoo.addons.resource.models.utils import Intervals, sum_intervals, string_to_datetime
@@ -31,6 +30,17 @@ def days_span(start_datetime, end_datetime):
     return duration.days + 1
 
 
+def split_per_day(start, end, tz):
+    """ Splits the period between the aware datetimes start and end at midnight in the
+    timezone tz, and yields a tuple (day, start, end) for each day of the period. """
+    start, end = start.astimezone(tz), end.astimezone(tz)
+    while start < end:
+        midnight = tz.localize(datetime.combine(start.date() + timedelta(days=1), time.min))
+        day_end = min(end, midnight)
+        yield start.date(), start, day_end
+        start = day_end
+
+
 class Planning(models.Model):
     _name = 'planning.slot'
     _description = 'Planning Shift'
@@ -332,23 +342,45 @@ class Planning(models.Model):
                     day_total[slot.resource_id.id]
                 )['days']
 
+    def init(self):
+        super().init()
+        # Used to find the overlapping slots of a resource without scanning all its past slots.
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS planning_slot_resource_period_idx
+                ON planning_slot USING gist (tsrange(start_datetime, end_datetime))
+             WHERE resource_id IS NOT NULL
+        """)
+
+    def _get_overlap_slot_ids(self):
+        """ Returns the slots conflicting with the slots in self, as a dict mapping the
+        id of each slot having conflicts to the list of the conflicting slot ids.
+
+        Two slots of a resource conflict when their periods overlap and their allocated
+        percentages exceed 100% together. All the slots are handled in a single query,
+        which only looks up the slots overlapping their periods through the GiST index
+        on the periods of the slots. """
+        if not self.ids:
+            return {}
+        self.flush_model(['start_datetime', 'end_datetime', 'resource_id', 'allocated_percentage'])
+        self.env.cr.execute("""
+            SELECT S1.id, ARRAY_AGG(DISTINCT S2.id)
+              FROM planning_slot S1
+              JOIN planning_slot S2
+                ON tsrange(S2.start_datetime, S2.end_datetime) && tsrange(S1.start_datetime, S1.end_datetime)
+               AND S2.resource_id = S1.resource_id
+               AND S2.id <> S1.id
+             WHERE S1.id = ANY(%s)
+               AND S1.resource_id IS NOT NULL
+               AND S2.resource_id IS NOT NULL
+               AND S1.allocated_percentage + S2.allocated_percentage > 100
+          GROUP BY S1.id
+        """, [self.ids])
+        return dict(self.env.cr.fetchall())
+
     @api.depends('start_datetime', 'end_datetime', 'resource_id')
     def _compute_overlap_slot_count(self):
         if self.ids:
-            self.flush_model(['start_datetime', 'end_datetime', 'resource_id'])
-            query = """
-                SELECT S1.id,ARRAY_AGG(DISTINCT S2.id) as conflict_ids FROM
-                    planning_slot S1, planning_slot S2
-                WHERE
-                    S1.start_datetime < S2.end_datetime
-                    AND S1.end_datetime > S2.start_datetime
-                    AND S1.id <> S2.id AND S1.resource_id = S2.resource_id
-                    AND S1.allocated_percentage + S2.allocated_percentage > 100
-                    and S1.id in %s
-                GROUP BY S1.id;
-            """
-            self.env.cr.execute(query, (tuple(self.ids),))
-            overlap_mapping = dict(self.env.cr.fetchall())
+            overlap_mapping = self._get_overlap_slot_ids()
             for slot in self:
                 slot_result = overlap_mapping.get(slot.id, [])
                 slot.overlap_slot_count = len(slot_result)
@@ -381,21 +413,23 @@ class Planning(models.Model):
         if operator not in ['=', '>'] or not isinstance(value, int) or value != 0:
             raise NotImplementedError(_('Operation not supported, you should always compare overlap_slot_count to 0 value with = or > operator.'))
 
+        # The (NOT) EXISTS is correlated with the searched slots so that PostgreSQL only checks
+        # the slots matching the rest of the domain (e.g. the period displayed in the gantt view),
+        # each one with a lookup in the GiST index on the periods of the slots.
         query = """
             SELECT S1.id
             FROM planning_slot S1
-            WHERE EXISTS (
+            WHERE %s EXISTS (
                 SELECT 1
                   FROM planning_slot S2
-                 WHERE S1.id <> S2.id
-                   AND S1.resource_id = S2.resource_id
-                   AND S1.start_datetime < S2.end_datetime
-                   AND S1.end_datetime > S2.start_datetime
+                 WHERE tsrange(S2.start_datetime, S2.end_datetime) && tsrange(S1.start_datetime, S1.end_datetime)
+                   AND S2.resource_id = S1.resource_id
+                   AND S2.resource_id IS NOT NULL
+                   AND S1.id <> S2.id
                    AND S1.allocated_percentage + S2.allocated_percentage > 100
             )
-        """
-        operator_new = (operator == ">") and "inselect" or "not inselect"
-        return [('id', operator_new, (query, ()))]
+        """ % ("" if operator == ">" else "NOT")
+        return [('id', 'inselect', (query, ()))]
 
     @api.depends('start_datetime', 'end_datetime')
     def _compute_slot_duration(self):
@@ -954,35 +988,59 @@ class Planning(models.Model):
     def auto_plan_id(self):
         """ Used in the form view to auto plan a single shift.
         """
-        if not self.with_context(planning_slot_id=self.id).auto_plan_ids([('id', '=', self.id)]):
+        if self.resource_id:
             return self._get_notification_action("danger", _("There are no resources available for this open shift."))
+        assigned_shifts, unassigned_reasons = self._auto_plan()
+        if not assigned_shifts:
+            messages = {
+                'no_resource': _("There are no resources with the role of this open shift."),
+                'out_of_schedule': _("This open shift is outside the working schedule of the resources having its role."),
+                'allocated_hours': _("The allocated hours of this open shift exceed the working time of the resources having its role."),
+                'overload': _("The resources having the role of this open shift are already fully booked at that time."),
+            }
+            return self._get_notification_action("danger", messages.get(
+                unassigned_reasons.get(self), _("There are no resources available for this open shift.")
+            ))
 
     @api.model
     def auto_plan_ids(self, view_domain):
-        # We need to make sure we have a specified either one shift in particular or a period to look into.
-        assert self._context.get('planning_slot_id') or (
-            self._context.get('default_start_datetime') and self._context.get('default_end_datetime')
-        ), "`default_start_datetime` and `default_end_datetime` attributes should be in the context"
+        # We need to make sure we have a period to look into.
+        assert self._context.get('default_start_datetime') and self._context.get('default_end_datetime'), \
+            "`default_start_datetime` and `default_end_datetime` attributes should be in the context"
 
         # Our goal is to assign empty shifts in this period. So first, let's get them all!
-        open_shifts, min_start, max_end = self._read_group(
-            expression.AND([
-                view_domain,
-                [('resource_id', '=', False)],
-            ]),
-            [],
-            ['id:recordset', 'start_datetime:min', 'end_datetime:max'],
-        )[0]
-        if not open_shifts:
-            return []
+        open_shifts = self.search(expression.AND([
+            view_domain,
+            [('resource_id', '=', False)],
+        ]))
+        assigned_shifts, dummy = open_shifts._auto_plan()
+        return assigned_shifts.ids
+
+    def _auto_plan(self):
+        """ Assigns the open shifts in self to the resources having their role, in a single pass.
+
+        The shifts are handled chronologically and given to the first resource (default role
+        first, then other roles, in a random order) whose schedule covers the shift and who
+        would neither be overloaded on the days of the shift nor have an occupation rate
+        above 100% during it. The context key ``planning_auto_plan_seed`` makes that order
+        deterministic.
+
+        The schedules, the hours worked per day and the busy periods of the resources are
+        indexed per day once, so that checking a candidate only looks at the days of the shift.
+
+        :return: tuple (assigned shifts, dict {unassigned shift: reason}) where the reason is
+            'no_resource', 'out_of_schedule', 'allocated_hours' or 'overload'.
+        """
+        PlanningShift = self.env['planning.slot']
+        if not self:
+            return PlanningShift, {}
         user_tz = pytz.timezone(self.env.user.tz or 'UTC')
-        min_start = min_start.astimezone(user_tz)
-        max_end = max_end.astimezone(user_tz)
+        rng = Random(self._context.get('planning_auto_plan_seed'))
 
         # Get all resources that have the role set on those shifts as default role or in their roles.
         Resource = self.env['resource.resource']
-        # open_shifts.role_id.ids wouldn't include False, yet we need this information
-        open_shift_role_ids = [shift.role_id.id for shift in open_shifts]
+        # self.role_id.ids wouldn't include False, yet we need this information
+        open_shift_role_ids = [shift.role_id.id for shift in self]
         resources = Resource.search([
             ('calendar_id', '!=', False),
             '|',
@@ -998,208 +1056,118 @@ class Planning(models.Model):
                 if role == resource.default_role_id:
                     continue
                 resource_ids_per_role_id[role.id].append(resource.id)
-        # Get the schedule of each resource in the period.
+        hours_per_day_per_resource_id = {resource.id: resource.calendar_id.hours_per_day for resource in resources}
+
+        # Index the schedule of each resource in the period per day.
+        min_start = min(self.mapped('start_datetime')).replace(tzinfo=pytz.utc).astimezone(user_tz)
+        max_end = max(self.mapped('end_datetime')).replace(tzinfo=pytz.utc).astimezone(user_tz)
+        min_start += relativedelta(hour=0, minute=0, second=0, microsecond=0)
+        max_end += relativedelta(days=1, hour=0, minute=0, second=0, microsecond=0)
         schedule_intervals_per_resource_id, dummy = resources._get_valid_work_intervals(min_start, max_end)
+        schedule_per_resource_id_and_day = defaultdict(list)
+        for resource_id, intervals in schedule_intervals_per_resource_id.items():
+            for start, end, dummy in intervals:
+                for day, day_start, day_end in split_per_day(start, end, user_tz):
+                    schedule_per_resource_id_and_day[resource_id, day].append((day_start, day_end))
+
+        # Now let's get the assigned shifts and index the worked hours and the busy periods per day for each resource.
+        worked_hours_per_resource_id_and_day = defaultdict(float)
+        busy_periods_per_resource_id_and_day = defaultdict(list)
+
+        def add_busy_periods(resource_id, periods, rate):
+            for day, start, end in periods:
+                worked_hours_per_resource_id_and_day[resource_id, day] += rate * (end - start).total_seconds() / 3600
+                busy_periods_per_resource_id_and_day[resource_id, day].append((start, end, rate))
 
-        # Now let's get the assigned shifts and count the worked hours per day for each resource
-        min_start = min_start.astimezone(pytz.utc).replace(tzinfo=None) + relativedelta(hour=0, minute=0, second=0, microsecond=0)
-        max_end = max_end.astimezone(pytz.utc).replace(tzinfo=None) + relativedelta(days=1, hour=0, minute=0, second=0, microsecond=0)
-        PlanningShift = self.env['planning.slot']
         same_days_shifts = PlanningShift.search_read([
             ('resource_id', 'in', resources.ids),
-            ('end_datetime', '>', min_start),
-            ('start_datetime', '<', max_end),
+            ('end_datetime', '>', min_start.astimezone(pytz.utc).replace(tzinfo=None)),
+            ('start_datetime', '<', max_end.astimezone(pytz.utc).replace(tzinfo=None)),
         ], ['start_datetime', 'end_datetime', 'resource_id', 'allocated_hours'], load=False)
-        timeline_and_worked_hours_per_resource_id = self._shift_records_to_timeline_per_resource_id(same_days_shifts)
-
-        # Create an "empty timeline" with midnight for each day in the period
-        delta_days = (max_end - min_start).days
-        empty_timeline = [
-            ((min_start + relativedelta(days=i + 1)).astimezone(user_tz).replace(tzinfo=None), 0)
-            for i in range(delta_days)
-        ]
-
-        def find_resource(shift):
-            shift_intervals = Intervals([(
-                shift.start_datetime.astimezone(user_tz),
-                shift.end_datetime.astimezone(user_tz),
-                PlanningShift,
-            )])
+        for shift in same_days_shifts:
+            start = shift['start_datetime'].replace(tzinfo=pytz.utc)
+            end = shift['end_datetime'].replace(tzinfo=pytz.utc)
+            rate = shift['allocated_hours'] * 3600 / (end - start).total_seconds()
+            add_busy_periods(shift['resource_id'], split_per_day(start, end, user_tz), rate)
+
+        def get_max_occupation(busy_periods, start, end):
+            # Sweep over the busy periods intersecting [start, end[, ends being processed before starts.
+            increments = []
+            for busy_start, busy_end, rate in busy_periods:
+                if busy_start < end and busy_end > start:
+                    increments += [(max(busy_start, start), rate), (min(busy_end, end), -rate)]
+            increments.sort()
+            occupation = max_occupation = 0.0
+            for dummy, increment in increments:
+                occupation += increment
+                max_occupation = max(max_occupation, occupation)
+            return max_occupation
+
+        def check_resource(shift, shift_periods, resource_id):
+            """ Returns the periods of the shift within the schedule of the resource and
+            its occupation rate if the shift fits for the resource, else the reason why. """
+            periods = []
+            for day, start, end in shift_periods:
+                for schedule_start, schedule_end in schedule_per_resource_id_and_day[resource_id, day]:
+                    if schedule_start < end and schedule_end > start:
+                        periods.append((day, max(schedule_start, start), min(schedule_end, end)))
+            # If the shift is out of resource's schedule, skip it.
+            if not periods:
+                return 'out_of_schedule', None, None
+            rate = shift.allocated_hours * 3600 / sum((end - start).total_seconds() for dummy, start, end in periods)
+            if float_utils.float_compare(rate, 1.0, precision_digits=2) > 0:
+                return 'allocated_hours', None, None
+            # Check that the resource would not be overloaded these days...
+            hours_per_day = defaultdict(float)
+            for day, start, end in periods:
+                hours_per_day[day] += rate * (end - start).total_seconds() / 3600
+            for day, hours in hours_per_day.items():
+                if float_utils.float_compare(
+                    worked_hours_per_resource_id_and_day[resource_id, day] + hours,
+                    hours_per_day_per_resource_id[resource_id],
+                    precision_digits=2,
+                ) > 0:
+                    return 'overload', None, None
+            # ...and that it would not conflict with the resource's other shifts (sum of rates > 100%).
+            for day, start, end in periods:
+                busy_periods = busy_periods_per_resource_id_and_day[resource_id, day]
+                if float_utils.float_compare(rate + get_max_occupation(busy_periods, start, end), 1.0, precision_digits=2) > 0:
+                    return 'overload', None, None
+            return None, periods, rate
+
+        reasons_priority = ['no_resource', 'out_of_schedule', 'allocated_hours', 'overload']
+        shifts_per_resource_id = defaultdict(lambda: PlanningShift)
+        unassigned_reasons = {}
+        for shift in self.sorted(lambda shift: (shift.start_datetime, shift.id)):
+            shift_periods = list(split_per_day(
+                shift.start_datetime.replace(tzinfo=pytz.utc),
+                shift.end_datetime.replace(tzinfo=pytz.utc),
+                user_tz,
+            ))
+            reason = 'no_resource'
             for resources_dict in [resource_ids_per_default_role_id, resource_ids_per_role_id]:
-                resource_ids = resources_dict[shift.role_id.id]
-                shuffle(resource_ids)
-                for resource in Resource.browse(resource_ids):
-                    split_shift_intervals = shift_intervals & schedule_intervals_per_resource_id[resource.id]
-                    # If the shift is out of resource's schedule, skip it.
-                    if not split_shift_intervals:
+                resource_ids = list(resources_dict[shift.role_id.id])
+                rng.shuffle(resource_ids)
+                for resource_id in resource_ids:
+                    failure, periods, rate = check_resource(shift, shift_periods, resource_id)
+                    if failure:
+                        reason = max(reason, failure, key=reasons_priority.index)
                         continue
-                    rate = shift.allocated_hours * 3600 / sum(map(lambda x: (x[1] - x[0]).total_seconds(), split_shift_intervals))
-                    # Try to add the shift to the timeline.
-                    timeline = self._get_new_timeline_if_fits_in(
-                        split_shift_intervals,
-                        rate,
-                        resource.calendar_id.hours_per_day if resource.calendar_id else resource.company_id.resource_calendar_id.hours_per_day,
-                        timeline_and_worked_hours_per_resource_id[resource.id].copy(),
-                        empty_timeline,
-                    )
-                    # If we got a new timeline (not False), it means the shift fits for the resource
-                    # (no overload, no "occupation rate" > 100%).
-                    # If it fits, assign the shift to the resource and update the timeline.
-                    if timeline:
-                        shift.resource_id = resource
-                        timeline_and_worked_hours_per_resource_id[resource.id] = timeline
-                        return True
-            return False
-
-        return open_shifts.filtered(find_resource).ids
-
-# A. Represent the resoures shifts and the open shift on a timeline
-#   Legend
-#   ┏━━ : open shift                    ┌─────────────────── 2023/01/02 ────────────────┬─────────────────── 2023/01/03 ────────────────┐
-#   ┌── : resource's shifts             0 ───────────── 8 ~~~~~~~~~~~~~ 16 ──────────── 0 ───────────── 8 ~~~~~~~~~~~~~ 16 ──────────── 0
-#   ~~~ : resource's schedule           ├───────────────┼───────────────┼───────────────┼───────────────┼───────────────┼───────────────┤
-
-# a/ Allocated Hours (ah) :                             ┏━━ 3h ━┓                                               ┌────── 8h ─────┐
-#                                                       ┡━━━━━━━┹────────────────────── 7h ─────────────────────┴───────┬───────┘
-#                                                       └───────────────────────────────────────────────────────────────┘
-
-# b/ Rates [ah / (end - start)] :                       ┏━━ 75% ┓                                               ┌───── 100% ────┐
-#                                                       ┡━━━━━━━┹───────────────────── 25% ─────────────────────┴───────┬───────┘
-#                                                       └───────────────────────────────────────────────────────────────┘
-
-# c/ Increments Timeline :                             ┌↑75%
-#   Visual :                                           └↑25%    ↓75%                                            ↑100%   ↓25%    ↓100%
-#   Array :                                             ┗━━━━━━━┹───────────────────────────────────────────────┴───────┴───────┘
-# [
-#    (dt(2023, 1, 2,  8, 0), +1.00),
-#    (dt(2023, 1, 2, 12, 0), -0.75),
-#    (dt(2023, 1, 3, 12, 0), +1.00),
-#    (dt(2023, 1, 3, 16, 0), -0.25),
-#    (dt(2023, 1, 3, 20, 0), -1.00),
-# ]
-
-# d/ Values Timeline :
-#   Visual :                                            |100%   |25%                                            |125%   |100%   |0%
-#   Array :                                             ┗━━━━━━━┹───────────────────────────────────────────────┴───────┴───────┘
-# [
-#    (dt(2023, 1, 2,  8, 0),  1.00),
-#    (dt(2023, 1, 2, 12, 0),  0.25),
-#    (dt(2023, 1, 3, 12, 0),  1.25),
-#    (dt(2023, 1, 3, 16, 0),  1.00),
-#    (dt(2023, 1, 3, 20, 0),  0.00),
-# ]
-
-# B. Try to assign each open shift to a resource
-
-# 1) Check that the shift fits in the resource's schedule
-#   We just get the schedule intervals of the resource, convert the shift to intervals, and check the difference.
-
-# 2) Check that the resource would not be overloaded this day
-#   Delimit days with ghost events at 0:00. Then compute the total time worked per day and compare it to the resource's max load.
-#   We do so considering that every resource have the same time zone (the user's one).
-
-# 3) ...and that it would not conflict with the resource's other shifts (sum of rates > 100%)
-#   Visual :                            |0%             |100%   |25%                    |25%                    |125%   |100%   |0%     |0%
-#   Array :                             └────── A ──────┗━━ B ━━┹────────── C ──────────┴───────────────────────┴───────┴───────┴───────┘
-# [                                     ^                                               ^                                               ^
-#    (dt(2023, 1, 2,  0, 0),  0.00), <
-#    (dt(2023, 1, 2,  8, 0),  1.25),                         2) Worked Hours on 2023/01/02
-#    (dt(2023, 1, 2, 12, 0),  0.25),                            = 8h * 0% (A) + 4h * 125% (B) + 12h * 25% (C)
-#    (dt(2023, 1, 3,  0, 0),  0.25), <                          = 0h          + 5h            + 3h
-#    (dt(2023, 1, 3, 12, 0),  1.00),                            = 8h => OK
-#    (dt(2023, 1, 3, 16, 0),  0.75),
-#    (dt(2023, 1, 3, 20, 0),  0.00),                         3) rate(B) = 100% => OK
-#    (dt(2023, 1, 4,  0, 0),  0.00), <
-# ]
-
-    @api.model
-    def _shift_records_to_timeline_per_resource_id(self, records):
-        timeline_and_worked_hours_per_resource_id = defaultdict(list)
-        for record in records:
-            rate = record['allocated_hours'] * 3600 / (
-                fields.Datetime.from_string(record['end_datetime']) - fields.Datetime.from_string(record['start_datetime'])
-            ).total_seconds()
-            timeline_and_worked_hours_per_resource_id[record['resource_id']].extend([
-                (record['start_datetime'], rate), (record['end_datetime'], -rate)
-            ])
-        for resource_id, timeline in timeline_and_worked_hours_per_resource_id.items():
-            timeline_and_worked_hours_per_resource_id[resource_id] = self._increments_to_values(timeline)
-        return timeline_and_worked_hours_per_resource_id
-
-    @api.model
-    def _get_new_timeline_if_fits_in(self, split_shift_intervals, rate, resource_hours_per_day, timeline, empty_timeline):
-        if rate > 1:
-            return False
-        add_midnights = True
-        for split_shift_start, split_shift_end, _ in split_shift_intervals:
-            start = split_shift_start.astimezone(pytz.utc).replace(tzinfo=None)
-            end = split_shift_end.astimezone(pytz.utc).replace(tzinfo=None)
-            increments = self._values_to_increments(timeline) + [(start, rate), (end, -rate)]
-            if add_midnights:
-                # Add ghost events at 0:00 to delimit days. This condition prevents from adding ghost events on each iteration.
-                increments += empty_timeline
-                add_midnights = False
-            timeline = self._increments_to_values(increments, check=(start, end, resource_hours_per_day))
-            if not timeline:
-                return False
-        return timeline
-
-    @api.model
-    def _increments_to_values(self, increments, check=False):
-        """ Transform a timeline of increments into a timeline of values by accumulating the increments.
-            If check is a tuple (start, end, resource_hours_per_day), the timeline is checked to ensure
-            that the resource would not be overloaded this day or have an "occupation rate" > 100% between start and end.
-
-            :param increments: List of tuples (instant, increment).
-            :param check: False or a tuple (start, end, resource_hours_per_day).
-            :return: List of tuples (instant, value) if check is False or the timeline is valid, else False.
-        """
-        if not increments:
-            return []
-        if check:
-            start, end, resource_hours_per_day = check
-
-        values = []
-        # Sum and sort increments by instant.
-        increments = [
-            (group[0], sum(increment[1] for increment in group[1]))
-            for group in itertools.groupby(increments, key=lambda increment: increment[0])
-        ]
-        increments.sort(key=lambda x: x[0])
-
-        def get_instant_plus_days(instant, days):
-            return instant + relativedelta(days=days, hour=0, minute=0, second=0, microsecond=0)
-
-        hours_per_day = defaultdict(float)
-        last_instant, last_value = increments[0][0], 0.0
-        for increment in increments:
-            # Check if the resource is overloaded this day.
-            hours_per_day[last_instant.date()] += last_value * (increment[0] - last_instant).total_seconds() / 3600
-            if check and hours_per_day[last_instant.date()] > resource_hours_per_day and (
-                get_instant_plus_days(start, 0) <= last_instant < get_instant_plus_days(end, 1)
-            ):
-                return False
-            last_value += increment[1]
-            last_instant = increment[0]
-            # Check if the occupation rate exceeds 100%.
-            if check and last_value > 1 and start <= last_instant <= end:
-                return False
-            values.append((last_instant, last_value))
-        return values
-
-    @api.model
-    def _values_to_increments(self, values):
-        """ Transform a timeline of values into a timeline of increments by subtracting the values.
-
-            :param values: List of tuples (instant, value).
-            :return: List of tuples (instant, increment).
-        """
-        increments = []
-        last_value = 0
-        for value in values:
-            increments.append((value[0], value[1] - last_value))
-            last_value = value[1]
-        return increments
+                    # The shift fits for the resource: assign the shift to the resource and update its load.
+                    add_busy_periods(resource_id, periods, rate)
+                    shifts_per_resource_id[resource_id] += shift
+                    reason = None
+                    break
+                if not reason:
+                    break
+            if reason:
+                unassigned_reasons[shift] = reason
+
+        for resource_id, shifts in shifts_per_resource_id.items():
+            shifts.write({'resource_id': resource_id})
+        assigned_shifts = self.filtered(lambda shift: shift not in unassigned_reasons)
+        _logger.debug("Auto plan: %s open shifts assigned, %s left open", len(assigned_shifts), len(unassigned_reasons))
+        return assigned_shifts, unassigned_reasons
 
     # ----------------------------------------------------
     # Gantt - Calendar view
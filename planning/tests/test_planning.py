@@ -229,6 +229,83 @@ class TestPlanning(TestCommonPlanning, MockEmail):
         self.assertEqual(2, self.slot_6_2.overlap_slot_count, '2 slots overlap')
         self.assertEqual(0, self.slot_6_3.overlap_slot_count, 'no slot overlap')
 
+    def test_compute_overlap_multi_year_schedule(self):
+        """ The conflicts of a batch of slots are computed at once, whatever the history of the resources. """
+        start = datetime(2017, 1, 2, 8, 0)
+        slots = self.env['planning.slot'].create([{
+            'resource_id': resource.id,
+            'start_datetime': start + timedelta(weeks=week),
+            'end_datetime': start + timedelta(weeks=week, hours=8),
+        } for week in range(3 * 52) for resource in self.resource_bert + self.resource_joseph])
+        conflicts = self.env['planning.slot'].create([{
+            'resource_id': self.resource_bert.id,
+            'start_datetime': datetime(2018, 1, 1, 12, 0),
+            'end_datetime': datetime(2018, 1, 1, 18, 0),
+        }, {
+            'resource_id': self.resource_bert.id,
+            'start_datetime': datetime(2019, 1, 7, 16, 0),
+            'end_datetime': datetime(2019, 1, 7, 20, 0),
+        }])
+        bert_2018, bert_2019 = slots.filtered(
+            lambda slot: slot.resource_id == self.resource_bert
+            and slot.start_datetime in (datetime(2018, 1, 1, 8, 0), datetime(2019, 1, 7, 8, 0))
+        ).sorted('start_datetime')
+
+        all_slots = slots + conflicts
+        all_slots.invalidate_recordset(['overlap_slot_count', 'conflicting_slot_ids'])
+        with self.assertQueryCount(1):
+            overlaps = {slot: slot.conflicting_slot_ids for slot in all_slots if slot.overlap_slot_count}
+        self.assertEqual(overlaps, {
+            bert_2018: conflicts[0],
+            bert_2019: conflicts[1],
+            conflicts[0]: bert_2018,
+            conflicts[1]: bert_2019,
+        })
+
+        overlapping = self.env['planning.slot'].search([('id', 'in', all_slots.ids), ('overlap_slot_count', '>', 0)])
+        self.assertEqual(overlapping, bert_2018 + bert_2019 + conflicts)
+        not_overlapping = self.env['planning.slot'].search([('id', 'in', all_slots.ids), ('overlap_slot_count', '=', 0)])
+        self.assertEqual(not_overlapping, all_slots - overlapping)
+
+    def test_auto_plan_open_shifts(self):
+        cook, waiter = self.env['planning.role'].create([{'name': 'Cook'}, {'name': 'Waiter'}])
+        employees = self.env['hr.employee'].create([{
+            'name': name,
+            'tz': 'UTC',
+            'default_planning_role_id': cook.id,
+        } for name in ['Cook 1', 'Cook 2']])
+        morning = {'start_datetime': datetime(2019, 6, 3, 8, 0), 'end_datetime': datetime(2019, 6, 3, 12, 0)}
+        morning_shifts = self.env['planning.slot'].create([{**morning, 'role_id': cook.id}] * 3)
+        afternoon_shift, sunday_shift, waiter_shift = self.env['planning.slot'].create([{
+            'start_datetime': datetime(2019, 6, 3, 13, 0),
+            'end_datetime': datetime(2019, 6, 3, 17, 0),
+            'role_id': cook.id,
+        }, {
+            'start_datetime': datetime(2019, 6, 2, 8, 0),
+            'end_datetime': datetime(2019, 6, 2, 12, 0),
+            'role_id': cook.id,
+        }, {
+            **morning,
+            'role_id': waiter.id,
+        }])
+
+        open_shifts = (morning_shifts + afternoon_shift + sunday_shift + waiter_shift).with_context(planning_auto_plan_seed=42)
+        assigned_shifts, unassigned_reasons = open_shifts._auto_plan()
+        self.assertEqual(assigned_shifts, morning_shifts[:2] + afternoon_shift)
+        self.assertEqual(morning_shifts[:2].resource_id, employees.resource_id, "Each cook takes one of the morning shifts")
+        self.assertIn(afternoon_shift.resource_id, employees.resource_id)
+        self.assertEqual(unassigned_reasons, {
+            morning_shifts[2]: 'overload',
+            sunday_shift: 'out_of_schedule',
+            waiter_shift: 'no_resource',
+        })
+
+        # the same seed gives the same assignments
+        assignments = {shift: shift.resource_id for shift in assigned_shifts}
+        assigned_shifts.resource_id = False
+        open_shifts._auto_plan()
+        self.assertEqual({shift: shift.resource_id for shift in assigned_shifts}, assignments)
+
     def test_compute_datetime_with_template_slot(self):
         """ Test if the start and end datetimes of a planning.slot are correctly computed with the template slot
 
@@ -6,11 +6,14 @@ class PosPreparationDisplay(models.Model):
 
     def _get_pos_orders(self):
         self.ensure_one()
-        orders_completed = set()
-        orders_not_completed = set()
         Orders = self.env["pos_preparation_display.order"]
         pdis_orders = Orders.get_preparation_display_order(self.id)
-        pdis_order_ids = Orders.browse(obj["id"] for obj in pdis_orders)
+        return self._get_pos_orders_status(Orders.browse(obj["id"] for obj in pdis_orders))
+
+    def _get_pos_orders_status(self, pdis_order_ids):
+        self.ensure_one()
+        orders_completed = set()
+        orders_not_completed = set()
         last_stage = self.stage_ids[-1]
         for pdis_order_id in pdis_order_ids:
             order_stage_id = pdis_order_id.order_stage_ids[-1].stage_id
@@ -43,6 +46,32 @@ class PosPreparationDisplay(models.Model):
         super()._send_load_orders_message()
         self._send_orders_to_customer_display()
 
+    def _send_updated_orders_to_customer_display(self, orders):
+        """ Sends the status of the PoS orders of the given preparation orders only, instead of all the orders. """
+        self.ensure_one()
+        pos_orders = orders.pos_order_id
+        if not pos_orders:
+            return
+        pdis_order_ids = self.env["pos_preparation_display.order"].search(
+            [("pos_order_id", "in", pos_orders.ids)] + self._get_active_orders_domain()
+        )
+        pdis_order_ids._create_missing_order_stages(self)
+        pdis_order_ids = pdis_order_ids.filtered(
+            lambda order: not order._get_current_order_stage(self).done and order._export_for_ui(self)
+        )
+        self.env["bus.bus"]._sendone(
+            f"pos_tracking_display-{self.access_token}",
+            "UPDATE_ORDERS",
+            {
+                **self._get_pos_orders_status(pdis_order_ids),
+                "updated": pos_orders.mapped("tracking_number"),
+            },
+        )
+
+    def _send_update_orders_message(self, orders):
+        super()._send_update_orders_message(orders)
+        self._send_updated_orders_to_customer_display(orders)
+
     def open_customer_display(self):
         return {
             "type": "ir.actions.act_url",
@@ -12,6 +12,11 @@ const orderTrackingDisplayService = {
         bus_service.subscribe("NEW_ORDERS", (newOrders) => {
             Object.assign(orders, newOrders);
         });
+        bus_service.subscribe("UPDATE_ORDERS", ({ done, notDone, updated }) => {
+            const updatedOrders = new Set(updated);
+            orders.done = orders.done.filter((ref) => !updatedOrders.has(ref)).concat(done);
+            orders.notDone = orders.notDone.filter((ref) => !updatedOrders.has(ref)).concat(notDone);
+        });
         bus_service.start();
         return orders;
     },
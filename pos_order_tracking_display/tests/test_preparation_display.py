@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from unittest.mock import patch
+
+from odoo import Command
+from odoo.addons.point_of_sale.tests.common import TestPoSCommon
+
+import odoo.tests
+
+
+@odoo.tests.tagged('post_install', '-at_install')
+class TestPreparationDisplay(TestPoSCommon):
+
+    @classmethod
+    def setUpClass(cls, chart_template_ref=None):
+        super().setUpClass(chart_template_ref=chart_template_ref)
+        cls.config = cls.basic_config
+        cls.burger = cls.env['product.product'].create({
+            'name': 'Burger',
+            'available_in_pos': True,
+            'pos_categ_ids': [Command.create({'name': 'Food'})],
+        })
+
+    def test_update_orders_sent_to_customer_display(self):
+        preparation_display = self.env['pos_preparation_display.display'].create({
+            'name': 'Preparation Display',
+            'pos_config_ids': [(4, self.basic_config.id)],
+        })
+        self.open_new_session(0.0)
+        results = self.env['pos.order'].create_from_ui([self.create_ui_order_data([(self.burger, 1)])])
+        pos_order = self.env['pos.order'].browse(results[0]['id'])
+        order = self.env['pos_preparation_display.order'].create({
+            'displayed': True,
+            'pos_order_id': pos_order.id,
+            'preparation_display_order_line_ids': [Command.create({
+                'product_id': self.burger.id,
+                'product_quantity': 1,
+            })],
+        })
+
+        with patch.object(type(self.env['bus.bus']), '_sendone') as sendone, \
+                patch.object(type(order), 'get_preparation_display_order') as get_preparation_display_order:
+            preparation_display._send_update_orders_message(order)
+        get_preparation_display_order.assert_not_called()
+        notifications = {call.args[:2]: call.args[2] for call in sendone.call_args_list}
+        tracking_channel = (f'pos_tracking_display-{preparation_display.access_token}', 'UPDATE_ORDERS')
+        self.assertIn((f'preparation_display-{preparation_display.access_token}', 'update_orders'), notifications)
+        self.assertIn(tracking_channel, notifications, "The customer display is refreshed when orders come in")
+        self.assertEqual(notifications[tracking_channel], {
+            'done': [],
+            'notDone': [pos_order.tracking_number],
+            'updated': [pos_order.tracking_number],
+        }, "Only the status of the updated orders is sent")
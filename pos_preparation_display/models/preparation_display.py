@@ -1,4 +1,6 @@
 import secrets
+from datetime import timedelta
+
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
@@ -26,6 +28,25 @@ class PosPreparationDisplay(models.Model):
         readonly=True,
         default=lambda self: self._get_access_token())
 
+    def init(self):
+        self.env.cr.execute("SELECT id FROM pos_preparation_display_display")
+        for [display_id] in self.env.cr.fetchall():
+            self.browse(display_id)._create_notification_sequence()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        preparation_displays = super().create(vals_list)
+        for preparation_display in preparation_displays:
+            preparation_display._create_notification_sequence()
+        return preparation_displays
+
+    def unlink(self):
+        sequence_names = [preparation_display._get_notification_sequence_name() for preparation_display in self]
+        res = super().unlink()
+        for sequence_name in sequence_names:
+            self.env.cr.execute("DROP SEQUENCE IF EXISTS %s" % sequence_name)
+        return res
+
     @staticmethod
     def _get_access_token():
         return secrets.token_hex(16)
@@ -56,11 +77,33 @@ class PosPreparationDisplay(models.Model):
         return {
             'categories': self._get_pos_category_ids().read(['id', 'display_name', 'sequence']),
             'stages': self.stage_ids.read(),
-            'orders': self.env["pos_preparation_display.order"].get_preparation_display_order(self.id),
+            **self.get_orders_snapshot(),
             'attributes': self.env['product.attribute'].search([]).read(['id', 'name']),
             'attribute_values': self.env['product.template.attribute.value'].search([]).read(['id', 'name', 'attribute_id']),
         }
 
+    def get_orders_snapshot(self):
+        """ Returns the orders to show on the screen with the number of the last update they include. The
+        screen only reloads them when it receives an update whose number does not follow its own. """
+        self.ensure_one()
+        self.env.cr.execute("SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM %s" % self._get_notification_sequence_name())
+        [sequence] = self.env.cr.fetchone()
+        return {
+            'sequence': sequence,
+            'orders': self.env['pos_preparation_display.order'].get_preparation_display_order(self.id),
+        }
+
+    def _get_active_orders_domain(self):
+        """ Returns the domain of the orders loaded by the screen: the orders of its points of sale created during
+        the active window (in hours, 0 to load all of them) set by the pos_preparation_display.active_order_window
+        parameter. """
+        self.ensure_one()
+        domain = ['|', ('pos_config_id', 'in', self.get_pos_config_ids().ids), ('pos_order_id', '=', False)]
+        active_window = int(self.env['ir.config_parameter'].sudo().get_param('pos_preparation_display.active_order_window', 24))
+        if active_window > 0:
+            domain = [('create_date', '>=', fields.Datetime.now() - timedelta(hours=active_window))] + domain
+        return domain
+
     def open_reset_wizard(self):
         return {
             'name': _("Reset Preparation Display"),
@@ -103,10 +146,46 @@ class PosPreparationDisplay(models.Model):
                     current_order_stage.done = True
             preparation_display._send_load_orders_message()
 
+    def _get_notification_sequence_name(self):
+        self.ensure_one()
+        return 'pos_preparation_display_notification_%s' % self.id
+
+    def _create_notification_sequence(self):
+        self.env.cr.execute("CREATE SEQUENCE IF NOT EXISTS %s" % self._get_notification_sequence_name())
+
+    def _next_notification_sequence(self):
+        """ Returns the number of the next update sent to the screen. The numbers come from a PostgreSQL sequence of
+        the display, so that the points of sale sending orders at the same time do not wait for each other. A number
+        taken by a transaction that is rolled back, or that commits after a later one, makes the screen see a gap in
+        the numbers and reload its orders. The updates of a same order get their numbers in the order they commit, as
+        their transactions wait for each other on the rows of the order. """
+        self.env.cr.execute("SELECT nextval(%s)", [self._get_notification_sequence_name()])
+        [sequence] = self.env.cr.fetchone()
+        return sequence
+
     def _send_load_orders_message(self):
         self.ensure_one()
         self.env['bus.bus']._sendone(f'preparation_display-{self.access_token}', 'load_orders', {
             'preparation_display_id': self.id,
+            'sequence': self._next_notification_sequence(),
+        })
+
+    def _send_update_orders_message(self, orders):
+        """ Sends the given created or changed orders to the screen, instead of making it reload all its orders. """
+        self.ensure_one()
+        orders._create_missing_order_stages(self)
+        orders_ui = []
+        for order in orders:
+            current_order_stage = order._get_current_order_stage(self)
+            if current_order_stage and current_order_stage.done:
+                continue
+            order_ui = order._export_for_ui(self)
+            if order_ui:
+                orders_ui.append(order_ui)
+        self.env['bus.bus']._sendone(f'preparation_display-{self.access_token}', 'update_orders', {
+            'preparation_display_id': self.id,
+            'sequence': self._next_notification_sequence(),
+            'orders': orders_ui,
         })
 
     @api.depends('stage_ids', 'pos_config_ids', 'category_ids')
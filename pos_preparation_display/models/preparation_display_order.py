@@ -29,6 +29,7 @@ class PosPreparationDisplayOrder(models.Model):
         positive_orderlines = []
         negative_orderlines = []
         product_categories = []
+        changed_orders = self.env['pos_preparation_display.order']
 
         for orderline in preparation_display_order['preparation_display_order_line_ids']:
             product_categories.extend(orderline['product_category_ids'])
@@ -54,6 +55,7 @@ class PosPreparationDisplayOrder(models.Model):
                             if negative_orderline.get('attribute_value_ids') and set(negative_orderline.get('attribute_value_ids')) != set(orderline.attribute_value_ids.ids):
                                 continue
 
+                            changed_orders |= orderline.preparation_display_order_id
                             if orderline.product_quantity >= quantity_to_cancel:
                                 orderline.product_cancelled = quantity_to_cancel
                                 quantity_to_cancel = 0
@@ -67,16 +69,16 @@ class PosPreparationDisplayOrder(models.Model):
         if positive_orderlines:
             order_to_create = self._get_preparation_order_values(preparation_display_order)
             order_to_create['preparation_display_order_line_ids'] = positive_orderlines
-            self.create(order_to_create)
+            changed_orders |= self.create(order_to_create)
 
-        if positive_orderlines or negative_orderlines:
+        if changed_orders:
             preparation_displays = self.env['pos_preparation_display.display'].search([])
 
             for p_dis in preparation_displays:
                 p_dis_categories = p_dis._get_pos_category_ids()
 
                 if len(set(p_dis_categories.ids).intersection(product_categories)) > 0:
-                    p_dis._send_load_orders_message()
+                    p_dis._send_update_orders_message(changed_orders)
 
         order._update_last_order_changes()
         return order.last_order_preparation_change
@@ -145,27 +147,14 @@ class PosPreparationDisplayOrder(models.Model):
 
     def get_preparation_display_order(self, preparation_display_id):
         preparation_display = self.env['pos_preparation_display.display'].browse(preparation_display_id)
-        orders = self.env['pos_preparation_display.order'].search(['|', ('pos_config_id', 'in', preparation_display.get_pos_config_ids().ids), ('pos_order_id', '=', False)])
-        first_stage = preparation_display.stage_ids[0]
+        orders = self.env['pos_preparation_display.order'].search(preparation_display._get_active_orders_domain())
+        orders._create_missing_order_stages(preparation_display)
 
         preparation_display_orders = []
         for order in orders:
-            current_order_stage = None
-
-            if order.order_stage_ids:
-                filtered_stages = order.order_stage_ids.filtered(lambda stage: stage.preparation_display_id.id == preparation_display.id)
-                if filtered_stages:
-                    current_order_stage = filtered_stages[-1]
-
+            current_order_stage = order._get_current_order_stage(preparation_display)
             if current_order_stage and current_order_stage.done:
                 continue
-            elif not current_order_stage:
-                order.order_stage_ids.create({
-                    'preparation_display_id': preparation_display_id,
-                    'stage_id': first_stage.id,
-                    'order_id': order.id,
-                    'done': False
-                })
 
             order_ui = order._export_for_ui(preparation_display)
             if order_ui:
@@ -173,6 +162,21 @@ class PosPreparationDisplayOrder(models.Model):
 
         return preparation_display_orders
 
+    def _get_current_order_stage(self, preparation_display):
+        self.ensure_one()
+        filtered_stages = self.order_stage_ids.filtered(lambda stage: stage.preparation_display_id.id == preparation_display.id)
+        return filtered_stages[-1] if filtered_stages else None
+
+    def _create_missing_order_stages(self, preparation_display):
+        """ Places the orders which are not yet on the preparation display in its first stage. """
+        orders = self.filtered(lambda order: not order._get_current_order_stage(preparation_display))
+        return self.env['pos_preparation_display.order.stage'].create([{
+            'preparation_display_id': preparation_display.id,
+            'stage_id': preparation_display.stage_ids[0].id,
+            'order_id': order.id,
+            'done': False,
+        } for order in orders])
+
     def _export_for_ui(self, preparation_display):
         preparation_display_orderlines = []
 
@@ -191,12 +195,7 @@ class PosPreparationDisplayOrder(models.Model):
                 })
 
         if preparation_display_orderlines:
-            current_order_stage = None
-
-            if self.order_stage_ids:
-                filtered_stages = self.order_stage_ids.filtered(lambda stage: stage.preparation_display_id.id == preparation_display.id)
-                if filtered_stages:
-                    current_order_stage = filtered_stages[-1]
+            current_order_stage = self._get_current_order_stage(preparation_display)
 
             return {
                 'id': self.id,
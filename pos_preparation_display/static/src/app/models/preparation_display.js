@@ -28,6 +28,8 @@ export class PreparationDisplay extends Reactive {
         this.selectedCategories = new Set();
         this.selectedProducts = new Set();
         this.filteredOrders = [];
+        this.sequence = data.sequence; // number of the last orders update received
+        this.ordersSnapshot = null;
         this.rawData = {
             categories: data.categories,
             orders: data.orders,
@@ -185,16 +187,55 @@ export class PreparationDisplay extends Reactive {
     }
 
     async getOrders() {
-        this.rawData.orders = await this.orm.call(
-            "pos_preparation_display.order",
-            "get_preparation_display_order",
-            [[], this.id],
+        this.ordersSnapshot = this.orm.call(
+            "pos_preparation_display.display",
+            "get_orders_snapshot",
+            [[this.id]],
             {}
         );
+        try {
+            const { sequence, orders } = await this.ordersSnapshot;
+            this.sequence = sequence;
+            this.rawData.orders = orders;
+        } finally {
+            this.ordersSnapshot = null;
+        }
 
         this.processOrders();
     }
 
+    async wsLoadOrders(sequence) {
+        if (this.ordersSnapshot) {
+            await this.ordersSnapshot;
+        }
+        // The orders have already been reloaded since this message was sent.
+        if (sequence <= this.sequence) {
+            return;
+        }
+        return this.getOrders();
+    }
+
+    async wsUpdateOrders(sequence, orders) {
+        if (this.ordersSnapshot) {
+            await this.ordersSnapshot;
+        }
+        // The update is already included in the orders loaded since it was sent.
+        if (sequence <= this.sequence) {
+            return;
+        }
+        // An update has been missed, or is still on its way: reload all the orders.
+        if (sequence !== this.sequence + 1) {
+            return this.getOrders();
+        }
+
+        this.sequence = sequence;
+        for (const order of orders) {
+            this.removeOrder(order.id);
+            this.processOrder(order);
+        }
+        this.filterOrders();
+    }
+
     processCategories() {
         this.categories = Object.fromEntries(
             this.rawData.categories
@@ -217,36 +258,59 @@ export class PreparationDisplay extends Reactive {
             this.categories[index].orderlines = [];
         }
 
-        this.orders = this.rawData.orders.reduce((orders, order) => {
-            if (order.stage_id === null) {
-                order.stage_id = this.firstStage.id;
-            }
+        this.orders = {};
+        for (const order of this.rawData.orders) {
+            this.processOrder(order);
+        }
 
-            const orderObj = new Order(order);
+        this.filterOrders();
+        return this.orders;
+    }
 
-            orderObj.orderlines = order.orderlines.map((line) => {
-                const orderline = new Orderline(line, orderObj);
-                const product = new Product([orderline.productId, orderline.productName]);
+    processOrder(order) {
+        if (order.stage_id === null) {
+            order.stage_id = this.firstStage.id;
+        }
 
-                this.products[product.id] = product;
-                this.orderlines[orderline.id] = orderline;
-                orderline.productCategoryIds.forEach((categoryId) => {
-                    this.categories[categoryId]?.orderlines?.push(orderline);
-                    this.categories[categoryId]?.productIds?.add(orderline.productId);
-                });
+        const orderObj = new Order(order);
+
+        orderObj.orderlines = order.orderlines.map((line) => {
+            const orderline = new Orderline(line, orderObj);
+            const product = new Product([orderline.productId, orderline.productName]);
 
-                return orderline;
+            this.products[product.id] = product;
+            this.orderlines[orderline.id] = orderline;
+            orderline.productCategoryIds.forEach((categoryId) => {
+                this.categories[categoryId]?.orderlines?.push(orderline);
+                this.categories[categoryId]?.productIds?.add(orderline.productId);
             });
 
-            if (orderObj.orderlines.length > 0) {
-                orders[order.id] = orderObj;
-            }
+            return orderline;
+        });
 
-            return orders;
-        }, {});
+        if (orderObj.orderlines.length > 0) {
+            this.orders[order.id] = orderObj;
+        }
 
-        this.filterOrders();
-        return this.orders;
+        return orderObj;
+    }
+
+    removeOrder(orderId) {
+        const order = this.orders[orderId];
+        if (!order) {
+            return;
+        }
+
+        for (const orderline of order.orderlines) {
+            delete this.orderlines[orderline.id];
+            orderline.productCategoryIds.forEach((categoryId) => {
+                const category = this.categories[categoryId];
+                if (category?.orderlines) {
+                    category.orderlines = category.orderlines.filter((line) => line !== orderline);
+                }
+            });
+        }
+        delete this.orders[orderId];
     }
 
     wsChangeLinesStatus(linesStatus) {
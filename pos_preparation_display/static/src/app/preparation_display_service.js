@@ -32,7 +32,9 @@ const preparationDisplayService = {
 
                 switch (detail.type) {
                     case "load_orders":
-                        return preparationDisplayService.getOrders();
+                        return preparationDisplayService.wsLoadOrders(datas.sequence);
+                    case "update_orders":
+                        return preparationDisplayService.wsUpdateOrders(datas.sequence, datas.orders);
                     case "change_order_stage":
                         return preparationDisplayService.wsMoveToNextStage(
                             datas.order_id,
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from unittest.mock import patch
+
+from odoo import Command
+from odoo.addons.point_of_sale.tests.common import TestPoSCommon
+
+import odoo.tests
+
+
+@odoo.tests.tagged('post_install', '-at_install')
+class TestPreparationDisplay(TestPoSCommon):
+
+    @classmethod
+    def setUpClass(cls, chart_template_ref=None):
+        super().setUpClass(chart_template_ref=chart_template_ref)
+        cls.burger = cls.env['product.product'].create({
+            'name': 'Burger',
+            'available_in_pos': True,
+            'pos_categ_ids': [Command.create({'name': 'Food'})],
+        })
+
+    def test_update_orders(self):
+        preparation_display = self.env['pos_preparation_display.display'].create({
+            'name': 'Preparation Display',
+            'pos_config_ids': [(4, self.basic_config.id)],
+        })
+        snapshot = preparation_display.get_orders_snapshot()
+        self.assertEqual(snapshot, {'sequence': 0, 'orders': []})
+        order = self.env['pos_preparation_display.order'].create({
+            'displayed': True,
+            'preparation_display_order_line_ids': [Command.create({
+                'product_id': self.burger.id,
+                'product_quantity': 2,
+            })],
+        })
+
+        with patch.object(type(self.env['bus.bus']), '_sendone') as sendone:
+            preparation_display._send_update_orders_message(order)
+        channel, notification_type, payload = sendone.call_args.args
+        self.assertEqual((channel, notification_type), (f'preparation_display-{preparation_display.access_token}', 'update_orders'))
+        self.assertEqual(payload['sequence'], snapshot['sequence'] + 1, "Only the changed orders are sent, with the next number")
+        self.assertEqual([order_ui['id'] for order_ui in payload['orders']], order.ids)
+        self.assertEqual(payload['orders'][0]['stage_id'], preparation_display.stage_ids[0].id, "The order is placed in the first stage")
+
+        snapshot = preparation_display.get_orders_snapshot()
+        self.assertEqual(snapshot['sequence'], payload['sequence'])
+        self.assertEqual([order_ui['id'] for order_ui in snapshot['orders']], order.ids)
+
+    def test_notification_sequence_per_display(self):
+        display_1, display_2 = self.env['pos_preparation_display.display'].create([
+            {'name': 'Kitchen', 'pos_config_ids': [(4, self.basic_config.id)]},
+            {'name': 'Bar', 'pos_config_ids': [(4, self.basic_config.id)]},
+        ])
+        self.assertEqual(display_1._next_notification_sequence(), 1)
+        self.assertEqual(display_1._next_notification_sequence(), 2)
+        self.assertEqual(display_2._next_notification_sequence(), 1, "Each display numbers its own updates")
+        self.assertEqual(display_1.get_orders_snapshot()['sequence'], 2)
+
+        sequence_name = display_1._get_notification_sequence_name()
+        display_1.unlink()
+        self.env.cr.execute("SELECT 1 FROM pg_class WHERE relkind = 'S' AND relname = %s", [sequence_name])
+        self.assertFalse(self.env.cr.fetchall(), "The sequence of a deleted display is dropped")
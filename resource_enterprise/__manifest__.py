@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+{
+    'name': 'Resource Enterprise',
+    'category': 'Hidden',
+    'summary': 'Bridge module for resource and enterprise',
+    'version': '1.0',
+    'description': """
+Bridge module for resource and enterprise
+=========================================
+
+Keep the work intervals of the working schedules in cache, so that the gantt,
+planning, timesheet and helpdesk views don't expand the same schedules over the
+same weeks again and again.
+""",
+    'depends': ['resource'],
+    'auto_install': True,
+    'license': 'OEEL-1',
+}
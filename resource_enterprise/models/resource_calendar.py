@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+import itertools
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import timedelta
+
+from dateutil.relativedelta import relativedelta
+from pytz import utc
+
+from odoo import api, models
+from odoo.addons.resource.models.utils import Intervals
+
+# Table logging the committed changes of the data the work intervals depend on. Its rows are only inserted (and merged by
+# the garbage collection), so that the total weight visible by a transaction is the generation of its snapshot.
+WORK_INTERVALS_CHANGES_TABLE = 'resource_calendar_work_intervals_change'
+
+# Per-database, per-process hit/miss counters ; see resource.calendar._get_work_intervals_cache_stats()
+WORK_INTERVALS_CACHE_STATS = defaultdict(lambda: {'hit': 0, 'miss': 0, 'invalidated': 0})
+
+# Identifies the transactions modifying calendars, see resource.calendar._get_work_intervals_transaction_key
+_transaction_counter = itertools.count()
+
+
+class WorkIntervalsCache:
+    """ Least recently used work intervals, bounded by their number of entries and by the total number of intervals
+    they hold, as the intervals of a batch of resources over a long period can be numerous. """
+
+    def __init__(self, max_entries, max_intervals):
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self.max_entries = max_entries
+        self.max_intervals = max_intervals
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value):
+        size = 1 + sum(len(intervals) for intervals in value.values())
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or (self._size > self.max_intervals and len(self._entries) > 1):
+                dummy, (dummy, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+
+# Work intervals of the calendars, shared by the requests of the process (see resource.calendar._get_cached_work_intervals).
+# The keys start with the database and the generation of the snapshot of the transaction computing them.
+WORK_INTERVALS_CACHE = WorkIntervalsCache(max_entries=256, max_intervals=100000)
+
+
+def week_start(dt):
+    """ Returns the last monday at midnight (UTC) before the aware datetime dt. """
+    dt = dt.astimezone(utc)
+    return dt - timedelta(days=dt.weekday()) + relativedelta(hour=0, minute=0, second=0, microsecond=0)
+
+
+class ResourceCalendar(models.Model):
+    _inherit = 'resource.calendar'
+
+    def init(self):
+        super().init()
+        self.env.cr.execute(f"""
+            CREATE TABLE IF NOT EXISTS {WORK_INTERVALS_CHANGES_TABLE} (
+                id SERIAL PRIMARY KEY,
+                weight BIGINT NOT NULL DEFAULT 1
+            )
+        """)
+
+    def _work_intervals_batch(self, start_dt, end_dt, resources=None, domain=None, tz=None, compute_leaves=True):
+        """ The work intervals are computed over whole weeks and kept in WORK_INTERVALS_CACHE, which
+        is shared by the requests of the worker and outdated when the calendars, attendances,
+        leaves or resources are modified. The views mostly request the same weeks again, and
+        the windows of the deadline computations (e.g. the SLA policies) are aligned on them. """
+        if len(self) != 1 or domain is not None or not start_dt.tzinfo or not end_dt.tzinfo:
+            return super()._work_intervals_batch(start_dt, end_dt, resources=resources, domain=domain, tz=tz, compute_leaves=compute_leaves)
+
+        window_start = week_start(start_dt)
+        window_end = week_start(end_dt)
+        if window_end < end_dt:
+            window_end += timedelta(weeks=1)
+        stats = WORK_INTERVALS_CACHE_STATS[self.env.cr.dbname]
+        misses = stats['miss']
+        cached_intervals = self._get_cached_work_intervals(
+            window_start, window_end, tuple(resources.ids) if resources else (), tz, compute_leaves)
+        if stats['miss'] == misses:
+            stats['hit'] += 1
+
+        # Restrict the intervals of the weeks to the requested period, keeping the timezone of the resources.
+        return {
+            resource_id: Intervals([
+                (
+                    max(start, start_dt.astimezone(start.tzinfo)),
+                    min(stop, end_dt.astimezone(stop.tzinfo)),
+                    self.env[model].browse(record_ids),
+                )
+                for start, stop, model, record_ids in intervals
+                if start < end_dt and stop > start_dt
+            ])
+            for resource_id, intervals in cached_intervals.items()
+        }
+
+    def _get_cached_work_intervals(self, start_dt, end_dt, resource_ids, tz, compute_leaves):
+        key = (
+            self.env.cr.dbname, self._get_work_intervals_generation(), self._get_work_intervals_transaction_key(),
+            self.id, start_dt, end_dt, resource_ids, tz, compute_leaves, tuple(self.env.companies.ids),
+        )
+        cached_intervals = WORK_INTERVALS_CACHE.get(key)
+        if cached_intervals is not None:
+            return cached_intervals
+
+        WORK_INTERVALS_CACHE_STATS[self.env.cr.dbname]['miss'] += 1
+        resources = self.env['resource.resource'].browse(resource_ids)
+        intervals_per_resource = super()._work_intervals_batch(
+            start_dt, end_dt, resources=resources, tz=tz, compute_leaves=compute_leaves)
+        # Records are stored as ids, as the cache outlives the environment they belong to.
+        cached_intervals = {
+            resource_id: tuple((start, stop, records._name, tuple(records.ids)) for start, stop, records in intervals)
+            for resource_id, intervals in intervals_per_resource.items()
+        }
+        WORK_INTERVALS_CACHE.set(key, cached_intervals)
+        return cached_intervals
+
+    @api.model
+    def _get_work_intervals_generation(self):
+        """ Returns the generation of the work intervals in the snapshot of the current transaction: the number of changes
+        committed before it, read once per transaction. Intervals computed from an older snapshot are thus never stored
+        under the key of a newer generation. """
+        postcommit_data = self.env.cr.postcommit.data
+        if 'resource.work_intervals_generation' not in postcommit_data:
+            self.env.cr.execute(f"SELECT COALESCE(SUM(weight), 0) FROM {WORK_INTERVALS_CHANGES_TABLE}")
+            postcommit_data['resource.work_intervals_generation'] = self.env.cr.fetchone()[0]
+        return postcommit_data['resource.work_intervals_generation']
+
+    @api.model
+    def _get_work_intervals_transaction_key(self):
+        """ Returns None, or a key specific to the current transaction and to its last change of the calendars if it made
+        any: until it is committed, its intervals can't be shared with the other transactions, nor with its own requests
+        made before the change. """
+        return self.env.cr.postcommit.data.get('resource.work_intervals_transaction_key')
+
+    @api.model
+    def _invalidate_work_intervals_cache(self):
+        """ Outdates the cached work intervals: the transaction stops sharing the cache, and logs its change when it is
+        committed, which bumps the generation of the database for the transactions starting afterwards. The change is
+        inserted rather than counted in a single row, so that concurrent transactions never conflict on it. """
+        cr = self.env.cr
+        # The precommit hooks also run when flushing for a savepoint: the change may be logged more than once.
+        if not cr.precommit.data.get('resource.work_intervals_change_logged'):
+            def log_change():
+                cr.execute(f"INSERT INTO {WORK_INTERVALS_CHANGES_TABLE} DEFAULT VALUES")
+
+            cr.precommit.add(log_change)
+            cr.precommit.data['resource.work_intervals_change_logged'] = True
+        cr.postcommit.data['resource.work_intervals_transaction_key'] = next(_transaction_counter)
+        WORK_INTERVALS_CACHE_STATS[self.env.cr.dbname]['invalidated'] += 1
+
+    @api.autovacuum
+    def _gc_work_intervals_changes(self):
+        """ Merges the logged changes into a single row of the same total weight, so that the generation is unchanged
+        for all the snapshots. """
+        self.env.cr.execute(f"""
+            WITH deleted AS (
+                DELETE FROM {WORK_INTERVALS_CHANGES_TABLE} RETURNING weight
+            )
+            INSERT INTO {WORK_INTERVALS_CHANGES_TABLE} (weight)
+            SELECT SUM(weight) FROM deleted HAVING COUNT(*) > 0
+        """)
+
+    @api.model
+    def _get_work_intervals_cache_stats(self):
+        """ Returns the hit/miss/invalidation counters of the work intervals cache for the current
+        process and database. """
+        return dict(WORK_INTERVALS_CACHE_STATS[self.env.cr.dbname])
+
+    def write(self, vals):
+        res = super().write(vals)
+        self._invalidate_work_intervals_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return res
+
+
+class ResourceCalendarAttendance(models.Model):
+    _inherit = 'resource.calendar.attendance'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return res
+
+
+class ResourceCalendarLeaves(models.Model):
+    _inherit = 'resource.calendar.leaves'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return res
+
+
+class ResourceResource(models.Model):
+    _inherit = 'resource.resource'
+
+    def write(self, vals):
+        # The schedule of a resource depends on its calendar and its timezone.
+        res = super().write(vals)
+        if {'calendar_id', 'tz', 'company_id'} & vals.keys():
+            self.env['resource.calendar']._invalidate_work_intervals_cache()
+        return res
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+
+from datetime import datetime
+
+from pytz import timezone, utc
+
+from odoo.addons.resource_enterprise.models.resource_calendar import WorkIntervalsCache
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestWorkIntervalsCache(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.calendar = cls.env['resource.calendar'].create({
+            'name': 'Classic 40h/week',
+            'tz': 'Europe/Brussels',
+            'hours_per_day': 8.0,
+            'attendance_ids': [
+                (0, 0, {'name': 'Morning', 'dayofweek': str(day), 'hour_from': 8, 'hour_to': 12, 'day_period': 'morning'})
+                for day in range(5)
+            ] + [
+                (0, 0, {'name': 'Afternoon', 'dayofweek': str(day), 'hour_from': 13, 'hour_to': 17, 'day_period': 'afternoon'})
+                for day in range(5)
+            ],
+        })
+        cls.resource = cls.env['resource.resource'].create({
+            'name': 'Bert',
+            'calendar_id': cls.calendar.id,
+            'tz': 'Europe/Brussels',
+        })
+
+    def get_uncached_intervals(self, start, end):
+        # An explicit domain bypasses the cache
+        intervals = self.calendar._work_intervals_batch(start, end, resources=self.resource, domain=[])
+        return {resource_id: list(resource_intervals) for resource_id, resource_intervals in intervals.items()}
+
+    def get_cached_intervals(self, start, end):
+        intervals = self.calendar._work_intervals_batch(start, end, resources=self.resource)
+        return {resource_id: list(resource_intervals) for resource_id, resource_intervals in intervals.items()}
+
+    def test_work_intervals_cache(self):
+        brussels = timezone('Europe/Brussels')
+        # From Wednesday 10:00 to Friday 15:00 in Brussels, requested in UTC
+        start = brussels.localize(datetime(2023, 6, 14, 10, 0)).astimezone(utc)
+        end = brussels.localize(datetime(2023, 6, 16, 15, 0)).astimezone(utc)
+        Calendar = self.env['resource.calendar']
+
+        stats = Calendar._get_work_intervals_cache_stats()
+        cached_intervals = self.get_cached_intervals(start, end)
+        self.assertEqual(cached_intervals, self.get_uncached_intervals(start, end))
+        first_interval_start = cached_intervals[self.resource.id][0][0]
+        self.assertEqual(first_interval_start.tzinfo.zone, 'Europe/Brussels', "Intervals keep the timezone of the resource")
+        self.assertEqual(first_interval_start.hour, 10)
+        self.assertEqual(Calendar._get_work_intervals_cache_stats()['miss'], stats['miss'] + 1)
+
+        # Another period of the same week is read from the cache
+        monday = brussels.localize(datetime(2023, 6, 12, 0, 0))
+        tuesday = brussels.localize(datetime(2023, 6, 13, 12, 30))
+        stats = Calendar._get_work_intervals_cache_stats()
+        self.assertEqual(self.get_cached_intervals(monday, tuesday), self.get_uncached_intervals(monday, tuesday))
+        new_stats = Calendar._get_work_intervals_cache_stats()
+        self.assertEqual(new_stats['miss'], stats['miss'])
+        self.assertEqual(new_stats['hit'], stats['hit'] + 1)
+
+        # Leaves invalidate the cache
+        self.env['resource.calendar.leaves'].create({
+            'name': 'Day off',
+            'calendar_id': self.calendar.id,
+            'resource_id': self.resource.id,
+            'date_from': datetime(2023, 6, 15, 0, 0),
+            'date_to': datetime(2023, 6, 15, 23, 59),
+        })
+        self.assertGreater(Calendar._get_work_intervals_cache_stats()['invalidated'], stats['invalidated'])
+        cached_intervals = self.get_cached_intervals(start, end)
+        self.assertEqual(cached_intervals, self.get_uncached_intervals(start, end))
+        self.assertFalse(any(
+            interval_start.day == 15 for interval_start, dummy, dummy in cached_intervals[self.resource.id]
+        ), "The day off is not worked anymore")
+
+    def test_work_intervals_cache_size(self):
+        cache = WorkIntervalsCache(max_entries=10, max_intervals=5)
+        interval = (datetime(2023, 6, 12, 8), datetime(2023, 6, 12, 12), 'resource.calendar.attendance', (1,))
+        cache.set('three intervals', {self.resource.id: (interval,) * 3})
+        cache.set('one interval', {self.resource.id: (interval,)})
+        self.assertIsNone(cache.get('three intervals'), "The least recently used entry is evicted past the number of intervals")
+        self.assertEqual(cache.get('one interval'), {self.resource.id: (interval,)})
@@ -395,8 +395,8 @@ class AmazonAccount(models.Model):
 
         Note: This method is called by the `ir_cron_sync_amazon_orders` cron.
 
-        :param bool auto_commit: Whether the database cursor should be committed as soon as an order
-                                 is successfully synchronized.
+        :param bool auto_commit: Whether the database cursor should be committed as soon as a batch
+                                 of orders is synchronized.
         :return: None
         """
         accounts = self or self.search([])
@@ -430,15 +430,42 @@ class AmazonAccount(models.Model):
                         orders_batch_data['LastUpdatedBefore']
                     )
 
+                    # Look up the existing sales orders, pull the items of the orders to create and
+                    # look up their partners and products for the whole batch before processing it.
+                    # The order data with a malformed reference are left out; they are processed on
+                    # their own to fail as business errors.
+                    batch_orders_data = [
+                        order_data for order_data in orders_data
+                        if isinstance(order_data.get('AmazonOrderId'), str)
+                    ]
+                    orders = account._get_orders_by_amazon_ref(batch_orders_data)
+                    items_data, rate_limit_error = account._pull_orders_items_data(
+                        batch_orders_data, orders
+                    )
+                    batch_records = account._prefetch_orders_records(
+                        batch_orders_data, orders, items_data
+                    )
+
                     # Process the batch one order data at a time.
                     for order_data in orders_data:
+                        amazon_order_ref = order_data.get('AmazonOrderId')
+                        order = order_items_data = None
+                        if isinstance(amazon_order_ref, str):
+                            order = orders[amazon_order_ref]
+                            order_items_data = items_data.get(amazon_order_ref)
+                            if rate_limit_error and amazon_order_ref not in items_data \
+                                    and account._is_order_to_create(order_data, order):
+                                # The items of the remaining orders could not be pulled.
+                                raise rate_limit_error
                         try:
                             with self.env.cr.savepoint():
-                                account._process_order_data(order_data)
+                                account._process_order_data(
+                                    order_data, order=order, items_data=order_items_data,
+                                    batch_records=batch_records,
+                                )
                         except amazon_utils.AmazonRateLimitError:
                             raise  # Don't treat a rate limit error as a business error.
                         except Exception as error:
-                            amazon_order_ref = order_data['AmazonOrderId']
                             if isinstance(error, psycopg2.OperationalError) \
                                 and error.pgcode in CONCURRENCY_ERRORS:
                                 _logger.info(
@@ -460,8 +487,8 @@ class AmazonAccount(models.Model):
                                     exc_info=True
                                 )
                                 # Dismiss business errors to allow the synchronization to skip the
-                                # problematic orders and require synchronizing them manually.
-                                self.env.cr.rollback()
+                                # problematic orders and require synchronizing them manually. The
+                                # savepoint already discarded the changes made for these order data.
                                 account._handle_sync_failure(
                                     flow='order_sync', amazon_order_ref=amazon_order_ref
                                 )
@@ -471,9 +498,9 @@ class AmazonAccount(models.Model):
                         # as a backup and set it to be the last synchronization date of the account.
                         last_order_update = dateutil.parser.parse(order_data['LastUpdateDate'])
                         account.last_orders_sync = last_order_update.replace(tzinfo=None)
-                        if auto_commit:
-                            with amazon_utils.preserve_credentials(account):
-                                self.env.cr.commit()  # Commit to mitigate an eventual cron kill.
+                    if auto_commit:
+                        with amazon_utils.preserve_credentials(account):
+                            self.env.cr.commit()  # Commit to mitigate an eventual cron kill.
             except amazon_utils.AmazonRateLimitError as error:
                 _logger.info(
                     "Rate limit reached while synchronizing sales orders for Amazon account with "
@@ -529,7 +556,174 @@ class AmazonAccount(models.Model):
             'res_id': order.id,
         }
 
-    def _process_order_data(self, order_data):
+    def _get_orders_by_amazon_ref(self, orders_data):
+        """ Search the sales orders matching the provided order data.
+
+        :param list orders_data: The data of the orders to search.
+        :return: The matching sales orders, or an empty recordset if there is none, indexed by
+                 Amazon order reference.
+        :rtype: dict
+        """
+        amazon_order_refs = [order_data['AmazonOrderId'] for order_data in orders_data]
+        orders = self.env['sale.order'].search([('amazon_order_ref', 'in', amazon_order_refs)])
+        return {
+            **dict.fromkeys(amazon_order_refs, self.env['sale.order']),
+            **{order.amazon_order_ref: order for order in orders},
+        }
+
+    def _is_order_to_create(self, order_data, order):
+        """ Return whether a sales order must be created for the provided order data.
+
+        :param dict order_data: The order data.
+        :param recordset order: The matching sales order, if any, as a `sale.order` record.
+        :return: Whether a sales order must be created.
+        :rtype: bool
+        """
+        statuses_to_synchronize = const.STATUS_TO_SYNCHRONIZE.get(
+            order_data.get('FulfillmentChannel'), ()
+        )
+        return not order and order_data.get('OrderStatus') in statuses_to_synchronize
+
+    def _pull_orders_items_data(self, orders_data, orders):
+        """ Pull the item data of the orders for which a sales order must be created.
+
+        The items are pulled in the order of the order data. If the rate limit is reached, the items
+        already pulled are returned with the error so that the orders preceding the first order
+        whose items are missing can still be synchronized.
+
+        Note: self.ensure_one()
+
+        :param list orders_data: The data of the orders to synchronize.
+        :param dict orders: The existing sales orders, indexed by Amazon order reference.
+        :return: The items data indexed by Amazon order reference, and the rate limit error, if any.
+        :rtype: tuple[dict, AmazonRateLimitError]
+        """
+        self.ensure_one()
+        items_data = {}
+        for order_data in orders_data:
+            amazon_order_ref = order_data['AmazonOrderId']
+            if not self._is_order_to_create(order_data, orders[amazon_order_ref]):
+                continue
+            try:
+                items_data[amazon_order_ref] = self._pull_items_data(amazon_order_ref)
+            except amazon_utils.AmazonRateLimitError as error:
+                return items_data, error
+            except Exception:
+                # Pull the items again when processing the order, to fail as a business error.
+                items_data[amazon_order_ref] = None
+        return items_data, None
+
+    def _pull_items_data(self, amazon_order_ref):
+        """ Pull all item data for the order to synchronize.
+
+        Note: self.ensure_one()
+
+        :param str amazon_order_ref: The Amazon reference of the order to synchronize.
+        :return: The items data.
+        :rtype: list
+        """
+        self.ensure_one()
+        items_data = []
+        # Order items are pulled in batches. If more order items than those returned can be
+        # synchronized, the request results are paginated and the next page holds another batch.
+        has_next_page = True
+        payload = {}
+        while has_next_page:
+            # Pull the next batch of order items.
+            items_batch_data, has_next_page = amazon_utils.pull_batch_data(
+                self, 'getOrderItems', payload, path_parameter=amazon_order_ref
+            )
+            items_data += items_batch_data['OrderItems']
+        return items_data
+
+    def _prefetch_orders_records(self, orders_data, orders, items_data):
+        """ Search the partners, offers and products needed to create the sales orders of a batch.
+
+        The records are searched once for the whole batch rather than once per order. Only records
+        that exist before the batch is processed are returned: the records created while processing
+        an order, and those missing from the returned records, are searched for each order as usual.
+
+        Note: self.ensure_one()
+
+        :param list orders_data: The data of the orders to synchronize.
+        :param dict orders: The existing sales orders, indexed by Amazon order reference.
+        :param dict items_data: The items data of the orders to create, indexed by Amazon order
+                                reference.
+        :return: The records indexed by the values they are searched with, per kind of records:
+                 `countries`, `states`, `contacts`, `deliveries`, `offers` and `products`.
+        :rtype: dict
+        """
+        def get_str(data_, key_):
+            """ Return the value of the key in the data, if it is a string, or an empty string. """
+            value_ = data_.get(key_, '') if isinstance(data_, dict) else ''
+            return value_ if isinstance(value_, str) else ''
+
+        self.ensure_one()
+
+        addresses, buyers_info, skus, product_codes = [], [], set(), set()
+        for order_data in orders_data:
+            amazon_order_ref = order_data['AmazonOrderId']
+            if not self._is_order_to_create(order_data, orders[amazon_order_ref]):
+                continue
+            addresses.append(order_data.get('ShippingAddress'))
+            buyers_info.append(order_data.get('BuyerInfo'))
+            product_codes.add(get_str(order_data, 'ShipServiceLevel'))
+            for item_data in items_data.get(amazon_order_ref) or []:
+                skus.add(get_str(item_data, 'SellerSKU'))
+        skus.discard('')
+        product_codes.discard('')
+
+        company_domain = ['|', ('company_id', '=', False), ('company_id', '=', self.company_id.id)]
+        countries = self.env['res.country'].search([
+            ('code', 'in', list({get_str(address, 'CountryCode') for address in addresses})),
+        ])
+        states = self.env['res.country.state'].search([('country_id', 'in', countries.ids)])
+        contacts = self.env['res.partner'].search([
+            ('type', '=', 'contact'),
+            ('name', 'in', list({get_str(buyer_info, 'BuyerName') for buyer_info in buyers_info})),
+            ('amazon_email', 'in', list(
+                {get_str(buyer_info, 'BuyerEmail') for buyer_info in buyers_info} - {''}
+            )),
+            *company_domain,
+        ])
+        deliveries = self.env['res.partner'].search([
+            ('parent_id', 'in', contacts.ids), ('type', '=', 'delivery'), *company_domain,
+        ])
+        offers = self.env['amazon.offer'].search(
+            [('account_id', '=', self.id), ('sku', 'in', list(skus))]
+        )
+        products = self.env['product.product'].search([
+            *self.env['product.product']._check_company_domain(self.company_id),
+            ('default_code', 'in', list(skus | product_codes)),
+        ])
+
+        # Index the records in their search order so that the first match is the one that the
+        # search with a limit of one would return.
+        batch_records = {
+            'countries': {},
+            'states': {},
+            'contacts': {},
+            'deliveries': {},
+            'offers': {offer.sku: offer for offer in offers},
+            'products': {},
+        }
+        for country in countries:
+            batch_records['countries'].setdefault(country.code, country)
+        for state in states:
+            for state_code in (state.code, state.name):
+                batch_records['states'].setdefault((state.country_id.id, state_code.lower()), state)
+        for contact in contacts:
+            batch_records['contacts'].setdefault((contact.name, contact.amazon_email), contact)
+        for delivery in deliveries:
+            batch_records['deliveries'].setdefault((
+                delivery.parent_id.id, delivery.name, delivery.street, delivery.zip, delivery.city,
+                delivery.country_id.id, delivery.state_id.id,
+            ), []).append(delivery)
+        for product in products:
+            batch_records['products'].setdefault(product.default_code, product)
+        return batch_records
+
+    def _process_order_data(self, order_data, order=None, items_data=None, batch_records=None):
         """ Process the provided order data and return the matching sales order, if any.
 
         If no matching sales order is found, a new one is created if it is in a 'synchronizable'
@@ -541,22 +735,30 @@ class AmazonAccount(models.Model):
         Note: self.ensure_one()
 
         :param dict order_data: The order data to process.
+        :param recordset order: The sales order matching the order data, as a `sale.order` record,
+                                if it was already searched.
+        :param list items_data: The item data of the order, if they were already pulled.
+        :param dict batch_records: The records searched for the batch of the order, as returned by
+                                   `_prefetch_orders_records`, if any.
         :return: The matching Amazon order, if any, as a `sale.order` record.
         :rtype: recordset of `sale.order`
         """
         self.ensure_one()
 
-        # Search for the sales order based on its Amazon order reference.
         amazon_order_ref = order_data['AmazonOrderId']
-        order = self.env['sale.order'].search(
-            [('amazon_order_ref', '=', amazon_order_ref)], limit=1
-        )
+        if order is None:
+            # Search for the sales order based on its Amazon order reference.
+            order = self.env['sale.order'].search(
+                [('amazon_order_ref', '=', amazon_order_ref)], limit=1
+            )
         amazon_status = order_data['OrderStatus']
         fulfillment_channel = order_data['FulfillmentChannel']
         if not order:  # No sales order was found with the given Amazon order reference.
-            if amazon_status in const.STATUS_TO_SYNCHRONIZE[fulfillment_channel]:
+            if self._is_order_to_create(order_data, order):
                 # Create the sales order and generate stock moves depending on the Amazon channel.
-                order = self._create_order_from_data(order_data)
+                order = self._create_order_from_data(
+                    order_data, items_data=items_data, batch_records=batch_records
+                )
                 if order.amazon_channel == 'fba':
                     self._generate_stock_moves(order)
                 elif order.amazon_channel == 'fbm':
@@ -599,12 +801,15 @@ class AmazonAccount(models.Model):
                 )
         return order
 
-    def _create_order_from_data(self, order_data):
+    def _create_order_from_data(self, order_data, items_data=None, batch_records=None):
         """ Create a new sales order based on the provided order data.
 
         Note: self.ensure_one()
 
         :param dict order_data: The order data to create a sales order from.
+        :param list items_data: The item data of the order, if they were already pulled.
+        :param dict batch_records: The records searched for the batch of the order, as returned by
+                                   `_prefetch_orders_records`, if any.
         :return: The newly created sales order.
         :rtype: record of `sale.order`
         """
@@ -613,18 +818,21 @@ class AmazonAccount(models.Model):
         # Prepare the order line values.
         shipping_code = order_data.get('ShipServiceLevel')
         shipping_product = self._find_matching_product(
-            shipping_code, 'shipping_product', 'Shipping', 'service'
+            shipping_code, 'shipping_product', 'Shipping', 'service', batch_records=batch_records
         )
         currency = self.env['res.currency'].with_context(active_test=False).search(
             [('name', '=', order_data['OrderTotal']['CurrencyCode'])], limit=1
         )
         amazon_order_ref = order_data['AmazonOrderId']
-        contact_partner, delivery_partner = self._find_or_create_partners_from_data(order_data)
+        contact_partner, delivery_partner = self._find_or_create_partners_from_data(
+            order_data, batch_records=batch_records
+        )
         fiscal_position = self.env['account.fiscal.position'].with_company(
             self.company_id
         )._get_fiscal_position(contact_partner, delivery_partner)
         order_lines_values = self._prepare_order_lines_values(
-            order_data, currency, fiscal_position, shipping_product
+            order_data, currency, fiscal_position, shipping_product, items_data=items_data,
+            batch_records=batch_records,
         )
 
         # Create the sales order.
@@ -657,18 +865,21 @@ class AmazonAccount(models.Model):
             mail_create_nosubscribe=True
         ).with_company(self.company_id).create(order_vals)
 
-    def _find_or_create_partners_from_data(self, order_data):
+    def _find_or_create_partners_from_data(self, order_data, batch_records=None):
         """ Find or create the contact and delivery partners based on the provided order data.
 
         Note: self.ensure_one()
 
         :param dict order_data: The order data to find or create the partners from.
+        :param dict batch_records: The records searched for the batch of the order, as returned by
+                                   `_prefetch_orders_records`, if any.
         :return: The contact and delivery partners, as `res.partner` records. When the contact
                  partner acts as delivery partner, the records are the same.
         :rtype: tuple[record of `res.partner`, record of `res.partner`]
         """
         self.ensure_one()
 
+        batch_records = batch_records or {}
         amazon_order_ref = order_data['AmazonOrderId']
         anonymized_email = order_data['BuyerInfo'].get('BuyerEmail', '')
         buyer_name = order_data['BuyerInfo'].get('BuyerName', '')
@@ -684,11 +895,13 @@ class AmazonAccount(models.Model):
         state_code = order_data['ShippingAddress'].get('StateOrRegion', '')
         phone = order_data['ShippingAddress'].get('Phone', '')
         is_company = order_data['ShippingAddress'].get('AddressType') == 'Commercial'
-        country = self.env['res.country'].search([('code', '=', country_code)], limit=1)
-        state = self.env['res.country.state'].search([
-            ('country_id', '=', country.id),
-            '|', ('code', '=ilike', state_code), ('name', '=ilike', state_code),
-        ], limit=1)
+        country = batch_records.get('countries', {}).get(country_code) \
+            or self.env['res.country'].search([('code', '=', country_code)], limit=1)
+        state = batch_records.get('states', {}).get((country.id, (state_code or '').lower())) \
+            or self.env['res.country.state'].search([
+                ('country_id', '=', country.id),
+                '|', ('code', '=ilike', state_code), ('name', '=ilike', state_code),
+            ], limit=1)
         if not state:
             state = self.env['res.country.state'].with_context(tracking_disable=True).create({
                 'country_id': country.id,
@@ -715,12 +928,15 @@ class AmazonAccount(models.Model):
         # preferred over updating the personal information with new values because it allows using
         # the correct contact details when invoicing the customer for an earlier order, should there
         # be a change in the personal information.
-        contact = self.env['res.partner'].search([
-            ('type', '=', 'contact'),
-            ('name', '=', buyer_name),
-            ('amazon_email', '=', anonymized_email),
-            '|', ('company_id', '=', False), ('company_id', '=', self.company_id.id),
-        ], limit=1) if anonymized_email else None  # Don't match random partners.
+        contact = (
+            batch_records.get('contacts', {}).get((buyer_name, anonymized_email))
+            or self.env['res.partner'].search([
+                ('type', '=', 'contact'),
+                ('name', '=', buyer_name),
+                ('amazon_email', '=', anonymized_email),
+                '|', ('company_id', '=', False), ('company_id', '=', self.company_id.id),
+            ], limit=1)
+        ) if anonymized_email else None  # Don't match random partners.
         if not contact:
             contact_name = buyer_name or f"Amazon Customer # {amazon_order_ref}"
             contact = self.env['res.partner'].with_context(tracking_disable=True).create({
@@ -740,6 +956,12 @@ class AmazonAccount(models.Model):
             and contact.country_id.id == country.id
             and contact.state_id.id == state.id
         ) else None
+        if not delivery:
+            delivery = next((
+                partner for partner in batch_records.get('deliveries', {}).get((
+                    contact.id, shipping_address_name, street, zip_code, city, country.id, state.id
+                ), []) if not partner.street2 or partner.street2 == street2
+            ), None)
         if not delivery:
             delivery = self.env['res.partner'].search([
                 ('parent_id', '=', contact.id),
@@ -763,7 +985,10 @@ class AmazonAccount(models.Model):
 
         return contact, delivery
 
-    def _prepare_order_lines_values(self, order_data, currency, fiscal_pos, shipping_product):
+    def _prepare_order_lines_values(
+        self, order_data, currency, fiscal_pos, shipping_product, items_data=None,
+        batch_records=None,
+    ):
         """ Prepare the values for the order lines to create based on Amazon data.
 
         Note: self.ensure_one()
@@ -774,28 +999,12 @@ class AmazonAccount(models.Model):
                                   `account.fiscal.position` record.
         :param record shipping_product: The shipping product matching the shipping code, as a
                                         `product.product` record.
+        :param list items_data: The item data of the order. They are pulled if not provided.
+        :param dict batch_records: The records searched for the batch of the order, as returned by
+                                   `_prefetch_orders_records`, if any.
         :return: The order lines values.
         :rtype: dict
         """
-        def pull_items_data(amazon_order_ref_):
-            """ Pull all item data for the order to synchronize.
-
-            :param str amazon_order_ref_: The Amazon reference of the order to synchronize.
-            :return: The items data.
-            :rtype: list
-            """
-            items_data_ = []
-            # Order items are pulled in batches. If more order items than those returned can be
-            # synchronized, the request results are paginated and the next page holds another batch.
-            has_next_page_ = True
-            while has_next_page_:
-                # Pull the next batch of order items.
-                items_batch_data_, has_next_page_ = amazon_utils.pull_batch_data(
-                    self, 'getOrderItems', {}, path_parameter=amazon_order_ref_
-                )
-                items_data_ += items_batch_data_['OrderItems']
-            return items_data_
-
         def convert_to_order_line_values(**kwargs_):
             """ Convert and complete a dict of values to comply with fields of `sale.order.line`.
 
@@ -822,7 +1031,8 @@ class AmazonAccount(models.Model):
         amazon_order_ref = order_data['AmazonOrderId']
         marketplace_api_ref = order_data['MarketplaceId']
 
-        items_data = pull_items_data(amazon_order_ref)
+        if items_data is None:
+            items_data = self._pull_items_data(amazon_order_ref)
 
         order_lines_values = []
         for item_data in items_data:
@@ -831,7 +1041,7 @@ class AmazonAccount(models.Model):
             marketplace = self.active_marketplace_ids.filtered(
                 lambda m: m.api_ref == marketplace_api_ref
             )
-            offer = self._find_or_create_offer(sku, marketplace)
+            offer = self._find_or_create_offer(sku, marketplace, batch_records=batch_records)
             product_taxes = offer.product_id.taxes_id.filtered(
                 lambda t: t.company_id.id == self.company_id.id
             )
@@ -947,7 +1157,7 @@ class AmazonAccount(models.Model):
 
         return order_lines_values
 
-    def _find_or_create_offer(self, sku, marketplace):
+    def _find_or_create_offer(self, sku, marketplace, batch_records=None):
         """ Find or create the amazon offer based on the SKU and marketplace.
 
         Note: self.ensure_one()
@@ -955,18 +1165,23 @@ class AmazonAccount(models.Model):
         :param str sku: The SKU of the product.
         :param recordset marketplace: The marketplace of the offer, as an `amazon.marketplace`
                record.
+        :param dict batch_records: The records searched for the batch of the order, as returned by
+                                   `_prefetch_orders_records`, if any.
         :return: The amazon offer.
         :rtype: record or `amazon.offer`
         """
         self.ensure_one()
 
-        offer = self.offer_ids.filtered(lambda o: o.sku == sku)
+        batch_records = batch_records or {}
+        offer = batch_records.get('offers', {}).get(sku) or self.env['amazon.offer'].search(
+            [('account_id', '=', self.id), ('sku', '=', sku)], limit=1
+        )
         if not offer:
             offer = self.env['amazon.offer'].with_context(tracking_disable=True).create({
                 'account_id': self.id,
                 'marketplace_id': marketplace.id,
                 'product_id': self._find_matching_product(
-                    sku, 'default_product', 'Amazon Sales', 'consu'
+                    sku, 'default_product', 'Amazon Sales', 'consu', batch_records=batch_records
                 ).id,
                 'sku': sku,
             })
@@ -974,10 +1189,12 @@ class AmazonAccount(models.Model):
         # been assigned the current SKU as internal reference and update the offer if so.
         # This trades off a bit of performance in exchange for a more expected behavior for the
         # matching of products if one was assigned the right SKU after that the offer was created.
-        elif 'sale_amazon.default_product' in offer.product_id._get_external_ids().get(
-            offer.product_id.id, []
+        elif offer.product_id == self.env.ref(
+            'sale_amazon.default_product', raise_if_not_found=False
         ):
-            product = self._find_matching_product(sku, '', '', '', fallback=False)
+            product = self._find_matching_product(
+                sku, '', '', '', fallback=False, batch_records=batch_records
+            )
             if product:
                 offer.product_id = product.id
         return offer
@@ -1007,7 +1224,8 @@ class AmazonAccount(models.Model):
         return pricelist
 
     def _find_matching_product(
-        self, internal_reference, default_xmlid, default_name, default_type, fallback=True
+        self, internal_reference, default_xmlid, default_name, default_type, fallback=True,
+        batch_records=None,
     ):
         """ Find the matching product for a given internal reference.
 
@@ -1020,14 +1238,17 @@ class AmazonAccount(models.Model):
         :param str default_type: The product type of the default product to use as fallback.
         :param bool fallback: Whether we should fall back to the default product when no product
                               matching the provided internal reference is found.
+        :param dict batch_records: The records searched for the batch of the order, as returned by
+                                   `_prefetch_orders_records`, if any.
         :return: The matching product.
         :rtype: record of `product.product`
         """
         self.ensure_one()
-        product = self.env['product.product'].search([
-            *self.env['product.product']._check_company_domain(self.company_id),
-            ('default_code', '=', internal_reference),
-        ], limit=1)
+        product = (batch_records or {}).get('products', {}).get(internal_reference) \
+            or self.env['product.product'].search([
+                *self.env['product.product']._check_company_domain(self.company_id),
+                ('default_code', '=', internal_reference),
+            ], limit=1)
         if not product and fallback:  # Fallback to the default product
             product = self.env.ref('sale_amazon.%s' % default_xmlid, raise_if_not_found=False)
         if not product and fallback:  # Restore the default product if it was deleted
@@ -415,6 +415,68 @@ class TestAmazon(common.TestAmazonCommon):
                 msg="The cancellation of orders should be synchronized from Amazon.",
             )
 
+    @mute_logger('odoo.addons.sale_amazon.models.amazon_account')
+    def test_sync_orders_batch(self):
+        """ Test that only the items of the orders to create are pulled when syncing a batch. """
+
+        def get_sp_api_response_mock(_account, operation_, **kwargs_):
+            """ Return a mocked response without making an actual call to the SP-API. """
+            base_response_ = common.OPERATIONS_RESPONSES_MAP[operation_]
+            if operation_ == 'getOrders':
+                return dict(base_response_, payload={
+                    'LastUpdatedBefore': base_response_['payload']['LastUpdatedBefore'],
+                    'Orders': orders_data,
+                })
+            elif operation_ == 'getOrderItems':
+                pulled_order_refs.append(kwargs_['path_parameter'])
+            return base_response_
+
+        with patch(
+                'odoo.addons.sale_amazon.utils.make_proxy_request',
+                return_value=common.AWS_RESPONSE_MOCK,
+        ), patch(
+            'odoo.addons.sale_amazon.utils.make_sp_api_request', new=get_sp_api_response_mock
+        ):
+            self.account.aws_credentials_expiry = '1970-01-01'  # The field is not stored.
+
+            # Sync an order created on Amazon.
+            orders_data = [common.ORDER_MOCK]
+            pulled_order_refs = []
+            self.account._sync_orders(auto_commit=False)
+            self.assertEqual(pulled_order_refs, ['123456789'])
+
+            # Sync the same order, canceled, along with new orders.
+            orders_data = [
+                dict(common.ORDER_MOCK, OrderStatus='Canceled'),
+                dict(common.ORDER_MOCK, AmazonOrderId='123456790'),
+                dict(common.ORDER_MOCK, AmazonOrderId='123456791', OrderStatus='Pending'),
+            ]
+            pulled_order_refs = []
+            self.account._sync_orders(auto_commit=False)
+            self.assertEqual(
+                pulled_order_refs,
+                ['123456790'],
+                msg="Only the items of the orders to create should be pulled.",
+            )
+            orders = self.env['sale.order'].search(
+                [('amazon_order_ref', 'in', ['123456789', '123456790', '123456791'])]
+            )
+            self.assertEqual(
+                {order.amazon_order_ref: order.state for order in orders},
+                {'123456789': 'cancel', '123456790': 'sale'},
+            )
+            first_order, second_order = orders.sorted('amazon_order_ref')
+            self.assertEqual(
+                second_order.partner_id,
+                first_order.partner_id,
+                msg="The partners looked up for the batch should be reused.",
+            )
+            self.assertEqual(
+                second_order.order_line.amazon_offer_id,
+                first_order.order_line.amazon_offer_id,
+                msg="The offers looked up for the batch should be reused.",
+            )
+
     @mute_logger('odoo.addons.sale_amazon.models.amazon_account')
     @mute_logger('odoo.addons.sale_amazon.models.stock_picking')
     def test_sync_orders_cancel_abort(self):
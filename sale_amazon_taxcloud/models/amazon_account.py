@@ -14,9 +14,11 @@ class AmazonAccount(models.Model):
             return super(AmazonAccount, self)._recompute_subtotal(
                 subtotal, tax_amount, taxes, currency)
 
-    def _create_order_from_data(self, order_data):
+    def _create_order_from_data(self, order_data, items_data=None, batch_records=None):
         """ Override to let TaxCloud set the right taxes when creating orders from the SP-API. """
-        order = super()._create_order_from_data(order_data)
+        order = super()._create_order_from_data(
+            order_data, items_data=items_data, batch_records=batch_records
+        )
         if order.fiscal_position_id.is_taxcloud:
             was_locked = order.state == 'done'
             if was_locked:
@@ -537,9 +537,6 @@ class PlanningSlot(models.Model):
     @api.model
     def auto_plan_ids(self, view_domain):
         res = super(PlanningSlot, self).auto_plan_ids(view_domain)
-        if self._context.get('planning_slot_id'):
-            # It means we are looking to assign one shift in particular to an available resource, which we do in planning.
-            return res
         slots_to_assign = self._get_ordered_slots_to_assign(self._get_shifts_to_plan_domain(view_domain))
         start_datetime = max(datetime.strptime(self.env.context.get('default_start_datetime'), DEFAULT_SERVER_DATETIME_FORMAT), fields.Datetime.now().replace(hour=0, minute=0, second=0))
         employee_per_sol = self._get_employee_per_sol_within_period(slots_to_assign, start_datetime, self.env.context.get('default_end_datetime'))
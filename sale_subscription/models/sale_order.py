@@ -13,7 +13,7 @@ from odoo import fields, models, _, api, Command, SUPERUSER_ID, modules
 from odoo.exceptions import UserError, ValidationError
 from odoo.tools.float_utils import float_is_zero
 from odoo.osv import expression
-from odoo.tools import config, format_amount, plaintext2html, split_every, str2bool
+from odoo.tools import config, format_amount, plaintext2html, split_every, str2bool, SQL
 from odoo.tools.date_utils import get_timedelta
 from odoo.tools.misc import format_date
 
@@ -23,6 +23,9 @@ SUBSCRIPTION_DRAFT_STATE = ['1_draft', '2_renewal']
 SUBSCRIPTION_PROGRESS_STATE = ['3_progress', '4_paused']
 SUBSCRIPTION_CLOSED_STATE = ['6_churn', '5_renewed']
 
+# Number of subscriptions invoiced without payment token between two commits of the invoicing cron
+INVOICE_COMMIT_SIZE = 10
+
 SUBSCRIPTION_STATES = [
     ('1_draft', 'Quotation'),  # Quotation for a new subscription
     ('2_renewal', 'Renewal Quotation'),  # Renewal Quotation for existing subscription
@@ -1080,15 +1083,78 @@ class SaleOrder(models.Model):
         }
 
     def _compute_kpi(self):
-        for subscription in self:
-            delta_1month = subscription._get_subscription_delta(fields.Date.today() - relativedelta(months=1))
-            delta_3months = subscription._get_subscription_delta(fields.Date.today() - relativedelta(months=3))
-            subscription.write({
-                'kpi_1month_mrr_delta': delta_1month['delta'],
-                'kpi_1month_mrr_percentage': delta_1month['percentage'],
-                'kpi_3months_mrr_delta': delta_3months['delta'],
-                'kpi_3months_mrr_percentage': delta_3months['percentage'],
-            })
+        """ Updates the MRR KPIs of the subscriptions in a single query, from the last MRR change logged one and three
+        months ago. The automation rules reacting to the modification of the subscriptions (e.g. the subscription
+        alerts) are run on the subscriptions whose KPIs changed, as if they had been written.
+        """
+        if not self:
+            return
+        kpi_fnames = ['kpi_1month_mrr_delta', 'kpi_1month_mrr_percentage', 'kpi_3months_mrr_delta', 'kpi_3months_mrr_percentage']
+        today = fields.Date.today()
+        self.flush_model(['recurring_monthly', *kpi_fnames])
+        self.env['sale.order.log'].flush_model(['order_id', 'event_type', 'event_date', 'recurring_monthly'])
+
+        actions = self.env['base.automation']._get_actions(self, ['on_write', 'on_create_or_write'])
+        pre = {action: action._filter_pre(self.with_env(actions.env)) for action in actions}
+
+        def logged_mrr(date):
+            return SQL(
+                """SELECT order_log.recurring_monthly::float AS mrr
+                     FROM sale_order_log order_log
+                    WHERE order_log.order_id = so.id
+                      AND order_log.event_type IN %s
+                      AND order_log.event_date <= %s
+                 ORDER BY order_log.event_date DESC, order_log.id DESC
+                    LIMIT 1""",
+                ('0_creation', '1_expansion', '15_contraction', '2_transfer'), date,
+            )
+
+        self.env.cr.execute(SQL(
+            """WITH kpi AS (
+                    SELECT so.id,
+                           so.kpi_1month_mrr_delta AS old_1month_delta,
+                           so.kpi_1month_mrr_percentage AS old_1month_percentage,
+                           so.kpi_3months_mrr_delta AS old_3months_delta,
+                           so.kpi_3months_mrr_percentage AS old_3months_percentage,
+                           COALESCE(so.recurring_monthly::float - log_1month.mrr, 0) AS new_1month_delta,
+                           CASE WHEN log_1month.mrr IS NULL THEN 0
+                                WHEN log_1month.mrr = 0 THEN 100
+                                ELSE (so.recurring_monthly::float - log_1month.mrr) / log_1month.mrr
+                           END AS new_1month_percentage,
+                           COALESCE(so.recurring_monthly::float - log_3months.mrr, 0) AS new_3months_delta,
+                           CASE WHEN log_3months.mrr IS NULL THEN 0
+                                WHEN log_3months.mrr = 0 THEN 100
+                                ELSE (so.recurring_monthly::float - log_3months.mrr) / log_3months.mrr
+                           END AS new_3months_percentage
+                      FROM sale_order so
+                 LEFT JOIN LATERAL (%s) log_1month ON TRUE
+                 LEFT JOIN LATERAL (%s) log_3months ON TRUE
+                     WHERE so.id IN %s
+               )
+               UPDATE sale_order so
+                  SET kpi_1month_mrr_delta = kpi.new_1month_delta,
+                      kpi_1month_mrr_percentage = kpi.new_1month_percentage,
+                      kpi_3months_mrr_delta = kpi.new_3months_delta,
+                      kpi_3months_mrr_percentage = kpi.new_3months_percentage
+                 FROM kpi
+                WHERE so.id = kpi.id
+                  AND (so.kpi_1month_mrr_delta, so.kpi_1month_mrr_percentage, so.kpi_3months_mrr_delta, so.kpi_3months_mrr_percentage)
+                      IS DISTINCT FROM (kpi.new_1month_delta, kpi.new_1month_percentage, kpi.new_3months_delta, kpi.new_3months_percentage)
+            RETURNING so.id, kpi.old_1month_delta, kpi.old_1month_percentage, kpi.old_3months_delta, kpi.old_3months_percentage""",
+            logged_mrr(today - relativedelta(months=1)), logged_mrr(today - relativedelta(months=3)), tuple(self.ids),
+        ))
+        old_values = {
+            subscription_id: dict(zip(kpi_fnames, (value or 0.0 for value in old_kpis)))
+            for subscription_id, *old_kpis in self.env.cr.fetchall()
+        }
+        self.invalidate_model(kpi_fnames)
+        if not old_values:
+            return
+
+        for action in actions.with_context(old_values=old_values):
+            records, domain_post = action._filter_post_export_domain(
+                pre[action].filtered(lambda subscription: subscription.id in old_values), feedback=True)
+            action._process(records, domain_post=domain_post)
 
     def _get_portal_return_action(self):
         """ Return the action used to display orders when returning from customer portal. """
@@ -1103,7 +1169,8 @@ class SaleOrder(models.Model):
 
     @api.model
     def _cron_recurring_create_invoice(self):
-        return self._create_recurring_invoice()
+        batch_size = int(self.env['ir.config_parameter'].sudo().get_param('sale_subscription.invoice_batch_size', 30))
+        return self._create_recurring_invoice(batch_size=batch_size)
 
     def _get_invoiceable_lines(self, final=False):
         date_from = fields.Date.today()
@@ -1360,6 +1427,25 @@ class SaleOrder(models.Model):
 
         return all_subscriptions, need_cron_trigger
 
+    def _recurring_invoice_prefetch(self):
+        """ Loads at once the data used to invoice the subscriptions of a cron batch: their lines with their products
+        and taxes, the invoices already linked to them, their fiscal positions and their payment tokens, instead of
+        querying them subscription by subscription.
+        """
+        self.fetch([
+            'order_line', 'payment_token_id', 'fiscal_position_id', 'partner_invoice_id', 'plan_id', 'currency_id',
+            'next_invoice_date', 'start_date', 'end_date', 'subscription_state', 'payment_exception', 'recurring_monthly',
+        ])
+        lines = self.order_line
+        lines.fetch([
+            'display_type', 'state', 'product_id', 'product_uom_qty', 'qty_invoiced', 'qty_to_invoice', 'price_unit',
+            'discount', 'price_subtotal', 'price_total', 'tax_id', 'invoice_lines',
+        ])
+        lines.product_id.product_tmpl_id.fetch(['recurring_invoice', 'taxes_id'])
+        lines.invoice_lines.move_id.fetch(['state', 'move_type'])
+        self.fiscal_position_id.fetch(['tax_ids', 'account_ids'])
+        self.payment_token_id.fetch(['provider_id', 'partner_id'])
+
     def _subscription_commit_cursor(self, auto_commit):
         if auto_commit:
             self.env.cr.commit()
@@ -1368,6 +1454,13 @@ class SaleOrder(models.Model):
         if auto_commit:
             self.env.cr.rollback()
 
+    def _subscription_rollback_invoice(self, auto_commit, savepoint=None):
+        """ Rollback the invoicing of a subscription, only up to its savepoint if it is invoiced in a chunk. """
+        if savepoint:
+            savepoint.rollback()
+        else:
+            self._subscription_rollback_cursor(auto_commit)
+
     # The following function is used so that it can be overwritten in test files
     def _subscription_launch_cron_parallel(self, batch_size):
         self.env.ref('sale_subscription.account_analytic_cron_for_invoice')._trigger()
@@ -1382,8 +1475,10 @@ class SaleOrder(models.Model):
 
         # We mark current batch as having been seen by the cron
         all_invoiceable_lines = self.env['sale.order.line']
+        batch_subscriptions = self.browse([sub_id for subscriptions in all_subscriptions for sub_id in subscriptions.ids]) if grouped_invoice else all_subscriptions
+        batch_subscriptions.is_invoice_cron = True
+        batch_subscriptions._recurring_invoice_prefetch()
         for subscription in all_subscriptions:
-            subscription.is_invoice_cron = True
             # Don't spam sale with assigned emails.
             subscription = subscription.with_context(mail_auto_subscribe_no_notify=True)
             # Close ending subscriptions
@@ -1399,6 +1494,8 @@ class SaleOrder(models.Model):
         # It prevents the use of _compute method and compare the today date and the next_invoice_date in the compute which would be bad for perfs
         all_invoiceable_lines._reset_subscription_qty_to_invoice()
         self._subscription_commit_cursor(auto_commit)
+        # Subscriptions without payment token are invoiced in savepoints and committed by chunks
+        uncommitted_count = 0
         for subscription in all_subscriptions:
             if len(subscription) == 1:
                 subscription = subscription[0]  # Trick to not prefetch other subscriptions is all_subscription is recordset, as the cache is currently invalidated at each iteration
@@ -1408,8 +1505,16 @@ class SaleOrder(models.Model):
             subscription = subscription.filtered(lambda sub: sub.subscription_state == '3_progress' and not sub.payment_exception)
             if not subscription:
                 continue
-            try:
+            savepoint = None
+            has_payment_token = bool(subscription.mapped('payment_token_id'))
+            if has_payment_token or uncommitted_count >= INVOICE_COMMIT_SIZE:
                 self._subscription_commit_cursor(auto_commit)  # To avoid a rollback in case something is wrong, we create the invoices one by one
+                uncommitted_count = 0
+            if auto_commit and not has_payment_token:
+                # The payment of the other subscriptions is committed as soon as it is done: no payment is made here
+                savepoint = self.env.cr.savepoint()
+                uncommitted_count += 1
+            try:
                 draft_invoices = subscription.invoice_ids.filtered(lambda am: am.state == 'draft')
                 if subscription.payment_token_id and draft_invoices:
                     draft_invoices.button_cancel()
@@ -1446,7 +1551,7 @@ class SaleOrder(models.Model):
                     if not auto_commit and isinstance(e, TransactionRollbackError):
                         raise
                     # we suppose that the payment is run only once a day
-                    self._subscription_rollback_cursor(auto_commit)
+                    self._subscription_rollback_invoice(auto_commit, savepoint)
                     for sub in subscription:
                         email_context = sub._get_subscription_mail_payment_context()
                         error_message = _("Error during renewal of contract %s (Payment not recorded)", sub.name)
@@ -1457,7 +1562,8 @@ class SaleOrder(models.Model):
                              'email_to': email_context['responsible_email'], 'auto_delete': True})
                         mail.send()
                     continue
-                self._subscription_commit_cursor(auto_commit)
+                if not savepoint:
+                    self._subscription_commit_cursor(auto_commit)
                 # Handle automatic payment or invoice posting
 
                 existing_invoices = subscription.with_context(recurring_automatic=True)._handle_automatic_invoices(invoice, auto_commit) or self.env['account.move']
@@ -1468,7 +1574,10 @@ class SaleOrder(models.Model):
             except Exception:
                 name_list = [f"{sub.name} {sub.client_order_ref}" for sub in subscription]
                 _logger.exception("Error during renewal of contract %s", "; ".join(name_list))
-                self._subscription_rollback_cursor(auto_commit)
+                self._subscription_rollback_invoice(auto_commit, savepoint)
+            finally:
+                if savepoint:
+                    savepoint.close()
         self._subscription_commit_cursor(auto_commit)
         self._process_invoices_to_send(self.env['account.move'].browse(move_to_send_ids))
         # There is still some subscriptions to process. Then, make sure the CRON will be triggered again asap.
@@ -681,6 +681,15 @@ class TestSubscription(TestSubscriptionCommon):
         self.assertEqual(self.subscription.kpi_3months_mrr_percentage, 0.5)
         self.assertEqual(self.subscription.health, 'done')
 
+        # The KPIs computed for several subscriptions at once are the same as one by one
+        subscriptions = self.subscription | self.subscription.copy()
+        subscriptions._compute_kpi()
+        for subscription in subscriptions:
+            for months, kpi_prefix in ((1, 'kpi_1month'), (3, 'kpi_3months')):
+                delta = subscription._get_subscription_delta(datetime.date.today() - relativedelta(months=months))
+                self.assertEqual(subscription[f'{kpi_prefix}_mrr_delta'], delta['delta'] or 0.0)
+                self.assertEqual(subscription[f'{kpi_prefix}_mrr_percentage'], delta['percentage'] or 0.0)
+
     def test_onchange_date_start(self):
         recurring_bound_tmpl = self.env['sale.order.template'].create({
             'name': 'Recurring Bound Template',
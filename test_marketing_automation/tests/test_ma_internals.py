@@ -104,6 +104,36 @@ class MarketingCampaignTest(TestMACommon):
         self.assertEqual(campaign2.total_participant_count, 2)
         self.assertEqual(campaign2.test_participant_count, 2)
 
+    @users('user_markauto')
+    @mute_logger('odoo.addons.base.ir.ir_model', 'odoo.models')
+    def test_internals_sync_participants(self):
+        """ Only records without participant are added, participants whose record does
+        not match the domain anymore are unlinked. """
+        test_records = self.test_records[:4]
+        campaign = self.env['marketing.campaign'].create({
+            'name': 'My First Campaign',
+            'model_id': self.env['ir.model']._get('marketing.test.sms').id,
+            'domain': '%s' % [('id', 'in', test_records[:3].ids)],
+        })
+        self._create_activity(campaign, mailing=self._create_mailing())
+
+        campaign.action_start_campaign()
+        campaign.sync_participants()
+        self.assertEqual(campaign.participant_ids.mapped('res_id'), test_records[:3].ids)
+
+        campaign.write({'domain': '%s' % [('id', 'in', test_records[1:].ids)]})
+        campaign.sync_participants()
+        self.assertEqual(len(campaign.participant_ids), 4)
+        self.assertEqual(campaign.running_participant_count, 3)
+        self.assertEqual(
+            campaign.participant_ids.filtered(lambda p: p.state == 'running').mapped('res_id'),
+            test_records[1:].ids,
+        )
+        self.assertEqual(
+            campaign.participant_ids.filtered(lambda p: p.state == 'unlinked').mapped('res_id'),
+            test_records[0].ids,
+        )
+
     @users('user_markauto')
     @mute_logger('odoo.addons.base.ir.ir_model', 'odoo.models')
     def test_internals_unique_field(self):
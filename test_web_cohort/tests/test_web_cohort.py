@@ -273,3 +273,47 @@ class TestCohortEmpty(TestCohortCommon):
         result = self.WebCohortSimpleModel.get_cohort_data("datetime_start", "datetime_stop",
             'revenue', 'day', [], 'retention', 'backward')['rows']
         self.assertEqual(result, [])
+
+
+class TestCohortData(TestCohortCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.records = cls.WebCohortSimpleModel.create([
+            {'name': 'A', 'date_start': datetime.date(2020, 1, 5), 'date_stop': datetime.date(2020, 2, 10)},
+            {'name': 'B', 'date_start': datetime.date(2020, 1, 20), 'date_stop': False},
+            {'name': 'C', 'date_start': datetime.date(2020, 2, 3), 'date_stop': datetime.date(2020, 2, 25)},
+            {'name': 'D', 'date_start': datetime.date(2020, 3, 1), 'date_stop': datetime.date(2020, 5, 1)},
+        ])
+
+    def _get_cohort_data(self, records, timeline='forward'):
+        return self.WebCohortSimpleModel.get_cohort_data(
+            'date_start', 'date_stop', '__count', 'month', [('id', 'in', records.ids)], 'retention', timeline,
+        )
+
+    def test_cohort_data_forward(self):
+        rows = self._get_cohort_data(self.records)['rows']
+        self.assertEqual([row['value'] for row in rows], [2, 1, 1])
+        self.assertEqual([column['value'] for column in rows[0]['columns'][:3]], [2, 1, 1])
+        self.assertEqual([column['percentage'] for column in rows[0]['columns'][:3]], [100.0, 50.0, 50.0])
+        self.assertEqual([column['value'] for column in rows[1]['columns'][:2]], [0, 0])
+        self.assertEqual([column['value'] for column in rows[2]['columns'][:3]], [1, 1, 0])
+        for row in rows:
+            self.assertIn(('id', 'in', self.records.ids), row['domain'])
+
+    def test_cohort_data_backward(self):
+        rows = self._get_cohort_data(self.records, timeline='backward')['rows']
+        self.assertEqual([column['value'] for column in rows[0]['columns'][-3:]], [2, 2, 2])
+        self.assertEqual(rows[0]['columns'][-1]['churn_value'], 0)
+        self.assertEqual([column['value'] for column in rows[1]['columns'][-1:]], [0])
+
+    def test_cohort_data_query_count(self):
+        """ The number of queries doesn't depend on the number of rows """
+        def count_queries(records):
+            self.env.invalidate_all()
+            sql_count = self.env.cr.sql_log_count
+            self._get_cohort_data(records, timeline='backward')
+            return self.env.cr.sql_log_count - sql_count
+
+        self.assertEqual(count_queries(self.records[:1]), count_queries(self.records))
@@ -66,21 +66,26 @@ class Base(models.AbstractModel):
             today = date.today()
             convert_method = fields.Date.to_date
 
+        # The cells of all the rows are read at once, grouped by (date_start, date_stop) periods.
+        cell_groups = self._read_group(
+            domain=domain,
+            groupby=[date_start + ':' + interval, date_stop + ':' + interval],
+            aggregates=[measure],
+        )
+        sub_group_per_row = defaultdict(dict)
+        for row_group_value, stop_group_value, aggregate_value in cell_groups:
+            sub_group_per_row[row_group_value][convert_method(stop_group_value)] = aggregate_value
+
+        # The aggregate of a set of records can be computed from the aggregates of its subsets.
+        is_additive_measure = measure == '__count' or measure.endswith(':sum')
+
         for group_value, value in row_groups:
             total_value += value
             group_domain = expression.AND([
                 domain,
                 ['&', (date_start, '>=', group_value), (date_start, '<', group_value + models.READ_GROUP_TIME_GRANULARITY[interval])]
             ])
-            sub_group = self._read_group(
-                domain=group_domain,
-                groupby=[date_stop + ':' + interval],
-                aggregates=[measure],
-            )
-            sub_group_per_period = {
-                convert_method(group_value): aggregate_value
-                for group_value, aggregate_value in sub_group
-            }
+            sub_group_per_period = sub_group_per_row[group_value]
 
             columns = []
             initial_value = value
@@ -114,20 +119,27 @@ class Base(models.AbstractModel):
                 # In backward timeline, if columns are out of given range, we need
                 # to set initial value for calculating correct percentage
                 if timeline == 'backward' and col_index == 0:
-                    outside_timeline_domain = expression.AND(
-                        [
-                            group_domain,
-                            ['|',
-                                (date_stop, '=', False),
-                                (date_stop, '>=', fields.Datetime.to_string(col_start_date)),
+                    if is_additive_measure:
+                        initial_value = float(sum(
+                            aggregate_value
+                            for period, aggregate_value in sub_group_per_period.items()
+                            if period is None or period >= col_start_date
+                        ))
+                    else:
+                        outside_timeline_domain = expression.AND(
+                            [
+                                group_domain,
+                                ['|',
+                                    (date_stop, '=', False),
+                                    (date_stop, '>=', fields.Datetime.to_string(col_start_date)),
+                                ]
                             ]
-                        ]
-                    )
-                    col_group = self._read_group(
-                        domain=outside_timeline_domain,
-                        aggregates=[measure],
-                    )
-                    initial_value = float(col_group[0][0])
+                        )
+                        col_group = self._read_group(
+                            domain=outside_timeline_domain,
+                            aggregates=[measure],
+                        )
+                        initial_value = float(col_group[0][0])
                     initial_churn_value = value - initial_value
 
                 previous_col_remaining_value = initial_value if col_index == 0 else columns[-1]['value']
@@ -147,11 +159,11 @@ class Base(models.AbstractModel):
                     period = col_start_date.strftime(DISPLAY_FORMATS[interval])
 
                 if mode == 'churn':
-                    domain = [
+                    col_domain = [
                         (date_stop, '<', col_end_date.strftime(DEFAULT_SERVER_DATE_FORMAT)),
                     ]
                 else:
-                    domain = ['|',
+                    col_domain = ['|',
                         (date_stop, '>=', col_end_date.strftime(DEFAULT_SERVER_DATE_FORMAT)),
                         (date_stop, '=', False),
                     ]
@@ -160,7 +172,7 @@ class Base(models.AbstractModel):
                     'value': col_remaining_value,
                     'churn_value': col_value + (columns[-1]['churn_value'] if col_index > 0 else initial_churn_value),
                     'percentage': percentage,
-                    'domain': domain,
+                    'domain': col_domain,
                     'period': period,
                 })
 
@@ -3,8 +3,11 @@
 import re
 import logging
 import markupsafe
+import threading
 from markupsafe import Markup
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import timedelta
 
 from odoo import models, fields, api, _, Command
@@ -13,7 +16,7 @@ from odoo.addons.whatsapp.tools.retryable_codes import WHATSAPP_RETRYABLE_ERROR_
 from odoo.addons.whatsapp.tools.whatsapp_api import WhatsAppApi
 from odoo.addons.whatsapp.tools.whatsapp_exception import WhatsAppError
 from odoo.exceptions import ValidationError, UserError
-from odoo.tools import groupby, html2plaintext
+from odoo.tools import groupby, html2plaintext, split_every
 
 _logger = logging.getLogger(__name__)
 
@@ -37,6 +40,8 @@ class WhatsAppMessage(models.Model):
     # amount of days during which a message is considered active
     # used for GC and for finding an active document channel using a recent whatsapp template message
     _ACTIVE_THRESHOLD_DAYS = 15
+    # amount of messages prepared, sent concurrently then committed together by _send_message
+    _SEND_BATCH_SIZE = 100
 
     mobile_number = fields.Char(string="Sent To")
     mobile_number_formatted = fields.Char(compute="_compute_mobile_number_formatted", store=True)
@@ -197,7 +202,13 @@ class WhatsAppMessage(models.Model):
             self.env.ref('whatsapp.ir_cron_send_whatsapp_queue')._trigger()
 
     def _send_message(self, with_commit=False):
-        """ Prepare json data for sending messages, attachments and templates."""
+        """ Prepare json data for sending messages, attachments and templates.
+
+        Messages are prepared by chunks of _SEND_BATCH_SIZE whose requests are sent
+        concurrently (see ``_send_to_whatsapp``), by the same threads for all chunks.
+        When with_commit is set, each sent message is committed as soon as its request
+        completes, so that a failure in the rest of the chunk never rolls back, then
+        resends, a delivered message. """
         # init api
         message_to_api = {}
         for account, messages in groupby(self, lambda msg: msg.wa_account_id):
@@ -214,79 +225,188 @@ class WhatsAppMessage(models.Model):
             for message in messages:
                 message_to_api[message] = wa_api
 
-        for whatsapp_message in self:
-            wa_api = message_to_api[whatsapp_message]
-            whatsapp_message = whatsapp_message.with_user(whatsapp_message.create_uid)
-            if whatsapp_message.state != 'outgoing':
-                _logger.info("Message state in %s state so it will not sent.", whatsapp_message.state)
-                continue
-            msg_uid = False
-            try:
-                parent_message_id = False
-                body = whatsapp_message.body
-                if isinstance(body, markupsafe.Markup):
-                    # If Body is in html format so we need to remove html tags before sending message.
-                    body = body.striptags()
-                number = whatsapp_message.mobile_number_formatted
-                if not number:
-                    raise WhatsAppError(failure_type='phone_invalid')
-                if self.env['phone.blacklist'].sudo().search([('number', 'ilike', number)]):
-                    raise WhatsAppError(failure_type='blacklisted')
-                if whatsapp_message.wa_template_id:
-                    message_type = 'template'
-                    if whatsapp_message.wa_template_id.status != 'approved' or whatsapp_message.wa_template_id.quality in ('red', 'yellow'):
-                        raise WhatsAppError(failure_type='template')
-                    whatsapp_message.message_type = 'outbound'
-                    if whatsapp_message.mail_message_id.model != whatsapp_message.wa_template_id.model:
-                        raise WhatsAppError(failure_type='template')
-
-                    RecordModel = self.env[whatsapp_message.mail_message_id.model].with_user(whatsapp_message.create_uid)
-                    from_record = RecordModel.browse(whatsapp_message.mail_message_id.res_id)
-                    send_vals, attachment = whatsapp_message.wa_template_id._get_send_template_vals(
-                        record=from_record, free_text_json=whatsapp_message.free_text_json,
-                        attachment=whatsapp_message.mail_message_id.attachment_ids)
-                    if attachment:
-                        # If retrying message then we need to remove previous attachment and add new attachment.
-                        if whatsapp_message.mail_message_id.attachment_ids and whatsapp_message.wa_template_id.header_type == 'document' and whatsapp_message.wa_template_id.report_id:
-                            whatsapp_message.mail_message_id.attachment_ids.unlink()
-                        if attachment not in whatsapp_message.mail_message_id.attachment_ids:
-                            whatsapp_message.mail_message_id.attachment_ids = [Command.link(attachment.id)]
-                elif whatsapp_message.mail_message_id.attachment_ids:
-                    attachment_vals = whatsapp_message._prepare_attachment_vals(whatsapp_message.mail_message_id.attachment_ids[0], wa_account_id=whatsapp_message.wa_account_id)
-                    message_type = attachment_vals.get('type')
-                    send_vals = attachment_vals.get(message_type)
-                    if whatsapp_message.body:
-                        send_vals['caption'] = body
-                else:
-                    message_type = 'text'
-                    send_vals = {
-                        'preview_url': True,
-                        'body': body,
-                    }
-                # Tagging parent message id if parent message is available
-                if whatsapp_message.mail_message_id and whatsapp_message.mail_message_id.parent_id:
-                    parent_id = whatsapp_message.mail_message_id.parent_id.wa_message_ids
-                    if parent_id:
-                        parent_message_id = parent_id[0].msg_uid
-                msg_uid = wa_api._send_whatsapp(number=number, message_type=message_type, send_vals=send_vals, parent_message_id=parent_message_id)
-            except WhatsAppError as we:
-                whatsapp_message._handle_error(whatsapp_error_code=we.error_code, error_message=we.error_message,
-                                               failure_type=we.failure_type)
-            except (UserError, ValidationError) as e:
-                whatsapp_message._handle_error(failure_type='unknown', error_message=str(e))
-            else:
-                if not msg_uid:
-                    whatsapp_message._handle_error(failure_type='unknown')
-                else:
-                    if message_type == 'template':
-                        whatsapp_message._post_message_in_active_channel()
-                    whatsapp_message.write({
-                        'state': 'sent',
-                        'msg_uid': msg_uid
-                    })
+        blacklisted_numbers = self._get_blacklisted_numbers()
+        with self._get_send_executor(len(self)) as executor:
+            for messages_batch in split_every(self._SEND_BATCH_SIZE, self.ids, self.browse):
+                to_send = []
+                for whatsapp_message in messages_batch:
+                    wa_api = message_to_api[whatsapp_message]
+                    whatsapp_message = whatsapp_message.with_user(whatsapp_message.create_uid)
+                    if whatsapp_message.state != 'outgoing':
+                        _logger.info("Message state in %s state so it will not sent.", whatsapp_message.state)
+                        continue
+                    try:
+                        send_values = whatsapp_message._prepare_send_values(blacklisted_numbers)
+                    except WhatsAppError as we:
+                        whatsapp_message._handle_error(whatsapp_error_code=we.error_code, error_message=we.error_message,
+                                                       failure_type=we.failure_type)
+                    except (UserError, ValidationError) as e:
+                        whatsapp_message._handle_error(failure_type='unknown', error_message=str(e))
+                    else:
+                        to_send.append((whatsapp_message, wa_api, send_values))
+
+                requests_values = [(wa_api, send_values) for dummy, wa_api, send_values in to_send]
+                for index, msg_uid, we in self._send_to_whatsapp(requests_values, executor=executor):
+                    whatsapp_message, dummy, send_values = to_send[index]
+                    if we:
+                        whatsapp_message._handle_error(whatsapp_error_code=we.error_code, error_message=we.error_message,
+                                                       failure_type=we.failure_type)
+                    elif not msg_uid:
+                        whatsapp_message._handle_error(failure_type='unknown')
+                    else:
+                        whatsapp_message.write({
+                            'state': 'sent',
+                            'msg_uid': msg_uid
+                        })
+                        if with_commit:
+                            # the message is delivered: never let a later failure send it again
+                            self._cr.commit()
+                        if send_values['message_type'] == 'template':
+                            whatsapp_message._post_message_in_active_channel()
                 if with_commit:
                     self._cr.commit()
 
+    def _get_blacklisted_numbers(self):
+        """ Returns the formatted numbers of the messages which are blacklisted, fetched at once. """
+        numbers = set(filter(None, self.mapped('mobile_number_formatted')))
+        if not numbers:
+            return set()
+        # blacklisted numbers are stored sanitized, with the leading '+' that formatted numbers do not have
+        blacklist = self.env['phone.blacklist'].sudo().search_fetch(
+            [('number', 'in', [f'+{number}' for number in numbers] + list(numbers))], ['number'])
+        return {number.lstrip('+') for number in blacklist.mapped('number')}
+
+    def _prepare_send_values(self, blacklisted_numbers):
+        """ Returns the arguments of ``WhatsAppApi._send_whatsapp`` to send the message.
+
+        :param set blacklisted_numbers: blacklisted formatted numbers (see ``_get_blacklisted_numbers``)
+        :raise WhatsAppError: if the message cannot be sent
+        """
+        self.ensure_one()
+        parent_message_id = False
+        body = self.body
+        if isinstance(body, markupsafe.Markup):
+            # If Body is in html format so we need to remove html tags before sending message.
+            body = body.striptags()
+        number = self.mobile_number_formatted
+        if not number:
+            raise WhatsAppError(failure_type='phone_invalid')
+        if number in blacklisted_numbers:
+            raise WhatsAppError(failure_type='blacklisted')
+        if self.wa_template_id:
+            message_type = 'template'
+            if self.wa_template_id.status != 'approved' or self.wa_template_id.quality in ('red', 'yellow'):
+                raise WhatsAppError(failure_type='template')
+            self.message_type = 'outbound'
+            if self.mail_message_id.model != self.wa_template_id.model:
+                raise WhatsAppError(failure_type='template')
+
+            RecordModel = self.env[self.mail_message_id.model].with_user(self.create_uid)
+            from_record = RecordModel.browse(self.mail_message_id.res_id)
+            send_vals, attachment = self.wa_template_id._get_send_template_vals(
+                record=from_record, free_text_json=self.free_text_json,
+                attachment=self.mail_message_id.attachment_ids)
+            if attachment:
+                # If retrying message then we need to remove previous attachment and add new attachment.
+                if self.mail_message_id.attachment_ids and self.wa_template_id.header_type == 'document' and self.wa_template_id.report_id:
+                    self.mail_message_id.attachment_ids.unlink()
+                if attachment not in self.mail_message_id.attachment_ids:
+                    self.mail_message_id.attachment_ids = [Command.link(attachment.id)]
+        elif self.mail_message_id.attachment_ids:
+            attachment_vals = self._prepare_attachment_vals(self.mail_message_id.attachment_ids[0], wa_account_id=self.wa_account_id)
+            message_type = attachment_vals.get('type')
+            send_vals = attachment_vals.get(message_type)
+            if self.body:
+                send_vals['caption'] = body
+        else:
+            message_type = 'text'
+            send_vals = {
+                'preview_url': True,
+                'body': body,
+            }
+        # Tagging parent message id if parent message is available
+        if self.mail_message_id and self.mail_message_id.parent_id:
+            parent_id = self.mail_message_id.parent_id.wa_message_ids
+            if parent_id:
+                parent_message_id = parent_id[0].msg_uid
+        return {
+            'number': number,
+            'message_type': message_type,
+            'send_vals': send_vals,
+            'parent_message_id': parent_message_id,
+        }
+
+    @contextmanager
+    def _get_send_executor(self, requests_count):
+        """ Context manager returning the executor running the requests of ``_send_to_whatsapp``
+        in up to ``whatsapp.send_concurrency`` threads (8 by default), or None to send them from
+        the current thread. Pending requests are cancelled when leaving the context. """
+        max_workers = min(int(self.env['ir.config_parameter'].sudo().get_param('whatsapp.send_concurrency', 8)), requests_count)
+        if max_workers <= 1:
+            yield None
+            return
+
+        # requests are disabled in tests, the worker threads must know they are testing as well
+        testing = getattr(threading.current_thread(), 'testing', False)
+
+        def init_worker():
+            threading.current_thread().testing = testing
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, initializer=init_worker)
+        try:
+            yield executor
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    @api.model
+    def _send_to_whatsapp(self, requests_values, executor=None):
+        """ Sends prepared messages to WhatsApp, concurrently when an executor is given (see
+        ``_get_send_executor``).
+
+        Each account sends at most ``whatsapp.send_rate_limit`` messages per second (80 by default,
+        the throughput of the Cloud API). The limit is shared by all the sends of the worker process
+        with the account, but each worker process enforces it on its own: lower the parameter when
+        several workers send messages with the same account at the same time. Threads only do the
+        HTTP requests: they never use the environment, whose cursor is not thread-safe.
+
+        :param list requests_values: list of (WhatsAppApi, values of ``_prepare_send_values``)
+        :param executor: ThreadPoolExecutor running the requests, or None to send them one by one
+        :return: generator of (index in requests_values, msg_uid, WhatsAppError or False),
+            yielded in the calling thread as soon as each request completes
+        """
+        if not requests_values:
+            return
+        rate_limit = float(self.env['ir.config_parameter'].sudo().get_param('whatsapp.send_rate_limit', 80))
+        throttles = {}
+        for wa_api, dummy in requests_values:
+            if wa_api not in throttles:
+                wa_api._check_credentials()
+                throttles[wa_api] = wa_api._get_throttle(rate_limit)
+
+        def send(wa_api, send_values):
+            throttles[wa_api].wait()
+            try:
+                return wa_api._send_whatsapp(**send_values), False
+            except WhatsAppError as we:
+                return False, we
+
+        if len(requests_values) == 1 or executor is None:
+            for index, (wa_api, send_values) in enumerate(requests_values):
+                yield index, *send(wa_api, send_values)
+            return
+
+        futures = {
+            executor.submit(send, wa_api, send_values): index
+            for index, (wa_api, send_values) in enumerate(requests_values)
+        }
+        try:
+            for future in as_completed(futures):
+                yield futures[future], *future.result()
+        finally:
+            # if the caller fails, do not send the requests that did not start yet
+            for future in futures:
+                future.cancel()
+
     def _handle_error(self, failure_type=False, whatsapp_error_code=False, error_message=False):
         """ Format and write errors on the message. """
         self.ensure_one()
@@ -2,6 +2,7 @@
 
 import hashlib
 import hmac
+import itertools
 import json
 import time
 
@@ -24,6 +25,7 @@ class MockOutgoingWhatsApp(common.BaseCase):
     def mockWhatsappGateway(self):
         self._init_wa_mock()
         wa_msg_origin = WhatsAppMessage.create
+        msg_counter = itertools.count()
 
         # ------------------------------------------------------------
         # Whatsapp API
@@ -40,7 +42,8 @@ class MockOutgoingWhatsApp(common.BaseCase):
 
         def _send_whatsapp(number, *, send_vals, **kwargs):
             if send_vals:
-                msg_uid = f'test_wa_{time.time():.9f}'
+                # messages may be sent concurrently, the counter keeps their uid unique
+                msg_uid = f'test_wa_{time.time():.9f}_{next(msg_counter)}'
                 self._wa_msg_sent.append(msg_uid)
                 return msg_uid
             raise WhatsAppError("Please make sure to define a template before proceeding.")
@@ -4,6 +4,7 @@ from datetime import datetime
 from freezegun import freeze_time
 
 from odoo.addons.whatsapp.tests.common import WhatsAppCommon
+from odoo.addons.whatsapp.tools.whatsapp_api import WhatsAppApi
 from odoo.tests import tagged
 
 
@@ -53,3 +54,38 @@ class WhatsAppMessage(WhatsAppCommon):
             set((old_failed_message + old_queued_message + recent_sent_message +
              recent_received_message + recent_failed_message).ids)
         )
+
+    def test_send_messages_batch(self):
+        """ Messages are sent concurrently, blacklisted numbers being checked for the whole batch. """
+        self.env['ir.config_parameter'].sudo().set_param('whatsapp.send_concurrency', 4)
+        self.env['phone.blacklist'].sudo().add('+91 12345 67893')
+        numbers = [f'+91 12345 6789{digit}' for digit in range(1, 9)]
+        mail_messages = self.env['mail.message'].create([{
+            'body': f'Hello {number}',
+            'message_type': 'whatsapp_message',
+            'model': 'res.partner',
+            'res_id': self.whatsapp_customer.id,
+        } for number in numbers])
+        messages = self.env['whatsapp.message'].create([{
+            'mail_message_id': mail_message.id,
+            'mobile_number': number,
+            'wa_account_id': self.whatsapp_account.id,
+        } for mail_message, number in zip(mail_messages, numbers)])
+        blacklisted_message = messages[2]
+
+        with self.mockWhatsappGateway():
+            messages._send_message()
+
+        self.assertEqual(blacklisted_message.state, 'error')
+        self.assertEqual(blacklisted_message.failure_type, 'blacklisted')
+        sent_messages = messages - blacklisted_message
+        self.assertEqual(set(sent_messages.mapped('state')), {'sent'})
+        self.assertEqual(len(self._wa_msg_sent), 7)
+        self.assertEqual(set(sent_messages.mapped('msg_uid')), set(self._wa_msg_sent))
+
+    def test_send_throttle_shared(self):
+        """ The throttle of an account is shared by all the sends of the worker, whatever the chunk. """
+        throttle = WhatsAppApi(self.whatsapp_account)._get_throttle(10)
+        self.assertIs(WhatsAppApi(self.whatsapp_account)._get_throttle(20), throttle)
+        other_account = self.whatsapp_account.copy({'phone_uid': 'other_phone_uid'})
+        self.assertIsNot(WhatsAppApi(other_account)._get_throttle(20), throttle)
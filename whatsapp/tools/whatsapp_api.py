@@ -3,8 +3,11 @@
 import logging
 import requests
 import threading
+import time
 import json
 
+from requests.adapters import HTTPAdapter
+
 from odoo import _
 from odoo.exceptions import RedirectWarning
 from odoo.addons.whatsapp.tools.whatsapp_exception import WhatsAppError
@@ -12,14 +15,80 @@ from odoo.addons.whatsapp.tools.whatsapp_exception import WhatsAppError
 _logger = logging.getLogger(__name__)
 
 DEFAULT_ENDPOINT = "https://graph.facebook.com/v17.0"
+SESSION_POOL_SIZE = 16  # connections kept alive per account
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_throttles = {}
+_throttles_lock = threading.Lock()
+
+
+def _get_session(key):
+    """ Returns the HTTP session of an account, shared by the threads of the worker so that
+    its connections to WhatsApp are kept alive and reused between requests. """
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=SESSION_POOL_SIZE))
+        return session
+
+
+def _get_throttle(key, rate):
+    """ Returns the request throttle of an account, shared by the threads of the worker so that
+    all the messages sent by the worker with the account respect its rate limit. The throttle
+    only spaces out the requests of one worker: each worker process has its own. """
+    with _throttles_lock:
+        throttle = _throttles.get(key)
+        if throttle is None:
+            throttle = _throttles[key] = RequestThrottle(rate)
+        else:
+            throttle.set_rate(rate)
+        return throttle
+
+
+class RequestThrottle:
+    """ Spaces the requests of concurrent threads out to send at most ``rate`` of them per second. """
+
+    def __init__(self, rate):
+        self.next_slot = 0
+        self.lock = threading.Lock()
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        self.interval = 1 / rate if rate > 0 else 0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class WhatsAppApi:
     def __init__(self, wa_account_id):
         wa_account_id.ensure_one()
         self.wa_account_id = wa_account_id
+        # read here as the messages may be sent from other threads, which cannot use the cursor
+        self.wa_account_name = wa_account_id.name
         self.phone_uid = wa_account_id.phone_uid
         self.token = wa_account_id.sudo().token
         self.is_shared_account = False
+        self.account_key = (wa_account_id.env.cr.dbname, wa_account_id.id)
+        self.session = _get_session(self.account_key)
+
+    def _get_throttle(self, rate):
+        """ Returns the throttle of the account for this worker, see ``_get_throttle``. """
+        return _get_throttle(self.account_key, rate)
+
+    def _check_credentials(self):
+        if not all([self.token, self.phone_uid]):
+            action = self.wa_account_id.env.ref('whatsapp.whatsapp_account_action')
+            raise RedirectWarning(_("To use WhatsApp Configure it first"), action=action.id, button_text=_("Configure Whatsapp Business Account"))
 
     def __api_requests(self, request_type, url, auth_type="", params=False, headers=None, data=False, files=False, endpoint_include=False):
         if getattr(threading.current_thread(), 'testing', False):
@@ -27,9 +96,7 @@ class WhatsAppApi:
 
         headers = headers or {}
         params = params or {}
-        if not all([self.token, self.phone_uid]):
-            action = self.wa_account_id.env.ref('whatsapp.whatsapp_account_action')
-            raise RedirectWarning(_("To use WhatsApp Configure it first"), action=action.id, button_text=_("Configure Whatsapp Business Account"))
+        self._check_credentials()
         if auth_type == 'oauth':
             headers.update({'Authorization': f'OAuth {self.token}'})
         if auth_type == 'bearer':
@@ -37,7 +104,7 @@ class WhatsAppApi:
         call_url = (DEFAULT_ENDPOINT + url) if not endpoint_include else url
 
         try:
-            res = requests.request(request_type, call_url, params=params, headers=headers, data=data, files=files, timeout=10)
+            res = self.session.request(request_type, call_url, params=params, headers=headers, data=data, files=files, timeout=10)
         except requests.exceptions.RequestException:
             raise WhatsAppError(failure_type='network')
 
@@ -176,7 +243,7 @@ class WhatsAppApi:
                 message_type: send_vals
             })
         json_data = json.dumps(data)
-        _logger.info("Send %s message from account %s [%s]", message_type, self.wa_account_id.name, self.wa_account_id.id)
+        _logger.info("Send %s message from account %s [%s]", message_type, self.wa_account_name, self.wa_account_id.id)
         response = self.__api_requests(
             "POST",
             f"/{self.phone_uid}/messages",